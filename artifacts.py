@@ -0,0 +1,110 @@
+import gzip
+import hashlib
+import json
+import os
+
+try:
+    import brotli
+except ImportError:  # 選用：沒有安裝時只輸出 .gz
+    brotli = None
+
+# Content-Encoding -> 預先壓縮檔的副檔名 (最高壓縮等級；gzip mtime=0 讓同內容輸出相同位元組)
+ENCODINGS = {"gzip": ".gz", "br": ".br"}
+
+
+def digest(data):
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_digest(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(64 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def etag(sha256):
+    """
+    由未壓縮內容的 SHA-256 產生弱 ETag：.gz / .br 與原檔是同一份內容，ETag 相同，
+    頁面也能事先算出 data.json 的 ETag (第一次輪詢就能得到 304)。
+    """
+    return f'W/"{sha256[:20]}"'
+
+
+def write_if_changed(path, data):
+    """
+    輸出檔內容 (str 以 UTF-8 編碼) 與現有檔案的雜湊相同時不寫入；
+    否則先寫暫存檔再取代 (伺服器不會讀到寫一半的檔案)。回傳是否有寫入。
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    if os.path.exists(path) and os.path.getsize(path) == len(data) and file_digest(path) == digest(data):
+        return False
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def compress(data, encoding):
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    if encoding == "br" and brotli is not None:
+        return brotli.compress(data, quality=11)
+    return None
+
+
+def sibling_paths(path):
+    return [path + ext for ext in ENCODINGS.values()]
+
+
+def publish(path, data):
+    """
+    write_if_changed 並同時輸出預先壓縮的 .gz / .br，讓靜態伺服器直接送出壓縮後的位元組。
+    原檔未變且壓縮檔已存在時不重新壓縮。回傳原檔是否有寫入。
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    changed = write_if_changed(path, data)
+    for encoding, ext in ENCODINGS.items():
+        if changed or not os.path.exists(path + ext):
+            compressed = compress(data, encoding)
+            if compressed is not None:
+                write_if_changed(path + ext, compressed)
+            elif os.path.exists(path + ext):
+                os.remove(path + ext)  # 不能再產生的舊壓縮檔會與原檔內容不符
+    return changed
+
+
+def precompress(path):
+    """
+    為既有檔案補上 .gz / .br (例如內容雜湊命名、只寫一次的靜態檔)。
+    """
+    with open(path, "rb") as f:
+        return publish(path, f.read())
+
+
+def write_manifest(out_dir, files, path="manifest.json"):
+    """
+    輸出 manifest.json：每個檔案 (相對 out_dir 的路徑) 的大小、SHA-256 與各壓縮版本大小，
+    供伺服器選擇預先壓縮檔，也讓 benchmark 追蹤傳輸量。內容未變時不寫入。回傳 manifest dict。
+    """
+    entries = {}
+    for rel in sorted(files):
+        full = os.path.join(out_dir, rel)
+        if not os.path.exists(full):
+            continue
+        entry = {"bytes": os.path.getsize(full), "sha256": file_digest(full)}
+        for encoding, ext in ENCODINGS.items():
+            if os.path.exists(full + ext):
+                entry[encoding] = os.path.getsize(full + ext)
+        entries[rel.replace(os.sep, "/")] = entry
+    manifest = {"version": 1, "files": entries}
+    write_if_changed(os.path.join(out_dir, path),
+                     json.dumps(manifest, ensure_ascii=False, indent=1, sort_keys=True) + "\n")
+    return manifest
@@ -0,0 +1,455 @@
+// Per-build data embedded in the page (<script id="page-data" type="application/json">)
+const PAGE_DATA = JSON.parse(document.getElementById('page-data').textContent);
+const SKY_TZ = PAGE_DATA.sky_tz; // { base: minutes, transitions: [[epoch ms, offset minutes], ...] }
+
+// Precomputed multi-day schedule (schedule.json); null until loaded -> inline fallback
+let SCHEDULE = null;
+let SHARD_WINDOWS = null;
+
+function loadSchedule() {
+    fetch('schedule.json', { cache: 'no-cache' })
+        .then(r => r.ok ? r.json() : null)
+        .then(data => {
+            if (data && data.version === 1) {
+                SCHEDULE = data;
+                SHARD_WINDOWS = null;
+                EVENT_CACHE.clear();
+                tick();
+            }
+        })
+        .catch(() => {});
+}
+
+loadSchedule();
+
+// Index of the first element > x in a sorted array
+function upperBound(arr, x) {
+    let lo = 0, hi = arr.length;
+    while (lo < hi) {
+        const mid = (lo + hi) >> 1;
+        if (arr[mid] <= x) lo = mid + 1; else hi = mid;
+    }
+    return lo;
+}
+
+// Modal
+function openModal(src) {
+    document.getElementById('imgModal').style.display = "flex";
+    document.getElementById('modalImg').src = src;
+}
+
+// --- DOM ---
+// Element references are looked up once (and again only after the cards are re-rendered);
+// each tick writes a text node / class only when its value actually changed.
+let DOM = null;
+const LAST = new WeakMap();
+
+function bindDom() {
+    DOM = {
+        shardStatus: document.querySelector('#shard-status .shard-status-dynamic'),
+        staleBadges: Array.from(document.querySelectorAll('.badge.stale[data-stored-at]')),
+        events: {},
+    };
+    for (const key of Object.keys(EVENTS)) {
+        const row = document.getElementById('event-' + key);
+        if (!row) continue;
+        DOM.events[key] = {
+            time: row.querySelector('.event-time'),
+            countdown: row.querySelector('.event-countdown'),
+            status: row.querySelector('.event-status'),
+        };
+    }
+}
+
+function setText(el, value) {
+    if (!el) return;
+    const last = LAST.get(el) || {};
+    if (last.text === value) return;
+    el.textContent = value;
+    LAST.set(el, { ...last, text: value });
+}
+
+function setClass(el, value) {
+    if (!el) return;
+    const last = LAST.get(el) || {};
+    if (last.cls === value) return;
+    el.className = value;
+    LAST.set(el, { ...last, cls: value });
+}
+
+function pad2(n) {
+    return n.toString().padStart(2, '0');
+}
+
+function formatHMS(seconds) {
+    return `${Math.floor(seconds / 3600)}小時 ${Math.floor((seconds % 3600) / 60)}分 ${Math.floor(seconds % 60)}秒`;
+}
+
+// --- SHARD LOGIC ---
+// "HH:MM-HH:MM" strings parsed once (per data version); Date objects rebuilt only when the local day changes
+function parseShardTimes(times) {
+    return times.map(range => {
+        const parts = range.split('-');
+        if (parts.length < 2) return null;
+        const [h1, m1] = parts[0].trim().split(':').map(Number);
+        const [h2, m2] = parts[1].trim().split(':').map(Number);
+        return { h1, m1, h2, m2 };
+    }).filter(r => r !== null);
+}
+
+let SHARD_RANGES = parseShardTimes(PAGE_DATA.shard_times);
+let shardDay = null;
+let shardEvents = [];
+
+function localShardEvents(now) {
+    const day = now.toDateString();
+    if (day !== shardDay) {
+        shardDay = day;
+        shardEvents = SHARD_RANGES.map(r => {
+            const s = new Date(now); s.setHours(r.h1, r.m1, 0, 0);
+            const e = new Date(now); e.setHours(r.h2, r.m2, 0, 0);
+            // Handle overnight crossing (e.g. 23:00 - 01:00)
+            if (e < s) e.setDate(e.getDate() + 1);
+            return { start: s, end: e };
+        }).sort((a, b) => a.start - b.start);
+    }
+    return shardEvents;
+}
+
+function scheduledShard(now) {
+    if (!SCHEDULE) return null;
+    if (!SHARD_WINDOWS) {
+        SHARD_WINDOWS = { ends: [], items: [] };
+        for (const day of SCHEDULE.shards) {
+            for (const [start, end] of day.windows) {
+                SHARD_WINDOWS.ends.push(end * 1000);
+                SHARD_WINDOWS.items.push({ start: new Date(start * 1000), end: new Date(end * 1000), day });
+            }
+        }
+    }
+    const i = upperBound(SHARD_WINDOWS.ends, now.getTime());
+    return i < SHARD_WINDOWS.items.length ? SHARD_WINDOWS.items[i] : null;
+}
+
+function updateShardStatus(now) {
+    if (!DOM.shardStatus || (SHARD_RANGES.length === 0 && !SCHEDULE)) return;
+
+    let targetEvent = null;
+    let dayLabel = null;
+
+    // Precomputed schedule: binary search the first window that has not ended
+    const scheduled = scheduledShard(now);
+    if (scheduled) {
+        targetEvent = scheduled;
+        if (scheduled.start.getDate() !== now.getDate()) {
+            dayLabel = `${scheduled.day.date.slice(5).replace('-', '/')} ${scheduled.day.map}`;
+        }
+    } else {
+        const events = localShardEvents(now);
+        targetEvent = events.find(ev => now < ev.end) || null;
+        // All passed today: first event of tomorrow
+        if (!targetEvent && events.length > 0) {
+            const first = events[0];
+            targetEvent = { start: new Date(first.start), end: new Date(first.end) };
+            targetEvent.start.setDate(targetEvent.start.getDate() + 1);
+            targetEvent.end.setDate(targetEvent.end.getDate() + 1);
+        }
+    }
+
+    let msg = "今日所有爆發已結束";
+    if (targetEvent && now >= targetEvent.start) {
+        const diff = (targetEvent.end - now) / 1000;
+        msg = `進行中! (距離結束: ${Math.floor(diff / 60)}分 ${Math.floor(diff % 60)}秒)`;
+    } else if (targetEvent) {
+        const isTom = targetEvent.start.getDate() !== now.getDate();
+        const prefix = dayLabel ? `等待中 (${dayLabel}):` : (isTom ? "等待中 (明天):" : "等待中:");
+        msg = `${prefix} ${formatHMS((targetEvent.start - now) / 1000)}`;
+    }
+    setText(DOM.shardStatus, msg);
+}
+
+// 舊資料標示：頁面只帶快照時間 (stored_at)，經過時間在這裡計算
+function updateStaleBadges(now) {
+    for (const el of DOM.staleBadges) {
+        const age = Math.max(0, now.getTime() / 1000 - Number(el.dataset.storedAt));
+        const hours = Math.floor(age / 3600);
+        setText(el, `舊資料 · ${hours ? `${hours} 小時前` : `${Math.floor(age / 60)} 分鐘前`}`);
+    }
+}
+
+// --- CLOCK LOGIC ---
+// Sky 伺服器 (洛杉磯) 的 UTC 偏移直接查表，與瀏覽器所在時區無關
+function skyOffsetMinutes(ms) {
+    let offset = SKY_TZ.base;
+    for (const [at, off] of SKY_TZ.transitions) {
+        if (ms < at) break;
+        offset = off;
+    }
+    return offset;
+}
+
+const TWO_HOURS = 2 * 3600 * 1000;
+const STANDARD_OFFSET = Math.min(SKY_TZ.base, ...SKY_TZ.transitions.map(t => t[1]));
+
+const EVENTS = {
+    'geyser': { min: 5, duration: 10 },
+    'grandma': { min: 35, duration: 10 },
+    'turtle': { min: 50, duration: 10 }
+};
+
+// 下一場 (或進行中) 事件：洛杉磯時間偶數小時 + min 分
+function nextEvent(nowMs, info) {
+    const wallNow = nowMs + skyOffsetMinutes(nowMs) * 60000;
+    const firstSlot = Math.floor(wallNow / TWO_HOURS) * TWO_HOURS - TWO_HOURS;
+    for (let i = 0; i < 4; i++) {
+        const wall = firstSlot + i * TWO_HOURS + info.min * 60000;
+        const start = wall - skyOffsetMinutes(wall - STANDARD_OFFSET * 60000) * 60000;
+        const end = start + info.duration * 60000;
+        if (end > nowMs) return { start: new Date(start), end: new Date(end) };
+    }
+    return null;
+}
+
+// Precomputed schedule lookup: first event of this kind that has not ended yet
+function scheduledEvent(nowMs, key) {
+    if (!SCHEDULE || !SCHEDULE.events[key]) return null;
+    const ev = SCHEDULE.events[key];
+    const i = upperBound(ev.start, nowMs / 1000 - ev.duration);
+    if (i >= ev.start.length) return null;
+    return { start: new Date(ev.start[i] * 1000), end: new Date((ev.start[i] + ev.duration) * 1000) };
+}
+
+// The current / next occurrence only changes when it ends: look it up again only then
+const EVENT_CACHE = new Map();
+
+function currentEvent(nowMs, key) {
+    const cached = EVENT_CACHE.get(key);
+    if (cached && cached.end > nowMs) return cached;
+    const ev = scheduledEvent(nowMs, key) || nextEvent(nowMs, EVENTS[key]);
+    if (ev) EVENT_CACHE.set(key, ev);
+    return ev;
+}
+
+function updateClock(now) {
+    for (const [key, refs] of Object.entries(DOM.events)) {
+        const ev = currentEvent(now.getTime(), key);
+        if (!ev) continue;
+
+        setText(refs.time, `下次: ${pad2(ev.start.getHours())}:${pad2(ev.start.getMinutes())}`);
+
+        if (now >= ev.start) {
+            const remaining = (ev.end - now) / 1000;
+            setText(refs.status, `進行中 (剩餘 ${Math.floor(remaining / 60)}分 ${Math.floor(remaining % 60)}秒)`);
+            setClass(refs.status, "event-status tag active");
+            setText(refs.countdown, "");
+        } else {
+            setText(refs.status, "等待中");
+            setClass(refs.status, "event-status tag waiting");
+            setText(refs.countdown, formatHMS((ev.start - now) / 1000));
+        }
+    }
+}
+
+// --- CARDS (client-side rendering of data.json; mirrors web_exporter's card templates) ---
+const CLOCK_EVENTS = [
+    ['geyser', '噴泉 (Geyser)'],
+    ['grandma', '奶奶 (Grandma)'],
+    ['turtle', '海龜 (Turtle)']
+];
+const IMG_SIZES = "(max-width: 760px) 100vw, 420px";
+
+function esc(value) {
+    return String(value ?? '').replace(/[&<>"']/g, c => ({ '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' }[c]));
+}
+
+function imgTag(src, variants, extraClass) {
+    const cls = extraClass ? ` class="${extraClass}"` : "";
+    if (!variants) {
+        return `<img src="${esc(src)}"${cls} loading="lazy" decoding="async" data-full="${esc(src)}" onclick="openModal(this.dataset.full)">`;
+    }
+    const webp = variants.webp.map(([path, w]) => `${esc(path)} ${w}w`).join(', ');
+    const [jpeg, jpegW] = variants.jpeg;
+    const height = variants.width ? Math.round(variants.height * jpegW / variants.width) : "";
+    return `<picture><source type="image/webp" srcset="${webp}" sizes="${IMG_SIZES}">` +
+        `<img src="${esc(jpeg)}" srcset="${esc(jpeg)} ${jpegW}w" sizes="${IMG_SIZES}"${cls} width="${jpegW}" height="${height}" ` +
+        `loading="lazy" decoding="async" data-full="${esc(variants.full)}" onclick="openModal(this.dataset.full)"></picture>`;
+}
+
+function staleBadge(storedAt) {
+    if (storedAt == null) return "";
+    return `<span class="badge stale" data-stored-at="${Math.floor(storedAt)}" ` +
+        `title="來源暫時無法取得，顯示上次成功的資料">舊資料</span>`;
+}
+
+function renderShardCard(s) {
+    if (!s) return '<div class="card error">無法獲取碎石資訊</div>';
+    const tags = (s.eruptions || []).map(t => `<span class="tag">${esc(t)}</span>`).join('');
+    return `<div class="card"><div class="card-header"><h2>每日碎石 (Shards)</h2>` +
+        `<div class="row-center"><span class="badge ${esc(s.type || 'Unknown')}">${esc(s.type)}</span></div></div>` +
+        `<div class="card-body">` +
+        `<div class="info-row highlight-row"><strong>日期：</strong> ${esc(s.dateText)}</div>` +
+        `<div class="info-row"><strong>地圖：</strong> ${esc(s.map)}</div>` +
+        `<div class="info-row"><strong>獎勵：</strong> <span class="rewards-text">${esc(s.rewards || '未知 / Unknown')}</span></div>` +
+        `<div class="info-row"><strong>時間：</strong> ${esc(s.time_range)}</div>` +
+        `<div class="info-row" id="shard-status"><strong>狀態：</strong> <span class="shard-status-dynamic">計算中...</span></div>` +
+        `<div class="eruptions-list"><strong>爆發時間 (24H)：</strong><div class="tags">${tags}</div></div>` +
+        (s.image_url ? imgTag(s.image_url, null, 'shard-img') : '') +
+        `</div></div>`;
+}
+
+function renderQuestCard(quests, staleSince) {
+    if (!quests || !quests.length) return '<div class="card error">無法獲取每日任務</div>';
+    const items = quests.map((q, i) => `<div class="quest-item"><span class="num">${i + 1}</span> ${esc(q)}</div>`).join('');
+    return `<div class="card"><div class="card-header"><h2>每日任務 (Quests)</h2>${staleBadge(staleSince)}</div>` +
+        `<div class="card-body"><div class="quest-list">${items}</div></div></div>`;
+}
+
+function renderCandleCard(title, data, staleSince) {
+    if (!data) return `<div class="card error">無法獲取${title}資訊</div>`;
+    const realm = data.realm || '未知';
+    const sub = data.rotation ? `${realm} | ${data.rotation}` : realm;
+    const descs = data.descriptions || [];
+    const imgs = data.images || [];
+    const variants = data.variants || {};
+    const desc = (txt, i) => `<div class="desc"><span class="num">${i + 1}</span> ${esc(txt)}</div>`;
+
+    let content;
+    if (descs.length > 0 && imgs.length === descs.length) {
+        content = '<div class="pair-grid">' +
+            descs.map((txt, i) => `<div class="pair-item">${desc(txt, i)}${imgs[i] ? imgTag(imgs[i], variants[imgs[i]]) : ''}</div>`).join('') +
+            '</div>';
+    } else {
+        content = `<div class="desc-list">${descs.map(desc).join('')}</div>` +
+            `<div class="img-grid">${imgs.map(url => imgTag(url, variants[url])).join('')}</div>`;
+    }
+    return `<div class="card"><div class="card-header"><h2>${title}</h2><span class="subtitle">${esc(sub)}</span>` +
+        `${staleBadge(staleSince ?? data.stale)}</div><div class="card-body scrollable">${content}</div></div>`;
+}
+
+function renderClockCard(keys) {
+    if (!keys || !keys.length) return '<div class="card error">無法獲取時鐘資訊</div>';
+    const rows = CLOCK_EVENTS.filter(([key]) => keys.includes(key)).map(([key, name]) =>
+        `<div class="event-row" id="event-${key}"><div class="event-name">${name}</div>` +
+        `<div class="event-time">下次: --:--</div><div class="event-countdown">--:--:--</div>` +
+        `<div class="event-status tag waiting">計算中...</div></div>`).join('');
+    return `<div class="card"><div class="card-header"><h2>每日事件時鐘 (Events)</h2></div><div class="card-body">${rows}</div></div>`;
+}
+
+function setSlot(name, html) {
+    const slot = document.getElementById('slot-' + name);
+    if (slot) slot.innerHTML = html;
+}
+
+// --- SKY DAY ROLLOVER ---
+// After the Sky reset (before the next build) the shard and treasure cards still show the previous day:
+// redraw them from that day's schedule.json entry until data.json catches up.
+let rolledDate = null;
+
+function currentSkyDate(nowMs) {
+    return new Date(nowMs + skyOffsetMinutes(nowMs) * 60000).toISOString().slice(0, 10);
+}
+
+function scheduleShardInfo(day, nowMs) {
+    const i = day.windows.findIndex(([, end]) => end * 1000 > nowMs);
+    return { ...day, time_range: i >= 0 ? day.eruptions[i] : '無' };
+}
+
+function rollover(now) {
+    if (!SCHEDULE) return;
+    const today = currentSkyDate(now.getTime());
+    if (today <= skyDate || today === rolledDate) return;
+    const shard = SCHEDULE.shards.find(d => d.date === today);
+    if (!shard) return;
+    rolledDate = today;
+    setSlot('shards', renderShardCard(scheduleShardInfo(shard, now.getTime())));
+    const treasure = SCHEDULE.candles.find(d => d.date === today);
+    if (treasure) setSlot('treasure', renderCandleCard('大蠟燭 (Treasure)', treasure));
+    setText(document.getElementById('sky-date'), today);
+    DOM = null;
+}
+
+// --- LIVE DATA (data.json, conditional polling) ---
+const DATA_VERSION = 1;
+let dataRevision = PAGE_DATA.revision;
+let skyDate = PAGE_DATA.sky_date;
+// Same ETag the server sends for the data.json this page was rendered from: an unchanged first poll is a 304
+let dataEtag = PAGE_DATA.data_etag || null;
+let pollTimer = null;
+let lastPoll = Date.now();
+
+function applyData(data) {
+    if (data.version !== DATA_VERSION || data.revision === dataRevision) return;
+    dataRevision = data.revision;
+    const stale = data.stale || {};
+
+    setSlot('quests', renderQuestCard(data.quests, stale.dailies));
+    setSlot('shards', renderShardCard(data.shards));
+    setSlot('treasure', renderCandleCard('大蠟燭 (Treasure)', data.treasure, stale.dailies));
+    setSlot('seasonal', renderCandleCard('季節蠟燭 (Seasonal)', data.seasonal, stale.dailies));
+    setSlot('clock', renderClockCard(data.clock));
+
+    SHARD_RANGES = parseShardTimes(data.shard_times || []);
+    shardDay = null;
+    rolledDate = null;
+    if (data.sky_date !== skyDate) {
+        skyDate = data.sky_date;
+        setText(document.getElementById('sky-date'), skyDate);
+        loadSchedule();
+    }
+    DOM = null; // cards were replaced: look the elements up again
+    tick();
+}
+
+async function pollData() {
+    clearTimeout(pollTimer);
+    pollTimer = null;
+    if (document.hidden || !PAGE_DATA.data_url) return;
+    lastPoll = Date.now();
+    try {
+        // no-store + our own If-None-Match: an unchanged feed is a bodiless 304
+        const r = await fetch(PAGE_DATA.data_url, { cache: 'no-store', headers: dataEtag ? { 'If-None-Match': dataEtag } : {} });
+        if (r.status === 200) {
+            dataEtag = r.headers.get('ETag');
+            applyData(await r.json());
+        }
+    } catch (e) {
+        // offline / transient: try again next interval
+    }
+    pollTimer = setTimeout(pollData, PAGE_DATA.poll_seconds * 1000);
+}
+
+// --- TICK LOOP ---
+// One tick per wall-clock second (aligned to the boundary so countdowns never skip or repeat),
+// fully stopped while the tab is hidden.
+let timer = null;
+
+function tick() {
+    clearTimeout(timer);
+    timer = null;
+    if (document.hidden) return;
+
+    const now = new Date();
+    rollover(now);
+    if (!DOM) bindDom();
+    updateClock(now);
+    updateShardStatus(now);
+    updateStaleBadges(now);
+
+    timer = setTimeout(tick, 1000 - (Date.now() % 1000) + 5);
+}
+
+document.addEventListener('visibilitychange', () => {
+    if (document.hidden) {
+        clearTimeout(timer);
+        timer = null;
+        clearTimeout(pollTimer);
+        pollTimer = null;
+    } else {
+        tick();
+        const sincePoll = Date.now() - lastPoll;
+        pollTimer = setTimeout(pollData, Math.max(0, PAGE_DATA.poll_seconds * 1000 - sincePoll));
+    }
+});
+
+tick(); // Init
+if (PAGE_DATA.poll_seconds) pollTimer = setTimeout(pollData, PAGE_DATA.poll_seconds * 1000);
@@ -1,10 +1,20 @@
+import argparse
 import asyncio
 import os
 import sys
 from crawler import SkyCrawler
+import artifacts
+import config
+import fixtures
+import history
+import schedule_export
+import shard_pred
+import static_assets
+import task_runner
+import tracing
 import web_exporter
 
-async def main():
+async def main(fixture_mode=None, fixture_dir=None):
     print("Starting auto_build process...")
     
     # Ensure images directory exists (Prevent git add failure if scraper crashes)
@@ -16,22 +26,49 @@ async def main():
         pass
     
     # 1. Initialize Crawler
-    crawler = SkyCrawler()
+    crawler = SkyCrawler(fixture_mode=fixture_mode, fixture_dir=fixture_dir)
+    shards, quests, dailies, clock = {}, [], {}, {}
+    source_status = {}
+    snapshots = crawler.snapshots
     
     try:
         print("Starting crawler...")
-        await crawler.start()
+        try:
+            with tracing.span("browser_start"):
+                await crawler.start()
+        except Exception as e:
+            # Keep going: every source below then fails and takes its own fallback
+            # (local shard forecast, dailies snapshot, computed clock)
+            print(f"Crawler start error: {e}")
         
         # 2. Fetch Data
         print("Fetching data (Shards, Dailies, Clock, Quests)...")
-        shards_task = asyncio.create_task(crawler.get_shards_prediction())
-        optimized_task = asyncio.create_task(crawler.get_all_daily_info_optimized())
-        clock_task = asyncio.create_task(crawler.get_clock_info())
-        
-        # Return format: shards, (quests, dailies), clock
-        shards, (quests, dailies), clock = await asyncio.gather(shards_task, optimized_task, clock_task)
-        
-        print("Data fetched successfully.")
+        # Each source has its own time budget; finished sources are kept even if another one fails
+        outcomes = await task_runner.run_sources([
+            task_runner.SourceTask("shards", crawler.get_shards_prediction,
+                                   timeout=config.SOURCE_TIMEOUTS["shards"],
+                                   fallback=crawler.get_local_shards_prediction),
+            # 9-bit / Fandom failures swallow errors and return no quests -> last-known-good snapshot
+            task_runner.SourceTask("dailies", crawler.get_all_daily_info_optimized,
+                                   timeout=config.SOURCE_TIMEOUTS["dailies"],
+                                   fallback=snapshots.fallback("dailies", ([], {})),
+                                   accept=lambda result: bool(result[0])),
+            task_runner.SourceTask("clock", crawler.get_clock_info,
+                                   timeout=config.SOURCE_TIMEOUTS["clock"],
+                                   fallback={}),
+        ], deadline=config.BUILD_DEADLINE)
+
+        shards = outcomes["shards"].value
+        # Return format: (quests, dailies)
+        quests, dailies = outcomes["dailies"].value
+        clock = outcomes["clock"].value
+        if outcomes["dailies"].ok:
+            snapshots.put("dailies", outcomes["dailies"].value)
+
+        for outcome in outcomes.values():
+            print(f"  {outcome}")
+            source_status[outcome.name] = outcome.status
+        print("Data fetched successfully." if all(o.ok for o in outcomes.values()) else "Data fetched (partial).")
         # Debug prints
         # print(f"Shards: {shards}")
         # print(f"Dailies keys: {dailies.keys()}")
@@ -39,31 +76,95 @@ async def main():
 
     except Exception as e:
         print(f"Error during crawling: {e}")
-        shards, dailies, clock = {}, {}, {}
+        # Same per-source fallbacks as the task runner: the shard forecast and the clock are
+        # pure date math, dailies come from the last-known-good snapshot
+        try:
+            shards = crawler.get_local_shards_prediction()
+        except Exception as err:
+            print(f"Local shard prediction error: {err}")
+        quests, dailies = snapshots.fallback("dailies", ([], {}))()
+        clock = await crawler.get_clock_info() or {}
+        source_status = {name: "error" for name in ("shards", "dailies", "clock")}
     finally:
-        await crawler.stop()
+        with tracing.span("browser_stop"):
+            await crawler.stop()
         print("Crawler stopped.")
 
     # 3. Generate HTML
     try:
         print("Generating HTML dashboard...")
-        # web_exporter.generate_dashboard returns the absolute path of the generated file
-        # It defaults to "dashboard.html" in current dir
-        generated_path = web_exporter.generate_dashboard(shards, dailies, clock, quests)
-        
-        # 4. Rename to index.html for GitHub Pages
-        target_path = os.path.join(os.path.dirname(generated_path), "index.html")
-        
-        # Remove existing index.html if it exists
-        if os.path.exists(target_path):
-            os.remove(target_path)
-            
-        os.rename(generated_path, target_path)
-        print(f"SUCCESS: Dashboard generated at {target_path}")
+        # Rendering is deterministic: identical data -> identical bytes, written straight to index.html
+        # (GitHub Pages) only when the content digest differs, so an unchanged build does no I/O
+        with tracing.span("render"):
+            target_path, changed = web_exporter.generate_dashboard(shards, dailies, clock, quests,
+                                                                   stale=snapshots.served_stale, path="index.html")
+        print(f"SUCCESS: Dashboard {'generated' if changed else 'unchanged'} at {target_path}")
+
+        # 5. Multi-day schedule for the page JS (keeps countdowns correct between builds)
+        with tracing.span("schedule"):
+            schedule_path, changed = schedule_export.write_schedule(config.SCHEDULE_PATH, days=config.SCHEDULE_DAYS)
+        print(f"SUCCESS: Schedule ({config.SCHEDULE_DAYS} days) {'written to' if changed else 'unchanged at'} {schedule_path}")
+
+        # 6. Manifest of published files (sizes / digests / precompressed sizes)
+        write_manifest(".")
         
     except Exception as e:
-        print(f"Error generating/renaming HTML: {e}")
+        print(f"Error generating HTML: {e}")
+        write_build_report()
         sys.exit(1)
 
+    # 7. Append this build to the history store (replays must not touch state/)
+    if fixture_mode != fixtures.REPLAY:
+        for name in snapshots.served_stale:
+            source_status[name] = "stale"
+        record_history(shards, quests, dailies, clock, source_status)
+
+    write_build_report()
+
+def record_history(shards, quests, dailies, clock, source_status):
+    try:
+        with tracing.span("history"), history.History(config.HISTORY_PATH) as store:
+            build_id = store.record_build(shard_pred.sky_today(), shards=shards, quests=quests,
+                                          dailies=dailies, clock=clock, sources=source_status)
+        print(f"History: recorded build #{build_id} in {config.HISTORY_PATH}")
+    except Exception as e:
+        print(f"History record error: {e}")
+
+def write_manifest(out_dir):
+    files = ["index.html", config.DATA_PATH, config.SCHEDULE_PATH, *static_assets.build_assets(out_dir).values()]
+    manifest = artifacts.write_manifest(out_dir, files, config.MANIFEST_PATH)
+    total = {k: sum(e.get(k, 0) for e in manifest["files"].values()) for k in ("bytes", "gzip", "br")}
+    print(f"Manifest: {len(manifest['files'])} files, {total['bytes']} bytes "
+          f"(gzip {total['gzip']}, br {total['br']})")
+
+def write_build_report():
+    try:
+        path = tracing.TRACER.write_report(config.BUILD_REPORT_PATH)
+        print("Build timing summary:\n" + tracing.TRACER.summary())
+        print(f"Build report written to {path}")
+    except Exception as e:
+        print(f"Build report error: {e}")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Build the Sky dashboard (index.html + schedule.json).")
+    parser.add_argument("command", nargs="?", choices=["build", "serve"], default="build",
+                        help="build once (default) or keep running and refresh each source on its own cadence")
+    parser.add_argument("--port", type=int, nargs="?", const=config.SERVE_PORT,
+                        help=f"serve: also serve the output over HTTP (default port {config.SERVE_PORT})")
+    parser.add_argument("--out", default=".", help="serve: output directory (default: current directory)")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--record", action="store_const", const="record", dest="fixture_mode",
+                      help="crawl the live sites and save HAR / HTTP fixtures")
+    mode.add_argument("--replay", action="store_const", const="replay", dest="fixture_mode",
+                      help="build from saved fixtures without any network access")
+    parser.add_argument("--fixtures", default=config.FIXTURE_DIR, dest="fixture_dir",
+                        help=f"fixture directory (default: {config.FIXTURE_DIR})")
+    return parser.parse_args(argv)
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    args = parse_args()
+    if args.command == "serve":
+        import daemon
+        asyncio.run(daemon.serve(args.out, port=args.port, fixture_mode=args.fixture_mode, fixture_dir=args.fixture_dir))
+    else:
+        asyncio.run(main(args.fixture_mode, args.fixture_dir))
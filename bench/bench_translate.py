@@ -0,0 +1,86 @@
+"""
+translate_quest benchmark + golden check.
+
+    python bench/bench_translate.py [--repeat N]
+
+Compares the compiled translator (translator.translate_quest) with the
+previous implementation (dict rebuilt + sorted on every call, then one
+str.replace per term) on bench/quest_golden.tsv, and fails if any output
+differs from the golden file.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import translator  # noqa: E402
+
+GOLDEN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "quest_golden.tsv")
+
+
+def load_golden(path=GOLDEN_PATH):
+    pairs = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if not line or line.startswith("#"):
+                continue
+            src, expected = line.split("\t")
+            pairs.append((src, expected))
+    return pairs
+
+
+def legacy_translate_quest(text):
+    # Pre-compiled behaviour: rebuild the table, sort it and replace term by term
+    terms = dict(translator.QUEST_TERMS)
+    if "30個" in text and "集める" in text:
+        return "收集 30 滴燭火"
+    sorted_terms = sorted(terms.items(), key=lambda x: len(x[0]), reverse=True)
+    for jp, tc in sorted_terms:
+        text = text.replace(jp, tc)
+    text = text.replace('在在', '在').replace('的在', '在').replace('任務任務', '任務')
+    text = text.replace('重溫美好回憶先祖', '重溫先祖美好回憶').replace('重溫先祖美好回憶任務', '重溫先祖美好回憶')
+    text = text.replace('彩彩虹', '彩虹')
+    return text
+
+
+def check_golden(pairs, fn=translator.translate_quest):
+    return [(src, expected, fn(src)) for src, expected in pairs if fn(src) != expected]
+
+
+def time_per_quest(fn, corpus, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for src in corpus:
+            fn(src)
+        samples.append((time.perf_counter() - start) / len(corpus))
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    pairs = load_golden()
+    mismatches = check_golden(pairs)
+    for src, expected, got in mismatches:
+        print(f"MISMATCH {src}\n  expected: {expected}\n  got:      {got}")
+    if mismatches:
+        sys.exit(1)
+    print(f"Golden corpus OK ({len(pairs)} quests)")
+
+    corpus = [src for src, _ in pairs]
+    before = time_per_quest(legacy_translate_quest, corpus, args.repeat)
+    after = time_per_quest(translator.translate_quest, corpus, args.repeat)
+    print(f"before: {before * 1e6:8.2f} us/quest")
+    print(f"after:  {after * 1e6:8.2f} us/quest  ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+"""
+End-to-end benchmark of the build pipeline, stage by stage.
+
+    python bench/run.py [--repeat N] [--only NAME ...] [--fixtures DIR] [--out PATH] [--compare OLD.json]
+
+Pure-Python stages (translate_quest over the golden corpus, candle
+descriptions, clock events, schedule, dashboard render) always run.
+Browser stages (cold start and every SkyCrawler fetch method) run against
+the offline fixtures recorded with `auto_build.py --record` and are
+skipped when the fixtures or the Chromium build are missing.
+
+Each stage reports median / p95 / min / max wall time over N runs, plus
+the tracemalloc allocation peak of one extra run (tracemalloc slows the
+code down, so it is kept out of the timed runs).
+
+The published payload (index.html, data.json, schedule.json and static
+assets; raw / gzip / brotli bytes from the build manifest) is recorded as
+well, so page weight can be tracked across revisions alongside timings.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import artifacts  # noqa: E402
+import candle_data  # noqa: E402
+import clock_pred  # noqa: E402
+import config  # noqa: E402
+import fixtures  # noqa: E402
+import schedule_export  # noqa: E402
+import shard_pred  # noqa: E402
+import static_assets  # noqa: E402
+import translator  # noqa: E402
+import web_exporter  # noqa: E402
+from bench_translate import load_golden  # noqa: E402
+from crawler import SkyCrawler  # noqa: E402
+from translation_memory import TranslationMemory  # noqa: E402
+
+DEFAULT_OUT = os.path.join(ROOT, "bench", "results.json")
+
+# SkyCrawler fetch methods timed under replay
+FETCH_METHODS = [
+    "get_shards_prediction",
+    "get_shards_info",
+    "get_daily_quests",
+    "get_dailies_info",
+    "get_all_daily_info_optimized",
+    "get_clock_info",
+]
+
+
+def percentile(samples, p):
+    ordered = sorted(samples)
+    k = max(0, math.ceil(p / 100 * len(ordered)) - 1)
+    return ordered[k]
+
+
+def summarize(samples, peak):
+    return {
+        "runs": len(samples),
+        "median": statistics.median(samples),
+        "p95": percentile(samples, 95),
+        "min": min(samples),
+        "max": max(samples),
+        "alloc_peak_bytes": peak,
+    }
+
+
+def measure(fn, repeat):
+    fn()  # warm-up (imports, caches, first-call compilation)
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return summarize(samples, peak)
+
+
+async def measure_async(fn, repeat, warmup=True):
+    if warmup:
+        await fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - start)
+    tracemalloc.start()
+    await fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return summarize(samples, peak)
+
+
+def sample_inputs():
+    """
+    generate_dashboard 的輸入：本地推算的碎石 / 時鐘、黃金語料的任務、candle_data 的說明。
+    """
+    day = shard_pred.sky_today()
+    shards, _ = SkyCrawler()._predict_shards()
+    treasure = candle_data.predict_treasure(day)
+    dailies = {
+        "treasure": {**treasure, "images": [], "descriptions": candle_data.get_treasure_desc(treasure["realm"], treasure["rotation"])},
+        "seasonal": {"realm": treasure["realm"], "rotation": "Rotation 1", "images": [],
+                     "descriptions": candle_data.get_seasonal_desc(treasure["realm"])},
+    }
+    quests = [translator.translate_quest(src) for src, _ in load_golden()[:4]]
+    return shards, dailies, clock_pred.get_event_times(), quests
+
+
+def python_stages(corpus):
+    realms = [(realm, rot) for realm, rots in candle_data.TREASURE_CANDLES.items() for rot in rots]
+    shards, dailies, clock, quests = sample_inputs()
+
+    def translate_memory():
+        memory = TranslationMemory(os.path.join(tempfile.mkdtemp(), "tm.json"))
+        for src in corpus:
+            memory.translate(src)
+
+    return {
+        "translate_quest": lambda: [translator.translate_quest(src) for src in corpus],
+        "translation_memory.cold": translate_memory,
+        "candle_data.get_treasure_desc": lambda: [candle_data.get_treasure_desc(r, rot) for r, rot in realms],
+        "clock_pred.get_event_times": clock_pred.get_event_times,
+        "schedule_export.build_schedule": lambda: schedule_export.build_schedule(days=config.SCHEDULE_DAYS),
+        "web_exporter.generate_dashboard": lambda: web_exporter.generate_dashboard(shards, dailies, clock, quests),
+    }
+
+
+def payload_sizes():
+    """
+    以範例輸入產生要發佈的檔案，回傳 manifest 的 files (各檔 bytes / gzip / br)。
+    """
+    shards, dailies, clock, quests = sample_inputs()
+    web_exporter.generate_dashboard(shards, dailies, clock, quests, path="index.html")
+    schedule_export.write_schedule(config.SCHEDULE_PATH, days=config.SCHEDULE_DAYS)
+    files = ["index.html", config.DATA_PATH, config.SCHEDULE_PATH, *static_assets.build_assets().values()]
+    return artifacts.write_manifest(".", files, config.MANIFEST_PATH)["files"]
+
+
+def print_payload(payload, baseline=None):
+    print(f"{'payload':<36} {'bytes':>10} {'gzip':>10} {'br':>10}" + (f" {'vs base':>8}" if baseline else ""))
+    for name, entry in payload.items():
+        line = f"{name:<36} {entry['bytes']:>10} {entry.get('gzip', '-'):>10} {entry.get('br', '-'):>10}"
+        base = (baseline or {}).get(name)
+        if base and base.get("bytes"):
+            line += f" {entry['bytes'] / base['bytes']:>7.2f}x"
+        print(line)
+
+
+def fixtures_available(fixture_dir):
+    return any(os.path.exists(fixtures.har_path(fixture_dir, s)) for s in config.RESOURCE_POLICIES)
+
+
+async def browser_stages(fixture_dir, repeat, wanted):
+    results = {}
+
+    async def cold_start():
+        crawler = SkyCrawler(fixture_mode=fixtures.REPLAY, fixture_dir=fixture_dir)
+        try:
+            await crawler.start()
+        finally:
+            await crawler.stop()
+
+    if wanted("crawler.cold_start"):
+        results["crawler.cold_start"] = await measure_async(cold_start, repeat, warmup=False)
+
+    methods = [m for m in FETCH_METHODS if wanted(f"crawler.{m}")]
+    if not methods:
+        return results
+
+    crawler = SkyCrawler(fixture_mode=fixtures.REPLAY, fixture_dir=fixture_dir)
+    await crawler.start()
+    try:
+        for name in methods:
+            results[f"crawler.{name}"] = await measure_async(getattr(crawler, name), repeat)
+    finally:
+        await crawler.stop()
+    return results
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+
+def print_table(stages, baseline=None):
+    print(f"{'stage':<36} {'median ms':>10} {'p95 ms':>10} {'peak KiB':>10}" + (f" {'vs base':>8}" if baseline else ""))
+    for name, r in stages.items():
+        if "skipped" in r or "error" in r:
+            print(f"{name:<36} {r.get('skipped') or 'ERROR: ' + r['error']}")
+            continue
+        line = f"{name:<36} {r['median'] * 1e3:>10.3f} {r['p95'] * 1e3:>10.3f} {r['alloc_peak_bytes'] / 1024:>10.1f}"
+        base = (baseline or {}).get(name)
+        if base and base.get("median"):
+            line += f" {r['median'] / base['median']:>7.2f}x"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--browser-repeat", type=int, default=3, help="runs per browser stage")
+    parser.add_argument("--only", nargs="*", default=None, help="stage name prefixes to run")
+    parser.add_argument("--fixtures", default=os.path.join(ROOT, config.FIXTURE_DIR))
+    parser.add_argument("--out", default=DEFAULT_OUT)
+    parser.add_argument("--compare", default=None, help="previous results JSON to compare medians against")
+    args = parser.parse_args()
+
+    def wanted(name):
+        return not args.only or any(name.startswith(prefix) for prefix in args.only)
+
+    fixture_dir = os.path.abspath(args.fixtures)
+    out_path = os.path.abspath(args.out)
+    corpus = [src for src, _ in load_golden()]
+
+    # Stages write dashboard.html / images/ relative to cwd: keep them out of the repo
+    os.chdir(tempfile.mkdtemp(prefix="sky-bench-"))
+
+    stages = {}
+    for name, fn in python_stages(corpus).items():
+        if wanted(name):
+            stages[name] = measure(fn, args.repeat)
+
+    browser_names = ["crawler.cold_start"] + [f"crawler.{m}" for m in FETCH_METHODS]
+    if any(wanted(n) for n in browser_names):
+        if not fixtures_available(fixture_dir):
+            for n in filter(wanted, browser_names):
+                stages[n] = {"skipped": f"no fixtures in {fixture_dir} (run auto_build.py --record)"}
+        else:
+            try:
+                stages.update(asyncio.run(browser_stages(fixture_dir, args.browser_repeat, wanted)))
+            except Exception as e:
+                for n in filter(wanted, browser_names):
+                    stages.setdefault(n, {"error": f"{type(e).__name__}: {e}"})
+
+    report = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "browser_repeat": args.browser_repeat,
+            "corpus_size": len(corpus),
+            "fixtures": fixtures.FixtureStore(fixture_dir).meta if fixtures_available(fixture_dir) else None,
+        },
+        "stages": stages,
+        "payload": payload_sizes(),
+    }
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_table(stages, baseline.get("stages"))
+    print()
+    print_payload(report["payload"], baseline.get("payload"))
+
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"Results written to {out_path}")
+
+
+if __name__ == "__main__":
+    main()
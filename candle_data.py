@@ -1,3 +1,5 @@
+from datetime import date
+
 # map_name_key: { rotation_key: [ "desc1", "desc2", "desc3", "desc4" ] }
 
 TREASURE_CANDLES = {
@@ -171,6 +173,18 @@ SEASONAL_CANDLES = {
     ]
 }
 
+# 大蠟燭地區每日輪替 (以 2026-01-05 為基準，5 天一循環)；週日為雙輪替
+TREASURE_REALMS = ['Daylight Prairie', 'Hidden Forest', 'Valley of Triumph', 'Golden Wasteland', 'Vault of Knowledge']
+TREASURE_ANCHOR = date(2026, 1, 5)
+
+def predict_treasure(day):
+    """
+    依日期推算大蠟燭的地區與輪替，回傳 {'realm', 'rotation'}。
+    """
+    idx = ((day - TREASURE_ANCHOR).days + 3) % 5
+    rotation = "Rotation 1 and 2" if day.weekday() == 6 else "Rotation 1"
+    return {'realm': TREASURE_REALMS[idx], 'rotation': rotation}
+
 def get_treasure_desc(realm, rotation):
     r_data = TREASURE_CANDLES.get(realm)
     if not r_data: return []
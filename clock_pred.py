@@ -1,119 +1,183 @@
 
 import os
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 import time
+from zoneinfo import ZoneInfo
 
-def is_dst(dt=None, timezone="America/Los_Angeles"):
+import numpy as np
+
+# Sky 伺服器時區 (事件與每日重置皆以洛杉磯時間計算)
+SKY_TZ = ZoneInfo("America/Los_Angeles")
+
+# 事件定義：每 2 小時一次 (洛杉磯時間的偶數小時)，minute 為觸發分鐘、duration 為持續分鐘
+EVENTS = {
+    'geyser': {'minute': 5, 'duration': 10},
+    'grandma': {'minute': 35, 'duration': 10},
+    'turtle': {'minute': 50, 'duration': 10}
+}
+EVENT_PERIOD_HOURS = 2
+
+# 洛杉磯相對 UTC 的偏移範圍：標準時間 -8、夏令時間 -7 (僅用於計算範圍的邊界)
+PST_OFFSET = np.timedelta64(-8, 'h')
+PDT_OFFSET = np.timedelta64(-7, 'h')
+
+def is_dst(dt=None, timezone=SKY_TZ):
     """
-    檢查給定的日期時間是否處於日光節約時間 (DST)。
-    預設時區為 US/Pacific（Sky 伺服器所在地）。
-    參考：DST 於 3 月的第二個星期日開始，於 11 月的第一個星期日結束。
+    檢查給定的時間點是否處於日光節約時間 (DST)。
+    預設時區為 America/Los_Angeles（Sky 伺服器所在地），以 zoneinfo 判斷，
+    切換當天凌晨 2 點前後也正確；naive datetime 視為主機當地時間。
     """
+    if isinstance(timezone, str):
+        timezone = ZoneInfo(timezone)
     if dt is None:
-        dt = datetime.now()
-        
-    year = dt.year
-    # 尋找 DST 開始日 (3月的第二個星期日)
-    march_1st = datetime(year, 3, 1)
-    # 星期幾: 0=週一, 6=週日
-    # 尋找第一個星期日
-    d = march_1st
-    while d.weekday() != 6: # 尋找第一個星期日
-        d += timedelta(days=1)
-    second_sunday_march = d + timedelta(days=7)
-    
-    # 尋找 DST 結束日 (11月的第一個星期日)
-    nov_1st = datetime(year, 11, 1)
-    d = nov_1st
-    while d.weekday() != 6:
-        d += timedelta(days=1)
-    first_sunday_nov = d
-    
-    # DST 區間 (概略) - 嚴格來說是在當天凌晨 2 點切換，但以日期判斷通常足夠。
-    # Sky 的重置時間通常是洛杉磯時間午夜。
-    
-    # 邏輯: 開始日 <= 今天 < 結束日
-    return second_sunday_march.date() <= dt.date() < first_sunday_nov.date()
+        dt = datetime.now(timezone)
+    elif dt.tzinfo is None:
+        dt = dt.astimezone()
+    return bool(dt.astimezone(timezone).dst())
+
+
+@lru_cache(maxsize=None)
+def dst_transitions(year, tz=SKY_TZ):
+    """
+    該年所有 UTC 偏移變化的時刻 (由 zoneinfo 資料推得)。
+    回傳 [(切換時刻 aware UTC datetime, 切換後偏移 timedelta), ...]，依時間排序。
+    """
+    utc = timezone.utc
+
+    def offset_at(t):
+        return t.astimezone(tz).utcoffset()
+
+    transitions = []
+    t = datetime(year, 1, 1, tzinfo=utc)
+    end = datetime(year + 1, 1, 1, tzinfo=utc)
+    prev = offset_at(t)
+    while t < end:
+        nxt = t + timedelta(days=1)
+        cur = offset_at(nxt)
+        if cur != prev:
+            # 二分搜尋到秒：lo 為舊偏移、hi 為新偏移
+            lo, hi = t, nxt
+            while hi - lo > timedelta(seconds=1):
+                mid = lo + (hi - lo) / 2
+                if offset_at(mid) == prev:
+                    lo = mid
+                else:
+                    hi = mid
+            transitions.append((hi.replace(microsecond=0), cur))
+            prev = cur
+        t = nxt
+    return tuple(transitions)
+
+
+def transition_table(start_year, end_year, tz=SKY_TZ):
+    """
+    供頁面 JS 使用的時區表：基準偏移與 [start_year, end_year] 期間所有切換時刻。
+    { 'base': 分鐘, 'transitions': [[epoch 毫秒, 切換後偏移分鐘], ...] }
+    """
+    base = datetime(start_year, 1, 1, tzinfo=timezone.utc).astimezone(tz).utcoffset()
+    rows = []
+    for year in range(start_year, end_year + 1):
+        for at, offset in dst_transitions(year, tz):
+            rows.append([int(at.timestamp() * 1000), int(offset.total_seconds() // 60)])
+    return {'base': int(base.total_seconds() // 60), 'transitions': rows}
+
+
+def _sky_wall_to_utc(wall):
+    """
+    洛杉磯當地時間 (datetime64[s] 陣列) 轉為 UTC，依預先算好的切換時刻一次向量化完成。
+    不存在的時刻 (春季跳過的一小時) 依切換後偏移換算；重複的時刻取第二次出現。
+    """
+    if not wall.size:
+        return wall
+    first_year = wall.min().astype('datetime64[Y]').astype(int) + 1970
+    last_year = wall.max().astype('datetime64[Y]').astype(int) + 1970
+    table = transition_table(first_year - 1, last_year)
+
+    at = np.array([t for t, _ in table['transitions']], dtype='datetime64[ms]').astype('datetime64[s]')
+    offsets = np.array([table['base']] + [o for _, o in table['transitions']], dtype='timedelta64[m]')
+    standard = offsets.min()
+
+    # 先以標準時間換算出候選 UTC，再查出該時刻實際的偏移
+    candidate = wall - standard
+    idx = np.searchsorted(at, candidate, side='right')
+    return wall - offsets[idx]
+
+
+def _to_datetime64(dt):
+    if isinstance(dt, np.datetime64):
+        return dt.astype('datetime64[s]')
+    if dt.tzinfo is None:
+        dt = dt.astimezone()  # naive = 主機當地時間
+    return np.datetime64(dt.astimezone(timezone.utc).replace(tzinfo=None), 's')
+
+
+def get_event_schedule(start, end, events=None):
+    """
+    以封閉公式計算 [start, end) 期間內所有噴泉 / 奶奶 / 海龜的發生時間 (含進行中的場次)。
+    start / end 可為 datetime (naive 視為主機當地時間) 或 numpy.datetime64 (UTC)。
+
+    回傳 struct-of-arrays：
+        { 'geyser': {'start': datetime64[s][], 'end': datetime64[s][]}, ... }  (UTC)
+    事件以洛杉磯時間的偶數小時為基準，與主機時區無關，整段期間只需一次向量化運算。
+    """
+    if events is None:
+        events = EVENTS
+    start_utc = _to_datetime64(start)
+    end_utc = _to_datetime64(end)
+
+    # 以洛杉磯當地時間的日界為起點，每 2 小時一格；前後各多留一天以涵蓋時差與進行中的場次
+    wall_lo = (start_utc + PST_OFFSET).astype('datetime64[D]') - np.timedelta64(1, 'D')
+    wall_hi = (end_utc + PDT_OFFSET).astype('datetime64[D]') + np.timedelta64(1, 'D')
+    slots = np.arange(wall_lo.astype('datetime64[s]'), wall_hi.astype('datetime64[s]'),
+                      np.timedelta64(EVENT_PERIOD_HOURS, 'h'))
+
+    result = {}
+    for key, info in events.items():
+        starts = _sky_wall_to_utc(slots + np.timedelta64(info['minute'], 'm'))
+        ends = starts + np.timedelta64(info['duration'], 'm')
+        mask = (ends > start_utc) & (starts < end_utc)
+        result[key] = {'start': starts[mask], 'end': ends[mask]}
+    return result
+
 
 def get_event_times():
     """
     計算下一次 噴泉 (Geyser)、奶奶 (Grandma)、海龜 (Turtle) 的時間與倒數。
-    規則：
-    - 冬令 (標準時間)：偶數小時 (0, 2, ...)。
-    - 夏令 (DST)：奇數小時 (1, 3, ...)。
-    
+    規則：洛杉磯時間的偶數小時 (換算台灣時間：冬令為偶數小時、夏令為奇數小時)。
+
     偏移量 (分)：
     - 噴泉: 05 分
     - 奶奶: 35 分
     - 海龜: 50 分
     """
-    now = datetime.now()
-    dst = is_dst(now)
-    
-    # 基準小時：冬令為 0, 2, 4...；夏令為 1, 3, 5...
-    start_offset = 1 if dst else 0 
-    
-    # 事件定義
-    events = {
-        'geyser': {'minute': 5, 'duration': 10},
-        'grandma': {'minute': 35, 'duration': 10},
-        'turtle': {'minute': 50, 'duration': 10}
-    }
-    
+    now = datetime.now().astimezone()
+    # 事件每 2 小時一次，往後 3 小時內必有下一場 (或正在進行的場次)
+    schedule = get_event_schedule(now, now + timedelta(hours=EVENT_PERIOD_HOURS + 1))
+
     result = {}
-    
-    for key, info in events.items():
-        minute_trigger = info['minute']
-        duration = info['duration']
-        
-        # 尋找下一次發生時間
-        # 檢查當前小時、下一小時、下下小時以找到第一個符合的時間點
-        
-        current_h = now.hour
-        
-        found_next = None
-        
-        for i in range(24): # 檢查接下來 24 小時
-            h = (current_h + i) % 24
-            
-            # 檢查這個小時是否為有效的事件小時
-            # 邏輯: (h % 2) == 1 (夏令), == 0 (冬令)
-            is_event_hour = (h % 2) == start_offset
-            
-            if is_event_hour:
-                # 建構候選時間
-                
-                # 正確方法:
-                # 1. 從當前時間的整點開始
-                base = now.replace(minute=0, second=0, microsecond=0)
-                target = base + timedelta(hours=i)
-                target = target.replace(minute=minute_trigger)
-                
-                if target > now:
-                    found_next = target
-                    break
-                elif target <= now < (target + timedelta(minutes=duration)):
-                     # 進行中!
-                     # 為了簡單起見，我們回傳這個「正在進行」的事件開始時間。
-                     found_next = target # 開始時間
-                     break
-        
-        if found_next:
-            # 格式化下一次時間
-            next_str = found_next.strftime("%H:%M")
-            
-            # 格式化倒數計時
-            diff = found_next - now
-            total_seconds = int(diff.total_seconds())
-            
-            hours = total_seconds // 3600
-            minutes = (total_seconds % 3600) // 60
-            seconds = total_seconds % 60
-            
-            countdown_str = f"{hours}小時 {minutes}分 {seconds}秒"
-            
-            result[key] = {'next': next_str, 'countdown': countdown_str}
-            
+
+    for key, times in schedule.items():
+        if not len(times['start']):
+            continue
+
+        # 第一筆即為下一次 (或進行中) 的事件開始時間
+        found_next = times['start'][0].astype(datetime).replace(tzinfo=timezone.utc).astimezone()
+
+        # 格式化下一次時間
+        next_str = found_next.strftime("%H:%M")
+
+        # 格式化倒數計時 (進行中的事件為 0)
+        total_seconds = max(0, int((found_next - now).total_seconds()))
+
+        hours = total_seconds // 3600
+        minutes = (total_seconds % 3600) // 60
+        seconds = total_seconds % 60
+
+        countdown_str = f"{hours}小時 {minutes}分 {seconds}秒"
+
+        result[key] = {'next': next_str, 'countdown': countdown_str}
+
     return result
 
 if __name__ == "__main__":
@@ -0,0 +1,103 @@
+# 建置 / 爬蟲設定
+
+# 碎石資料來源："local" = shard_pred 本地推算 (預設)，"site" = 逐日爬取 sky-shards.pages.dev
+SHARD_SOURCE = "local"
+
+# 本地推算後，是否再開啟網站核對當天結果 (並取得地圖圖片)
+SHARD_CROSS_CHECK = True
+
+# 網站版碎石預報：同時查詢的日期數 (共用頁面數量上限) 與往後查詢的天數
+SHARD_LOOKAHEAD_CONCURRENCY = 4
+SHARD_LOOKAHEAD_DAYS = 7
+
+# SkyCrawler 共用頁面池的最大頁面數
+PAGE_POOL_MAX_SIZE = 4
+
+# 爬蟲資源封鎖規則 (BrowserContext 層級)
+# key 為來源網域 (以頁面網址判斷)；types 為允許的資源類型，hosts 為允許的請求網域 (含子網域)。
+# 只需要伺服器端 HTML 的來源只放行 document：圖片網址仍可從 src / data-src 屬性取得。
+RESOURCE_POLICIES = {
+    "sky-shards.pages.dev": {
+        # SPA：需要腳本與樣式 (innerText 依賴 CSS 的顯示狀態)
+        "types": ["document", "script", "stylesheet", "xhr", "fetch"],
+        "hosts": ["sky-shards.pages.dev"],
+    },
+    "9-bit.jp": {
+        "types": ["document"],
+        "hosts": ["9-bit.jp"],
+    },
+    "fandom.com": {
+        # #mw-content-text 由伺服器輸出，只需要 HTML 本身
+        "types": ["document"],
+        "hosts": ["sky-children-of-the-light.fandom.com"],
+    },
+}
+
+# 沒有對應規則的頁面：只封鎖這些類型
+DEFAULT_BLOCKED_TYPES = ["font", "media", "websocket"]
+
+# 共用 aiohttp 連線池 (總連線數 / 每個主機的連線數)
+HTTP_MAX_CONNECTIONS = 16
+HTTP_MAX_CONNECTIONS_PER_HOST = 8
+
+# 大蠟燭圖片下載：同時下載數、重試次數與退避基準秒數
+IMAGE_DOWNLOAD_CONCURRENCY = 8
+IMAGE_DOWNLOAD_RETRIES = 3
+IMAGE_DOWNLOAD_BACKOFF = 0.5
+
+# 任務翻譯記憶 (持久化檔案與行程內 LRU 大小)；state/ 由每日 workflow 存在 Actions cache
+TRANSLATION_MEMORY_PATH = "state/translation_memory.json"
+TRANSLATION_LRU_SIZE = 512
+
+# 與 index.html 一同輸出的預先計算排程 (時鐘事件、碎石區間、大蠟燭輪替) 涵蓋天數
+SCHEDULE_PATH = "schedule.json"
+SCHEDULE_DAYS = 7
+
+# 內容雜湊命名的樣式與腳本輸出目錄 (static/app.<hash>.css / .js，可永久快取)
+STATIC_DIR = "static"
+
+# 頁面輪詢的資料檔 (If-None-Match 條件式請求，有新版本時在瀏覽器端重畫卡片) 與輪詢間隔 (秒)
+DATA_PATH = "data.json"
+DATA_POLL_SECONDS = 300
+
+# 輸出檔清單 (大小、SHA-256、預先壓縮的 .gz / .br 大小)
+MANIFEST_PATH = "manifest.json"
+
+# 建置追蹤報告 (各階段耗時、傳輸量、重試與快取命中)
+BUILD_REPORT_PATH = "build_report.json"
+
+# 各來源的時間預算 (秒)：逾時即取消並改用備援值 (碎石改用本地推算)；
+# BUILD_DEADLINE 為整個抓取階段的上限，fandom 為 Fandom 頁面載入的逾時
+SOURCE_TIMEOUTS = {
+    "shards": 60,
+    "dailies": 150,
+    "clock": 5,
+    "fandom": 45,
+}
+BUILD_DEADLINE = 180
+
+# 最後成功結果的快照 (來源失敗時以舊資料顯示並標示)：ttl 內為新鮮，max_stale 內仍可作為備援 (秒)
+SNAPSHOT_PATH = "state/snapshots.json"
+SNAPSHOT_TTLS = {
+    "dailies": 12 * 3600,
+    "fandom": 7 * 86400,
+}
+SNAPSHOT_MAX_STALE = {
+    "dailies": 36 * 3600,
+    "fandom": 60 * 86400,
+}
+
+# 每次建置結果的歷史紀錄 (SQLite，只新增)；state/ 由每日 workflow 存在 Actions cache
+HISTORY_PATH = "state/history.sqlite3"
+
+# 常駐模式 (auto_build.py serve)：碎石於 Sky 重置後 SKY_RESET_REFRESH_DELAY 秒更新；
+# 9-bit 每日文章於重置後 DAILY_POST_DELAY 秒抓取，尚未更新時每 DAILY_POST_RETRY_INTERVAL 秒重試 (最多 DAILY_POST_MAX_RETRIES 次)
+SKY_RESET_REFRESH_DELAY = 60
+DAILY_POST_DELAY = 30 * 60
+DAILY_POST_RETRY_INTERVAL = 15 * 60
+DAILY_POST_MAX_RETRIES = 8
+SERVE_HOST = "127.0.0.1"
+SERVE_PORT = 8000
+
+# 離線 fixture：auto_build --record 錄製各來源的 HAR 與 HTTP 回應，--replay 完全不連網重播
+FIXTURE_DIR = "fixtures"
@@ -1,17 +1,126 @@
 import asyncio
+import functools
 from playwright.async_api import async_playwright
 import re
 from datetime import datetime, timedelta
 import os
+import aiohttp
 import candle_data
+import config
+import fixtures
+import image_downloader
+import image_opt
+import nine_bit
+import shard_pred
+import tracing
+from page_pool import PagePool
+from resource_policy import ResourcePolicy
+from snapshot_store import SnapshotStore
+from translation_memory import TranslationMemory
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
+
+def describe_shard_status(parsed_events, current_dt):
+    """
+    由爆發時段 [(start_dt, end_dt, start_raw, end_raw), ...] 計算目前/下一場的時間區間與狀態文字。
+    """
+    parsed_events.sort(key=lambda x: x[0])
+
+    upcoming_range = "無"
+    remaining = ""
+    active_event = False
+    future_event = False
+
+    if parsed_events:
+        # Logic: Find first Active OR first Future
+        for s, e, s_raw, e_raw in parsed_events:
+            if s <= current_dt <= e:
+                # Active
+                diff = e - current_dt
+                total_seconds = int(diff.total_seconds())
+                h = total_seconds // 3600
+                m = (total_seconds % 3600) // 60
+                s_sec = total_seconds % 60
+                remaining = f"進行中! 距離結束: {h}小時 {m}分 {s_sec}秒"
+                upcoming_range = f"{s_raw} - {e_raw}"
+                active_event = True
+                break
+            elif current_dt < s:
+                # Future
+                if not future_event:
+                    diff = s - current_dt
+                    total_seconds = int(diff.total_seconds())
+                    h = total_seconds // 3600
+                    m = (total_seconds % 3600) // 60
+                    s_sec = total_seconds % 60
+                    remaining = f"距離開始: {h}小時 {m}分 {s_sec}秒"
+                    upcoming_range = f"{s_raw} - {e_raw}"
+                    future_event = True
+                    break
+
+        # If neither active nor future found, and we have events, assume ended
+        if not active_event and not future_event:
+            # Calculate time since last eruption ended
+            last_end = parsed_events[-1][1]
+            if current_dt > last_end:
+                diff = current_dt - last_end
+                total_seconds = int(diff.total_seconds())
+                h = total_seconds // 3600
+                m = (total_seconds % 3600) // 60
+                s_sec = total_seconds % 60
+                remaining = f"今日爆發已結束 (已過 {h}小時 {m}分 {s_sec}秒)"
+            else:
+                remaining = "今日所有爆發已結束" # Fallback if time mismatch
+
+            upcoming_range = f"{parsed_events[-1][2]} - {parsed_events[-1][3]}"
+    else:
+        remaining = "無時間數據"
+
+    return upcoming_range, remaining
+
 
 class SkyCrawler:
-    def __init__(self):
+    def __init__(self, shard_source=None, shard_cross_check=None, page_pool_size=None, fixture_mode=None, fixture_dir=None,
+                 out_dir="."):
         self.browser = None
         self.context = None
         self.page = None
+        self.pages = None
+        self.http = None
+        self.resource_policy = ResourcePolicy(config.RESOURCE_POLICIES, config.DEFAULT_BLOCKED_TYPES)
+        self.translation_memory = TranslationMemory(config.TRANSLATION_MEMORY_PATH, lru_size=config.TRANSLATION_LRU_SIZE)
+        self.snapshots = SnapshotStore(config.SNAPSHOT_PATH, config.SNAPSHOT_TTLS, config.SNAPSHOT_MAX_STALE)
+        self.page_pool_size = page_pool_size or config.PAGE_POOL_MAX_SIZE
+        self.shard_source = shard_source or config.SHARD_SOURCE
+        self.shard_cross_check = config.SHARD_CROSS_CHECK if shard_cross_check is None else shard_cross_check
+        # None: live sites; "record" / "replay": see fixtures.py
+        if fixture_mode not in (None,) + fixtures.MODES:
+            raise ValueError(f"Unknown fixture mode: {fixture_mode}")
+        self.fixture_mode = fixture_mode
+        self.fixture_dir = fixture_dir or config.FIXTURE_DIR
+        # 網站輸出目錄：圖片存到 out_dir/images，頁面中的路徑相對於 out_dir
+        self.out_dir = out_dir
+
+    def _open_http(self):
+        """
+        Shared HTTP session for browser-free fetches (server-rendered pages).
+        Independent of the browser, so the static paths still work when Chromium fails to launch.
+        """
+        if self.fixture_mode == fixtures.REPLAY:
+            return fixtures.FixtureSession(fixtures.FixtureStore(self.fixture_dir), fixtures.REPLAY)
+        connector = aiohttp.TCPConnector(
+            limit=config.HTTP_MAX_CONNECTIONS,
+            limit_per_host=config.HTTP_MAX_CONNECTIONS_PER_HOST
+        )
+        http = aiohttp.ClientSession(headers={"User-Agent": USER_AGENT}, connector=connector)
+        if self.fixture_mode == fixtures.RECORD:
+            http = fixtures.FixtureSession(fixtures.FixtureStore(self.fixture_dir), fixtures.RECORD, session=http)
+        return http
 
     async def start(self):
+        # HTTP first: a browser launch failure must not take the static fetches down with it
+        if self.http is None:
+            self.http = self._open_http()
         self.playwright = await async_playwright().start()
         # Launch with arguments to hide automation and improve stability
         self.browser = await self.playwright.chromium.launch(
@@ -29,7 +138,7 @@ class SkyCrawler:
             ]
         )
         self.context = await self.browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+            user_agent=USER_AGENT,
             viewport={'width': 1366, 'height': 768},
             locale='zh-TW',
             timezone_id='Asia/Taipei'
@@ -38,15 +147,44 @@ class SkyCrawler:
         # Add stealth scripts
         await self.context.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
 
+        # Record / replay per-source HAR fixtures (must be installed before the resource policy)
+        if self.fixture_mode:
+            print(f"Fixture mode: {self.fixture_mode} ({self.fixture_dir})")
+            await fixtures.install_har_routes(self.context, self.fixture_dir, list(config.RESOURCE_POLICIES), self.fixture_mode)
+
+        # Block images, ads, trackers and fonts per source for every navigation
+        await self.resource_policy.install(self.context)
+
+        # Warm pages shared by every fetch method (checkout / return)
+        self.pages = PagePool(self.context, max_size=self.page_pool_size, tracer=tracing.TRACER)
+
     async def stop(self):
+        if self.resource_policy.stats:
+            print("Crawler network usage:\n" + self.resource_policy.summary())
+            tracing.TRACER.merge("network", self.resource_policy.stats)
+        tracing.TRACER.merge("translation", self.translation_memory.stats)
         try:
+            print(self.translation_memory.summary())
+            print(self.snapshots.summary())
+            # Replay runs must not touch the persistent state
+            if self.fixture_mode != fixtures.REPLAY:
+                self.translation_memory.save()
+                self.snapshots.save()
+        except Exception as e:
+            print(f"Translation memory save error: {e}")
+        try:
+            if self.http:
+                http, self.http = self.http, None
+                await http.close()
+            if self.pages:
+                await self.pages.close()
             if self.context:
                 await self.context.close()
             if self.browser:
                 await self.browser.close()
             if hasattr(self, 'playwright'):
                 await self.playwright.stop()
-        except:
+        except Exception:
             pass
 
     async def _take_screenshot(self, page, name):
@@ -60,7 +198,7 @@ class SkyCrawler:
     async def get_shards_info(self):
         page = None
         try:
-            page = await self.context.new_page()
+            page = await self.pages.acquire()
             await page.goto('https://sky-shards.pages.dev/zh-TW', wait_until='domcontentloaded')
             
             # 1. Check Date match
@@ -70,7 +208,7 @@ class SkyCrawler:
             # Wait for content
             try:
                 await page.wait_for_selector('.shard-Countdown', timeout=5000)
-            except:
+            except Exception:
                 pass
 
             data = await page.evaluate('''() => {
@@ -154,74 +292,225 @@ class SkyCrawler:
         except Exception as e:
             print(f"獲取碎石資訊錯誤: {e}")
             return None
+        finally:
+            if page: await self.pages.release(page)
 
     async def get_shards_prediction(self):
         """
         獲取碎石預報：如果今天沒有，則尋找下一場。
+        預設以 shard_pred 本地推算，網站只用於 (可選的) 當日核對。
         """
-        # 1. Try today
-        today = datetime.now()
-        today_info = await self.get_shards_info_by_date(today)
-        
-        if not today_info:
-            return None
-            
-        if not today_info.get('is_no_shard', False):
-            # Today HAS a shard. Check if it is fully ended.
-            remaining_text = today_info.get('remaining', '')
-            if "已結束" in remaining_text:
-                # If ended, the user wants to see Tomorrow's shard immediately (Next Reset).
+        if self.shard_source == "site":
+            return await self._get_shards_prediction_from_site()
+
+        try:
+            info, day = self._predict_shards()
+        except Exception as e:
+            print(f"本地碎石推算錯誤: {e}，改為爬取網站")
+            return await self._get_shards_prediction_from_site()
+
+        if self.shard_cross_check and not info.get('is_no_shard', False):
+            await self._cross_check_shard(info, day)
+        return info
+
+    def _shard_result(self, pred, now):
+        """
+        將 shard_pred 的推算結果轉為與網站解析相同格式的 dict。
+        """
+        desc = shard_pred.describe(pred)
+        if not pred['have_shard']:
+            return {
+                "type": desc['type'],
+                "map": desc['map'],
+                "rewards": desc['rewards'],
+                "time_range": "無",
+                "remaining": "",
+                "eruptions": [],
+                "image_url": None,
+                "realm": desc['realm'],
+                "date": pred['date'].isoformat(),
+                "is_no_shard": True
+            }
+
+        parsed_events = []
+        for occ, eruption in zip(pred['occurrences'], desc['eruptions']):
+            raw_s, raw_e = [t.strip() for t in eruption.split('-')]
+            parsed_events.append((occ['land'], occ['end'], raw_s, raw_e))
+        upcoming_range, remaining = describe_shard_status(parsed_events, now)
+
+        return {
+            "type": desc['type'],
+            "map": desc['map'],
+            "dateText": desc['dateText'],
+            "rewards": desc['rewards'],
+            "time_range": upcoming_range,
+            "remaining": remaining,
+            "eruptions": desc['eruptions'],
+            "image_url": None,
+            "realm": desc['realm'],
+            "date": pred['date'].isoformat(),
+            "is_no_shard": False
+        }
+
+    def get_local_shards_prediction(self):
+        """
+        只用本地推算的碎石預報 (不開頁面、不交叉比對)，供抓取失敗時備援。
+        """
+        info, _ = self._predict_shards()
+        return info
+
+    def _predict_shards(self):
+        """
+        本地版的 get_shards_prediction 流程 (今日 -> 明日 -> 往後 7 天)，不需開啟任何頁面。
+        回傳 (result, sky_date)。
+        """
+        now = datetime.now(shard_pred.DISPLAY_TZ)
+        today = shard_pred.sky_today(now)
+        today_pred = shard_pred.get_shard_info(today)
+        today_info = self._shard_result(today_pred, now)
+
+        if today_pred['have_shard']:
+            if now > today_pred['occurrences'][-1]['end']:
+                # Today's eruptions are all over -> show the next reset's shard
                 print("今日碎石已結束，查詢明日預報...")
                 next_date = today + timedelta(days=1)
-                tomorrow_info = await self.get_shards_info_by_date(next_date)
-                
-                if tomorrow_info and not tomorrow_info.get('is_no_shard', False):
-                    # Found tomorrow's shard. Return IT instead of today's ended card.
-                    # We might want to label it as "明日" (Tomorrow) clearly.
+                tomorrow_pred = shard_pred.get_shard_info(next_date)
+                if tomorrow_pred['have_shard']:
+                    tomorrow_info = self._shard_result(tomorrow_pred, now)
                     date_str = next_date.strftime('%Y年%m月%d日')
                     tomorrow_info['dateText'] = f"{date_str} (明日預報)"
                     tomorrow_info['remaining'] = f"預報: 明日 {tomorrow_info['remaining']}"
-                    return tomorrow_info
-            
-            # If not ended, or tomorrow no shard, return Today's info
-            return today_info
-            
-        # 2. If no shard today, look ahead (max 7 days)
+                    return tomorrow_info, next_date
+            return today_info, today
+
         print("今天無碎石，正在查詢預報...")
-        for i in range(1, 8):
-            next_date = today + timedelta(days=i)
-            # URL Format: https://sky-shards.pages.dev/zh-TW/2026/01/05
-            print(f"查詢日期: {next_date.strftime('%Y-%m-%d')}")
-            info = await self.get_shards_info_by_date(next_date)
-            
-            if info and not info.get('is_no_shard', False):
-                # Found next shard
-                # Update status to indicate it's a forecast
-                date_str = next_date.strftime('%Y年%m月%d日')
-                info['type'] = f"{info['type']} (預報: {date_str})"
-                info['remaining'] = f"下一場: {date_str}"
-                return info
-                
-        # If nothing found in 7 days (unlikely)
-        return today_info
+        next_pred = shard_pred.find_next_shard(today + timedelta(days=1), max_days=6)
+        if next_pred:
+            info = self._shard_result(next_pred, now)
+            date_str = next_pred['date'].strftime('%Y年%m月%d日')
+            info['type'] = f"{info['type']} (預報: {date_str})"
+            info['remaining'] = f"下一場: {date_str}"
+            return info, next_pred['date']
+
+        return today_info, today
+
+    async def _cross_check_shard(self, info, day):
+        """
+        以網站核對本地推算 (單次導覽)，並補上網站提供的地圖圖片。
+        """
+        site_info = await self.get_shards_info_by_date(day)
+        if not site_info:
+            print("碎石核對: 無法取得網站資料，使用本地推算")
+            return
+
+        if site_info.get('is_no_shard', False):
+            print(f"碎石核對: 網站顯示 {day} 無碎石，與本地推算不符")
+            return
+
+        predicted_red = "Red" in info['type']
+        site_red = "Red" in site_info.get('type', '')
+        if "未知" not in site_info.get('type', '') and predicted_red != site_red:
+            print(f"碎石核對: 類型不符 (本地: {info['type']}, 網站: {site_info.get('type')})")
 
-    async def get_shards_info_by_date(self, target_date=None):
+        info['image_url'] = site_info.get('image_url')
+
+    async def _get_shards_prediction_from_site(self):
+        """
+        網站版碎石預報：逐日開啟 sky-shards.pages.dev 查詢。
+        """
+        today = datetime.now()
+        # Today decides everything: the lookahead days are only fetched when today has
+        # no shard (fan out 1..N over the page pool) or today's shard has ended (tomorrow only).
+        probes = self._probe_shard_days(today, [0])
+        try:
+            # 1. Try today
+            today_info = await probes[0]
+
+            if not today_info:
+                return None
+
+            if not today_info.get('is_no_shard', False):
+                # Today HAS a shard. Check if it is fully ended.
+                remaining_text = today_info.get('remaining', '')
+                if "已結束" in remaining_text:
+                    # If ended, the user wants to see Tomorrow's shard immediately (Next Reset).
+                    print("今日碎石已結束，查詢明日預報...")
+                    next_date = today + timedelta(days=1)
+                    probes += self._probe_shard_days(today, [1])
+                    tomorrow_info = await probes[1]
+
+                    if tomorrow_info and not tomorrow_info.get('is_no_shard', False):
+                        # Found tomorrow's shard. Return IT instead of today's ended card.
+                        # We might want to label it as "明日" (Tomorrow) clearly.
+                        date_str = next_date.strftime('%Y年%m月%d日')
+                        tomorrow_info['dateText'] = f"{date_str} (明日預報)"
+                        tomorrow_info['remaining'] = f"預報: 明日 {tomorrow_info['remaining']}"
+                        return tomorrow_info
+
+                # If not ended, or tomorrow no shard, return Today's info
+                return today_info
+
+            # 2. If no shard today, look ahead (max 7 days)
+            print("今天無碎石，正在查詢預報...")
+            probes += self._probe_shard_days(today, range(1, config.SHARD_LOOKAHEAD_DAYS + 1))
+            for i in range(1, len(probes)):
+                next_date = today + timedelta(days=i)
+                info = await probes[i]
+
+                if info and not info.get('is_no_shard', False):
+                    # Found next shard
+                    # Update status to indicate it's a forecast
+                    date_str = next_date.strftime('%Y年%m月%d日')
+                    info['type'] = f"{info['type']} (預報: {date_str})"
+                    info['remaining'] = f"下一場: {date_str}"
+                    return info
+
+            # If nothing found in 7 days (unlikely)
+            return today_info
+        finally:
+            # Cancel the requests still in flight, then release the pages
+            for task in probes:
+                task.cancel()
+            await asyncio.gather(*probes, return_exceptions=True)
+
+    def _probe_shard_days(self, base_date, offsets):
+        """
+        同時查詢多個日期的碎石資訊。
+        同時請求數由 config.SHARD_LOOKAHEAD_CONCURRENCY 限制，頁面由共用頁面池借出並重複使用。
+        回傳依 offsets 排序的 tasks；呼叫端負責取消未完成的 tasks。
+        """
+        offsets = list(offsets)
+        semaphore = asyncio.Semaphore(max(1, min(config.SHARD_LOOKAHEAD_CONCURRENCY, len(offsets))))
+
+        async def probe(offset):
+            async with semaphore:
+                async with self.pages.page() as page:
+                    target_date = base_date + timedelta(days=offset)
+                    # URL Format: https://sky-shards.pages.dev/zh-TW/2026/01/05
+                    print(f"查詢日期: {target_date.strftime('%Y-%m-%d')}")
+                    return await self.get_shards_info_by_date(target_date, page=page)
+
+        return [asyncio.create_task(probe(o)) for o in offsets]
+
+    async def get_shards_info_by_date(self, target_date=None, page=None):
         """
         Helper to get shard info for a specific date (or today/default).
+        If a page is given it is used as-is and stays checked out by the caller.
         """
-        page = None
+        own_page = page is None
         try:
             url = 'https://sky-shards.pages.dev/zh-TW'
             if target_date:
                 # Format: /YYYY/MM/DD, e.g. /2026/01/05
                 url = f"https://sky-shards.pages.dev/zh-TW/{target_date.year}/{target_date.month:02d}/{target_date.day:02d}"
                 
-            page = await self.context.new_page()
+            if own_page:
+                page = await self.pages.acquire()
             await page.goto(url, wait_until='domcontentloaded')
             
             try:
                 await page.wait_for_selector('.shard-Countdown', timeout=3000)
-            except:
+            except Exception:
                 pass
 
             data = await page.evaluate('''() => {
@@ -388,58 +677,7 @@ class SkyCrawler:
                         parsed_events.append((start_dt, end_dt, raw_s, raw_e))
                         valid_eruptions.append(f"{raw_s} - {raw_e}")
             
-            parsed_events.sort(key=lambda x: x[0])
-            
-            upcoming_range = "無"
-            remaining = ""
-            active_event = False
-            future_event = False
-            
-            if parsed_events:
-                # Logic: Find first Active OR first Future
-                for s, e, s_raw, e_raw in parsed_events:
-                    if s <= current_dt <= e:
-                        # Active
-                        diff = e - current_dt
-                        total_seconds = int(diff.total_seconds())
-                        h = total_seconds // 3600
-                        m = (total_seconds % 3600) // 60
-                        s_sec = total_seconds % 60
-                        remaining = f"進行中! 距離結束: {h}小時 {m}分 {s_sec}秒"
-                        upcoming_range = f"{s_raw} - {e_raw}"
-                        active_event = True
-                        break
-                    elif current_dt < s:
-                        # Future
-                        if not future_event:
-                            diff = s - current_dt
-                            total_seconds = int(diff.total_seconds())
-                            h = total_seconds // 3600
-                            m = (total_seconds % 3600) // 60
-                            s_sec = total_seconds % 60
-                            remaining = f"距離開始: {h}小時 {m}分 {s_sec}秒"
-                            upcoming_range = f"{s_raw} - {e_raw}"
-                            future_event = True
-                            break
-                
-                # If neither active nor future found, and we have events, assume ended
-                if not active_event and not future_event:
-                    # Calculate time since last eruption ended
-                    last_end = parsed_events[-1][1]
-                    if current_dt > last_end:
-                        diff = current_dt - last_end
-                        total_seconds = int(diff.total_seconds())
-                        h = total_seconds // 3600
-                        m = (total_seconds % 3600) // 60
-                        s_sec = total_seconds % 60
-                        remaining = f"今日爆發已結束 (已過 {h}小時 {m}分 {s_sec}秒)"
-                    else:
-                        remaining = "今日所有爆發已結束" # Fallback if time mismatch
-                        
-                    upcoming_range = f"{parsed_events[-1][2]} - {parsed_events[-1][3]}"
-            else:
-                 if not valid_eruptions:
-                     remaining = "無時間數據"
+            upcoming_range, remaining = describe_shard_status(parsed_events, current_dt)
 
             # Date Correction Logic
             try:
@@ -474,7 +712,7 @@ class SkyCrawler:
             print(f"Error fetching shard date {target_date}: {e}")
             return None
         finally:
-            if page: await page.close()
+            if own_page and page: await self.pages.release(page)
 
     # Alias for compatibility if needed, but we should switch to get_shards_prediction in GUI
     async def get_shards_info(self):
@@ -483,7 +721,7 @@ class SkyCrawler:
     async def get_daily_quests(self):
         page = None
         try:
-            page = await self.context.new_page()
+            page = await self.pages.acquire()
             # 1. Access 9-bit SkyGold
             await page.goto("https://9-bit.jp/skygold/", wait_until="domcontentloaded")
             
@@ -582,182 +820,21 @@ class SkyCrawler:
             print(f"獲取每日任務錯誤: {e}")
             return []
         finally:
-            if page: await page.close()
+            if page: await self.pages.release(page)
 
     def translate_quest(self, text):
         """
-        Translates Japanese Sky quests to Traditional Chinese.
+        Translates Japanese Sky quests to Traditional Chinese (see translator.py).
+        Known sentences come straight from the translation memory.
         """
-        # [Merged] Map Locations & Terms (Sorted by length to avoid partial replace)
-        terms = {
-            # Specific Daily Overrides (High Priority - Full Sentence)
-            '捨てられた地の墓所で瞑想する': '在暮土的墓園裡冥想',
-            '捨てられた地の墓所にある焚火を訪れる': '前往暮土的墓園找到篝火',
-            
-            # Vault Specific
-            '書庫で虹のキャンドルを見つける': '找到禁閣的彩虹蠟燭',
-            '書庫の4階で３つの光を捕まえる': '在禁閣上層捕捉四散的光', # Exact match for 9-bit text
-            '書庫の4階で光をつかまえる': '在禁閣上層捕捉四散的光', # Custom mapping for broken JP
-            '書庫で祈る侍者の記憶を呼び起こす': '重溫祈禱聖徒在禁閣的記憶',
-            '虹': '彩虹', # Explicitly adding it here since grep failed, but I will strip double later
-            
-            # Additional broken terms observed in user screenshots
-            '虹のキャンドル': '彩虹蠟燭', 
-            '見つける': '找到',
-            '4階': '四樓', 
-            '祈る侍者': '祈禱聖徒',
-            '３つの': '3個', # Generic quantity fix
-
-            # Locations
-            '孤島': '晨島', '草原': '雲野', '雨林': '雨林', '峡谷': '霞谷', 
-            '捨てられた地': '暮土', '書庫': '禁閣',
-
-            # Meta
-            'クエスト': '任務', 'デイリー': '每日', 
-            
-            # Spirits (Examples - need to be generic or extensive)
-            '採集者': '收集者', '光採取者': '光芒收集者', '採取者': '收集者',
-            '日光浴者': '日光浴者', 
-            '笑う': '偷笑', 'ダブルタッチ': '擊掌', 'くつろぐ': '放鬆',
-            
-            # Common Terms
-            '精霊': '先祖', 'フレンド': '好友', 'プレイヤー': '玩家',
-            'キャンドル': '蠟燭', '星のキャンドル': '昇華蠟燭',
-            'シーズンキャンドル': '季節蠟燭',
-            '赤色の光': '紅光', '青色の光': '藍光', '水色の光': '青光', '緑色の光': '綠光', '紫色の光': '紫光', '橙色の光': '橙光',
-            '光の探求者': '光之探求者',
-
-            'ハイタッチ': '擊掌', 'ハグ': '擁抱', 'おんぶ': '背背', 'チャット': '聊天',
-            'ジェスチャー': '動作', '使用する': '使用',
-            
-            # Specific Translation Updates
-            '雨林で光をつかまえる': '抓住雨林之光',
-            '光のキノコにエナジーを回復してもらう': '透過光菇重新恢復能量',
-            '雨林の雨が途切れる地で瞑想する': '在樹林高處冥想',
-            '雨が途切れる地': '樹林高處',
-            '大樹の案内人の食卓を整える': '整理大樹嚮導(歸屬季)的長桌',
-            '雨林の高台広場にある想いを編む先祖の食卓を片付ける': '在雨林的樹林高處整理歸屬季的先祖圓桌',
-            '高台広場': '樹林高處', 'にある': '在',
-            '想いを編む': '歸屬季的', '先祖の食卓': '先祖圓桌', 'を片付ける': '整理',
-            '食卓': '長桌/餐桌', '整える': '整理/打掃', 
-            'テーブル': '長桌',
-            
-            # Valley Quests (Valley of Triumph) - User Match
-            # Specific Full Sentence Matches (User Standard)
-            # Valley (User Verified)
-            '峡谷を訪れしばしの間若木を愛でる': '欣賞一下霞谷小樹苗',
-            '峡谷で光をつかまえる': '抓住霞谷之光',
-            '峡谷で精霊の記憶を呼び起こす': '重溫一位霞谷先靈的記憶',
-            
-            # Wasteland
-            '捨てられた地を訪れしばしの間若木を愛でる': '欣賞一下暮土小樹苗',
-            '捨てられた地で光をつかまえる': '抓住暮土之光',
-            '捨てられた地で精霊の記憶を呼び起こす': '重溫一位暮土先靈的記憶',
-            '墓場で精霊の記憶を呼び起こす': '重溫一位暮土先靈的記憶',
-            
-            # Forest
-            '雨林を訪れしばしの間若木を愛でる': '欣賞一下雨林小樹苗',
-            '雨林で光をつかまえる': '抓住雨林之光',
-            '雨林で精霊の記憶を呼び起こす': '重溫一位雨林先靈的記憶',
-            
-            # Prairie
-            '草原を訪れしばしの間若木を愛でる': '欣賞一下雲野小樹苗',
-            '草原で光をつかまえる': '抓住雲野之光',
-            '草原で精霊の記憶を呼び起こす': '重溫一位雲野先靈的記憶',
-            
-            # Vault
-            '書庫を訪れしばしの間若木を愛でる': '欣賞一下禁閣小樹苗',
-            '書庫で光をつかまえる': '抓住禁閣之光',
-            '書庫で精霊の記憶を呼び起こす': '重溫一位禁閣先靈的記憶',
-
-            '精霊の記憶を呼び起こす': '重溫一位先靈的記憶', # Generic Fallback
-            '20本のキャンドルに火を灯す': '點亮 20 根蠟燭', 
-            'キャンドルに火を灯す': '點亮蠟燭',
-            '20本': '20根', 
-            '本': '根',
-            
-            # General patterns
-            'エナジー': '能量', '回復する': '恢復', '回復': '恢復',
-            'してもらう': '', 'をつかまえる': '抓住',
-            '神殿': '神廟', '広場': '廣場', '参道': '參道',
-            '小川': '小溪', 'ツリーハウス': '樹屋', 
-            'する': '', # Remove generic "do" verb suffix
-            
-            # Quest Types - Precise Mapping
-            '記憶を呼び起こすクエスト': '重溫先祖美好回憶', 
-            '記憶を呼び起こす': '重溫先祖美好回憶',
-            '追体験': '重溫先祖美好回憶',
-            
-            '光をつかまえる': '抓住之光', 
-            '雨林の光': '雨林之光',
-            'の光をつかまえる': '之光',
-            
-            '集める': '收集30滴燭火',
-            '灯りを': '點燃', '灯す': '點燃', 
-            '瞑想': '冥想', 
-            'スケーター': '滑冰者', 
-
-            
-            # Spirits (Raw Debug Matches)
-            '笑う光採取者': '偷笑光芒收集者', 
-            'ダブルタッチの光採取者': '擊掌光芒收集者', 
-            'くつろぐ日光浴者': '放鬆日浴者',
-            '光採取者': '光芒收集者',
-            
-            '若木': '花樹/幼苗', '愛でる': '賞花(在旁待60秒)',
-            '虹': '彩虹', '眺める': '觀賞',
-            'カニ': '螃蟹', '倒す': '掀翻5隻', '気絶': '掀翻',
-            '暗黒竜': '冥龍', '対峙': '面對', 
-            'マンタ': '遙鯤', '蝕む闇': '黑暗植物', '溶かす': '燒掉10株',
-            '光を捕まえる': '捕捉光芒',
-            'メッセージ': '留言', 'キャンドルボート': '紙船/蠟燭',
-            'ギフト': '禮物', '送る': '送出心火',
-            '鳥': '鳥',
-            '手をつなぐ': '牽手', 'グループ': '隊伍',
-            '精霊にかえる': '回歸天際 (向嚮導/先祖回報)',
-            '会う': '拜訪/見面', '訪れる': '找到', # Updated from visit to find for bonfire match
-            '座る': '坐下', 'ベンチ': '長椅', '交流': '交流',
-            'の': '的', 'で': '在', 'と': '和',
-            
-            # New Mappings for 2026-01-06
-            '闇の蟹を持ち上げる': '抱起一隻暗蟹',
-            '墓所': '墓園',
-            '焚火': '篝火',
-            '闇の蟹': '暗蟹',
-            '持ち上げる': '抱起',
-            
-            # Grammar Fixes
-            'を訪れる': '找到',
-            'にある': '位於',
-            'を': '' # Remove particle
-        }
-        
-        # Apply Logic
-        # Specific overrides first
-        if "30個" in text and "集める" in text:
-            return "收集 30 滴燭火"
-            
-        # Sort terms by length (descending) to avoid partial replacements (e.g., '光' replacing inside '日光浴者')
-        sorted_terms = sorted(terms.items(), key=lambda x: len(x[0]), reverse=True)
-        
-        for jp, tc in sorted_terms:
-            text = text.replace(jp, tc)
-            
-        # Cleanup
-        text = text.replace('在在', '在').replace('的在', '在').replace('任務任務', '任務')
-        text = text.replace('重溫美好回憶先祖', '重溫先祖美好回憶').replace('重溫先祖美好回憶任務', '重溫先祖美好回憶')
-        
-        # Post-Processing Cleanup for Overlaps
-        text = text.replace('彩彩虹', '彩虹')
-            
-        return text
+        with tracing.span("translate"):
+            return self.translation_memory.translate(text)
 
     async def get_dailies_info(self):
         page = None
         try:
             print("Fetching Candles from 9-bit (Primary)...")
-            page = await self.context.new_page()
-            await page.route("**/*", lambda route: route.abort() if route.request.resource_type in ["font", "media", "websocket"] else route.continue_())
+            page = await self.pages.acquire()
             
             # 1. Access 9-bit Homepage
             await page.goto("https://9-bit.jp/skygold/", wait_until="domcontentloaded", timeout=60000)
@@ -836,7 +913,8 @@ class SkyCrawler:
                 return results;
             }''')
             
-            await page.close()
+            done_page, page = page, None
+            await self.pages.release(done_page)
 
             # Process Treasure
             t_realm = nine_bit_data.get('treasure_realm', 'NotFound')
@@ -857,11 +935,7 @@ class SkyCrawler:
             # Fallback for Treasure Realm (Date-based Text) if 9-bit text extraction failed
             if t_realm == "NotFound" or not t_realm:
                  try:
-                    realms = ['Daylight Prairie', 'Hidden Forest', 'Valley of Triumph', 'Golden Wasteland', 'Vault of Knowledge']
-                    anchor = datetime(2026, 1, 5)
-                    diff = (now.date() - anchor.date()).days
-                    idx = (diff + 3) % 5
-                    t_realm = realms[idx]
+                    t_realm = candle_data.predict_treasure(now.date())['realm']
                     # If fallback runs and it's Sunday, t_rot is already set to "Rotation 1 and 2" above
                     print(f"DEBUG: Calculated Treasure Realm Fallback: {t_realm}")
                  except Exception as e:
@@ -888,8 +962,9 @@ class SkyCrawler:
         except Exception as e:
             print(f"獲取每日任務錯誤: {e}")
             if page: await self._take_screenshot(page, "dailies_fail")
-            if page: await page.close()
             return None
+        finally:
+            if page: await self.pages.release(page)
 
     async def get_clock_info(self):
         try:
@@ -901,6 +976,148 @@ class SkyCrawler:
             print(f"計算時鐘錯誤: {e}")
             return None
 
+    async def _fetch_daily_post_static(self):
+        """
+        Browser-free path: 9-bit is server-rendered WordPress, so HTTP + lxml is enough.
+        Returns None on any failure so the caller can fall back to Playwright.
+        """
+        try:
+            return await nine_bit.fetch_daily_post(self.http)
+        except Exception as e:
+            print(f"DEBUG: Static 9-bit fetch error: {e}")
+            return None
+
+    async def _fetch_daily_post_browser(self, page):
+        """
+        Playwright fallback for the 9-bit daily post (same output as nine_bit.parse_daily_post).
+        """
+        # 1. Homepage -> Find Link
+        await page.goto("https://9-bit.jp/skygold/", wait_until="domcontentloaded", timeout=60000)
+        target_url = await page.evaluate('''() => {
+            const links = Array.from(document.querySelectorAll('a'));
+            const target = links.find(a => a.innerText.includes('今日のデイリークエスト'));
+            return target ? target.href : null;
+        }''')
+
+        if target_url:
+            print(f"DEBUG: Found Daily Post URL: {target_url}")
+            await page.goto(target_url, wait_until="domcontentloaded")
+        else:
+            print("DEBUG: Stayed on Homepage (Link not found)")
+
+        # 2. Scrape Quests (DOM - Table Aware)
+        quest_data_dom = await page.evaluate('''() => {
+            const results = [];
+            const headers = Array.from(document.querySelectorAll('h2, h3, h4'));
+
+            // 1. Try to find the specific "Quest LIST" header first (H3: デイリークエスト一覧)
+            // This is more specific than the main H2 date header and avoids the metadata table.
+            let qHeader = headers.find(h => h.innerText.includes('デイリークエスト一覧'));
+
+            // Fallback to main header if List header not found
+            if (!qHeader) {
+                qHeader = headers.find(h => 
+                    h.innerText.includes('今日') && 
+                    h.innerText.includes('デイリークエスト') && 
+                    !h.innerText.includes('目次')
+                );
+            }
+
+            if (!qHeader) return { quests: [], date_str: null };
+
+            // Helper to process text
+            const isValidQuest = (txt) => {
+                const t = txt.trim();
+                if (t.length < 5) return false;
+                if (['方法','報酬','確認','精錬','デイリークエスト','一覧'].some(k => t.includes(k))) return false;
+                if (t.includes('開始時間') || t.includes('終了時間') || t.includes('対象エリア')) return false; 
+                if (t.includes('時') && t.includes('分')) return false; // Time filter (Japanese time chars)
+                if (t.match(/\d{1,2}月\d{1,2}日/)) return false; 
+                return true;
+            }
+
+            let curr = qHeader.nextElementSibling;
+            while (curr && results.length < 4) {
+                // Stop conditions
+                if (['H2'].includes(curr.tagName) && !curr.innerText.includes('一覧')) break; 
+
+                // 1. Check TABLE
+                if (curr.tagName === 'TABLE') {
+                    // CRITICAL: Check if this is the Metadata Table
+                    const tableText = curr.innerText;
+                    if (tableText.includes('開始時間') || tableText.includes('終了時間') || tableText.includes('対象エリア')) {
+                        // SKIP this entire table
+                        curr = curr.nextElementSibling;
+                        continue;
+                    }
+
+                    const cells = curr.querySelectorAll('td, th');
+                    for (const cell of cells) {
+                        const lines = cell.innerText.split('\\n');
+                        for (const line of lines) {
+                            if (isValidQuest(line) && !results.includes(line)) {
+                                results.push(line);
+                                if (results.length >= 4) break;
+                            }
+                        }
+                        if (results.length >= 4) break;
+                    }
+                }
+
+                // 2. Check LI/STRONG (Legacy/Mobile view)
+                if (['UL','OL','P','DIV'].includes(curr.tagName) || curr.tagName === 'STRONG') {
+                    const candidates = [];
+                    if (curr.tagName === 'STRONG') candidates.push(curr);
+                    candidates.push(...curr.querySelectorAll('strong'));
+                    candidates.push(...curr.querySelectorAll('li'));
+
+                    for (const el of candidates) {
+                        const txt = el.innerText.trim();
+                        // If LI starts with date/time, skip it
+                        if (txt.includes('時') && txt.includes('分')) continue;
+
+                        if (isValidQuest(txt) && !results.includes(txt)) {
+                            results.push(txt);
+                            if (results.length >= 4) break;
+                        }
+                    }
+                }
+
+                curr = curr.nextElementSibling;
+            }
+
+            // Date finding fallback (if we used List header, we might miss the date header)
+            // We try to grab the Date header text separately if needed
+            let dateStr = qHeader.innerText;
+            if (!dateStr.includes('月')) {
+                 // Try to find the Date H2
+                 const dateH2 = headers.find(h => h.innerText.includes('今日') && h.innerText.includes('デイリークエスト'));
+                 if (dateH2) dateStr = dateH2.innerText;
+            }
+
+            return { quests: results, date_str: dateStr };
+        }''')
+        
+        # Extract Treasure Candle Info from 9-bit (More reliable than Fandom Text)
+        # We look for "大キャンドル" in the raw text lines
+        # Update: Scan for Realm keywords in the Vicinity of "大キャンドル"
+        treasure_jp = ""
+        full_text = await page.evaluate("document.body.innerText")
+        lines = full_text.split('\n')
+        
+        for i, line in enumerate(lines):
+            if "大キャンドル" in line:
+                # Captures context (current line + next 5 lines) to find location
+                context = " ".join(lines[i:i+6])
+                treasure_jp = context.strip()
+                break
+
+        return {
+            'quests': quest_data_dom.get('quests', []),
+            'date_str': quest_data_dom.get('date_str', ''),
+            'treasure_jp': treasure_jp
+        }
+
     async def get_all_daily_info_optimized(self):
         """
         Consolidated scraper to fetch BOTH Quests and Candles in one navigation.
@@ -915,117 +1132,17 @@ class SkyCrawler:
         
         try:
             print("Fetching All Daily Info (Optimized)...")
-            page = await self.context.new_page()
-            
-            # 1. Homepage -> Find Link
-            await page.goto("https://9-bit.jp/skygold/", wait_until="domcontentloaded", timeout=60000)
-            target_url = await page.evaluate('''() => {
-                const links = Array.from(document.querySelectorAll('a'));
-                const target = links.find(a => a.innerText.includes('今日のデイリークエスト'));
-                return target ? target.href : null;
-            }''')
-            
-            if target_url:
-                print(f"DEBUG: Found Daily Post URL: {target_url}")
-                await page.goto(target_url, wait_until="domcontentloaded")
-            else:
-                print("DEBUG: Stayed on Homepage (Link not found)")
 
-            # 2. Scrape Quests (DOM - Table Aware)
-            quest_data_dom = await page.evaluate('''() => {
-                const results = [];
-                const headers = Array.from(document.querySelectorAll('h2, h3, h4'));
-                
-                // 1. Try to find the specific "Quest LIST" header first (H3: デイリークエスト一覧)
-                // This is more specific than the main H2 date header and avoids the metadata table.
-                let qHeader = headers.find(h => h.innerText.includes('デイリークエスト一覧'));
-                
-                // Fallback to main header if List header not found
-                if (!qHeader) {
-                    qHeader = headers.find(h => 
-                        h.innerText.includes('今日') && 
-                        h.innerText.includes('デイリークエスト') && 
-                        !h.innerText.includes('目次')
-                    );
-                }
-                
-                if (!qHeader) return { quests: [], date_str: null };
-                
-                // Helper to process text
-                const isValidQuest = (txt) => {
-                    const t = txt.trim();
-                    if (t.length < 5) return false;
-                    if (['方法','報酬','確認','精錬','デイリークエスト','一覧'].some(k => t.includes(k))) return false;
-                    if (t.includes('開始時間') || t.includes('終了時間') || t.includes('対象エリア')) return false; 
-                    if (t.includes('時') && t.includes('分')) return false; // Time filter (Japanese time chars)
-                    if (t.match(/\d{1,2}月\d{1,2}日/)) return false; 
-                    return true;
-                }
-
-                let curr = qHeader.nextElementSibling;
-                while (curr && results.length < 4) {
-                    // Stop conditions
-                    if (['H2'].includes(curr.tagName) && !curr.innerText.includes('一覧')) break; 
-                    
-                    // 1. Check TABLE
-                    if (curr.tagName === 'TABLE') {
-                        // CRITICAL: Check if this is the Metadata Table
-                        const tableText = curr.innerText;
-                        if (tableText.includes('開始時間') || tableText.includes('終了時間') || tableText.includes('対象エリア')) {
-                            // SKIP this entire table
-                            curr = curr.nextElementSibling;
-                            continue;
-                        }
+            # 1. Static fast path (HTTP + lxml), Playwright only if the parse fails
+            post = await self._fetch_daily_post_static()
+            if post is None:
+                print("DEBUG: Static 9-bit parse failed, falling back to browser")
+                page = await self.pages.acquire()
+                post = await self._fetch_daily_post_browser(page)
 
-                        const cells = curr.querySelectorAll('td, th');
-                        for (const cell of cells) {
-                            const lines = cell.innerText.split('\\n');
-                            for (const line of lines) {
-                                if (isValidQuest(line) && !results.includes(line)) {
-                                    results.push(line);
-                                    if (results.length >= 4) break;
-                                }
-                            }
-                            if (results.length >= 4) break;
-                        }
-                    }
-                    
-                    // 2. Check LI/STRONG (Legacy/Mobile view)
-                    if (['UL','OL','P','DIV'].includes(curr.tagName) || curr.tagName === 'STRONG') {
-                        const candidates = [];
-                        if (curr.tagName === 'STRONG') candidates.push(curr);
-                        candidates.push(...curr.querySelectorAll('strong'));
-                        candidates.push(...curr.querySelectorAll('li'));
-                        
-                        for (const el of candidates) {
-                            const txt = el.innerText.trim();
-                            // If LI starts with date/time, skip it
-                            if (txt.includes('時') && txt.includes('分')) continue;
-                            
-                            if (isValidQuest(txt) && !results.includes(txt)) {
-                                results.push(txt);
-                                if (results.length >= 4) break;
-                            }
-                        }
-                    }
-
-                    curr = curr.nextElementSibling;
-                }
-                
-                // Date finding fallback (if we used List header, we might miss the date header)
-                // We try to grab the Date header text separately if needed
-                let dateStr = qHeader.innerText;
-                if (!dateStr.includes('月')) {
-                     // Try to find the Date H2
-                     const dateH2 = headers.find(h => h.innerText.includes('今日') && h.innerText.includes('デイリークエスト'));
-                     if (dateH2) dateStr = dateH2.innerText;
-                }
-                
-                return { quests: results, date_str: dateStr };
-            }''')
-            
-            raw_quests = quest_data_dom.get('quests', [])
-            date_str = quest_data_dom.get('date_str', '')
+            raw_quests = post.get('quests', [])
+            date_str = post.get('date_str', '')
+            treasure_jp = post.get('treasure_jp', '')
             
             print(f"DEBUG: Raw Quests from 9-bit: {raw_quests}")
             
@@ -1047,20 +1164,7 @@ class SkyCrawler:
             quests = [self.translate_quest(q) for q in raw_quests]
             print(f"DEBUG: Translated Quests: {quests}")
             
-            # Extract Treasure Candle Info from 9-bit (More reliable than Fandom Text)
-            # We look for "大キャンドル" in the raw text lines
-            # Update: Scan for Realm keywords in the Vicinity of "大キャンドル"
-            treasure_jp = ""
-            full_text = await page.evaluate("document.body.innerText")
-            lines = full_text.split('\n')
-            
-            for i, line in enumerate(lines):
-                if "大キャンドル" in line:
-                    # Captures context (current line + next 5 lines) to find location
-                    context = " ".join(lines[i:i+6])
-                    treasure_jp = context.strip()
-                    break
-            
+            # Treasure Candle Info from 9-bit (More reliable than Fandom Text)
             print(f"DEBUG: 9-bit Candle Info (Context): {treasure_jp}")
             
             # Determine Target Realm & Rotation Mode
@@ -1136,7 +1240,9 @@ class SkyCrawler:
             # 3. Scrape Candles from Fandom Wiki (User Request)
             print("Navigating to Fandom Wiki for Candles...")
             try:
-                await page.goto("https://sky-children-of-the-light.fandom.com/wiki/Treasure_Candles", wait_until="domcontentloaded", timeout=60000)
+                if page is None:
+                    page = await self.pages.acquire()
+                await page.goto("https://sky-children-of-the-light.fandom.com/wiki/Treasure_Candles", wait_until="domcontentloaded", timeout=config.SOURCE_TIMEOUTS["fandom"] * 1000)
                 await page.wait_for_selector('#mw-content-text', timeout=10000)
                 
                 # Pass External Overrides
@@ -1258,37 +1364,20 @@ class SkyCrawler:
                 f_rot_str = fandom_data.get('rotation_str', '')
                 raw_imgs = fandom_data.get('images', [])
                 
-                # Download Images Locally
-                import os
-                import requests
+                # Download Images Locally (parallel, conditional GET + content-addressed cache)
+                local_imgs = await image_downloader.download_images(
+                    self.http, raw_imgs, dest_dir=os.path.join(self.out_dir, "images"),
+                    concurrency=config.IMAGE_DOWNLOAD_CONCURRENCY,
+                    retries=config.IMAGE_DOWNLOAD_RETRIES,
+                    backoff=config.IMAGE_DOWNLOAD_BACKOFF
+                )
                 
-                if not os.path.exists("images"):
-                    os.makedirs("images")
-                    
-                local_imgs = []
-                for i, url in enumerate(raw_imgs):
-                    try:
-                        ext = "jpg"
-                        if ".png" in url: ext = "png"
-                        filename = f"images/treasure_{i+1}.{ext}"
-                        
-                        # Simple download
-                        # HEADERS are important for Wiki to accept the request
-                        headers = {
-                            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-                        }
-                        r = requests.get(url, headers=headers, timeout=10)
-                        if r.status_code == 200:
-                            with open(filename, "wb") as f:
-                                f.write(r.content)
-                            local_imgs.append(filename)
-                            print(f"Downloaded: {filename}")
-                        else:
-                            print(f"Failed to download image: {url} (Status: {r.status_code})")
-                    except Exception as e:
-                        print(f"Image Download Error: {e}")
+                t_imgs = [os.path.relpath(path, self.out_dir).replace(os.sep, "/") for path in local_imgs]
                 
-                t_imgs = local_imgs
+                # Responsive WebP/JPEG variants (Pillow is CPU-bound -> executor)
+                with tracing.span("optimize_images", count=len(t_imgs)):
+                    t_variants = await asyncio.get_running_loop().run_in_executor(
+                        None, functools.partial(image_opt.optimize_images, t_imgs, root=self.out_dir))
                 
                 # Determine Rotation Key
                 t_rot = "Rotation 1"   
@@ -1305,19 +1394,34 @@ class SkyCrawler:
                 elif has_3: t_rot = "Rotation 3"
                 
                 print(f"DEBUG: Fandom Data - Realm: {t_realm}, Imgs: {len(t_imgs)}, Rot: {t_rot}")
+                if t_imgs:
+                    self.snapshots.put(f"fandom:{t_realm}|{t_rot}", {"images": t_imgs, "variants": t_variants})
 
             except Exception as e:
                 print(f"Fandom Scraping Error: {e}")
                 t_realm = "Golden Wasteland" # Fallback
                 t_rot = "Rotation 1 and 2" if datetime.now().weekday() == 6 else "Rotation 1" 
                 t_imgs = []
+                t_variants = {}
 
-            await page.close()
+                # Last-known-good Fandom images for the realm 9-bit told us about
+                snapshot_key = f"fandom:{target_realm}|{t_rot}"
+                snapshot = self.snapshots.serve_stale(snapshot_key) if target_realm else None
+                if snapshot:
+                    t_realm = target_realm
+                    t_imgs = snapshot["images"]
+                    t_variants = snapshot["variants"]
+                    candles['treasure']['stale'] = int(self.snapshots.served_stale[snapshot_key])
+
+            if page:
+                done_page, page = page, None  # finally must not release it a second time
+                await self.pages.release(done_page)
             
             # Update Candles Dictionary
             candles['treasure']['realm'] = t_realm
             candles['treasure']['rotation'] = t_rot
             candles['treasure']['images'] = t_imgs
+            candles['treasure']['variants'] = t_variants
             candles['treasure']['descriptions'] = candle_data.get_treasure_desc(t_realm, t_rot)
             
             # Seasonal - use simple fallback or 9-bit scraping if we wanted (skipped for now to prioritize Treasure)
@@ -1346,7 +1450,9 @@ class SkyCrawler:
         except Exception as e:
              print(f"Combined Scraper Error: {e}")
              if page: await self._take_screenshot(page, "combined_error")
-             if page: await page.close()
+        finally:
+            # Also on cancellation (task_runner timeout), so the pooled page is never lost
+            if page: await self.pages.release(page)
         
         return quests, candles
 
@@ -0,0 +1,311 @@
+import asyncio
+import mimetypes
+import os
+import signal
+from datetime import datetime, time, timedelta, timezone
+
+from aiohttp import web
+
+import artifacts
+import clock_pred
+import config
+import fixtures
+import history
+import schedule_export
+import shard_pred
+import static_assets
+import task_runner
+import tracing
+import web_exporter
+from crawler import SkyCrawler
+
+
+def next_sky_reset(now=None):
+    """
+    下一次 Sky 每日重置 (洛杉磯午夜)，回傳 aware datetime。
+    """
+    now = now or datetime.now(timezone.utc)
+    tomorrow = shard_pred.sky_today(now) + timedelta(days=1)
+    return datetime.combine(tomorrow, time(0), tzinfo=clock_pred.SKY_TZ)
+
+
+class Daemon:
+    """
+    常駐模式：保持一個 SkyCrawler (瀏覽器) 暖機，各來源依自然週期更新，只重畫受影響的卡片。
+    - shards: 每次 Sky 重置後
+    - dailies (9-bit / Fandom): 重置後等待 9-bit 發文，內容未更新時定時重試
+    - clock: 不需要重新抓取 (倒數由頁面 JS 計算)
+    """
+
+    def __init__(self, out_dir=".", fixture_mode=None, fixture_dir=None):
+        self.out_dir = out_dir
+        self.fixture_mode = fixture_mode
+        self.crawler = SkyCrawler(fixture_mode=fixture_mode, fixture_dir=fixture_dir, out_dir=out_dir)
+        self.data = {"shards": {}, "dailies": ([], {}), "clock": {}}
+        self.cards = web_exporter.render_cards({}, {}, {}, [])
+        self.stale = {}  # source -> 以舊快照替代時的快照時間 (stored_at, epoch 秒)
+        self.status = {}  # source -> 最近一次更新的狀態 (TaskOutcome.status 或 "stale")，寫入歷史紀錄
+        self.due = {}  # source -> 下次更新時間 (aware datetime)
+        self.stop_event = asyncio.Event()
+
+    # --- rendering ---
+
+    def render(self, source, stale_since=None):
+        self.cards.update(web_exporter.render_source_cards(source, self.data[source], stale_since))
+        self.stale[source] = stale_since
+        if source == "shards":
+            self.shard_times = web_exporter.build_shard_times(self.data["shards"])
+
+    def write_page(self):
+        quests, dailies = self.data["dailies"]
+        data = web_exporter.build_data(self.data["shards"], dailies, self.data["clock"], quests, self.stale)
+        if web_exporter.write_data(os.path.join(self.out_dir, config.DATA_PATH), data):
+            print(f"[daemon] {config.DATA_PATH} updated (revision {data['revision']})")
+
+        assets = static_assets.build_assets(self.out_dir)
+        html = web_exporter.render_page(self.cards, getattr(self, "shard_times", "[]"), assets,
+                                        revision=data["revision"], data_etag=web_exporter.data_etag(data))
+        if artifacts.publish(os.path.join(self.out_dir, "index.html"), html):
+            print(f"[daemon] index.html updated ({datetime.now().strftime('%H:%M:%S')})")
+        schedule_export.write_schedule(os.path.join(self.out_dir, config.SCHEDULE_PATH), days=config.SCHEDULE_DAYS)
+        artifacts.write_manifest(self.out_dir, ["index.html", config.DATA_PATH, config.SCHEDULE_PATH, *assets.values()],
+                                 config.MANIFEST_PATH)
+
+    # --- fetching ---
+
+    def _task(self, source):
+        crawler = self.crawler
+        snapshots = crawler.snapshots
+        previous = self.data[source]
+        if source == "shards":
+            return task_runner.SourceTask("shards", crawler.get_shards_prediction,
+                                          timeout=config.SOURCE_TIMEOUTS["shards"],
+                                          fallback=crawler.get_local_shards_prediction)
+        if source == "dailies":
+            return task_runner.SourceTask("dailies", crawler.get_all_daily_info_optimized,
+                                          timeout=config.SOURCE_TIMEOUTS["dailies"],
+                                          fallback=previous if previous[0] else snapshots.fallback("dailies", ([], {})),
+                                          accept=lambda result: bool(result[0]))
+        return task_runner.SourceTask("clock", crawler.get_clock_info,
+                                      timeout=config.SOURCE_TIMEOUTS["clock"], fallback=previous)
+
+    async def refresh(self, source):
+        """
+        重新抓取單一來源並重畫其卡片，回傳 TaskOutcome。
+        """
+        await self._ensure_browser()
+        previous = self.data[source]
+        snapshots = self.crawler.snapshots
+        snapshots.served_stale.pop(source, None)
+
+        outcome = (await task_runner.run_sources([self._task(source)]))[source]
+        print(f"[daemon] {outcome}")
+        self.data[source] = outcome.value
+        stale_since = snapshots.served_stale.get(source)
+        self.status[source] = "stale" if stale_since is not None else outcome.status
+        if outcome.ok and source == "dailies":
+            snapshots.put("dailies", outcome.value)
+            self.record_history()
+
+        if outcome.ok or outcome.value != previous or stale_since is not None:
+            self.render(source, stale_since)
+            self.write_page()
+        self._persist()
+        print(f"[daemon] {source} timing:\n{tracing.TRACER.summary()}")
+        tracing.TRACER.reset()
+        return outcome
+
+    async def _ensure_browser(self):
+        browser = self.crawler.browser
+        if browser is not None and browser.is_connected():
+            return
+        if browser is not None:
+            print("[daemon] Browser disconnected, restarting crawler")
+            await self.crawler.stop()
+        await self.crawler.start()
+
+    def record_history(self):
+        if self.fixture_mode == fixtures.REPLAY:
+            return
+        quests, dailies = self.data["dailies"]
+        try:
+            with history.History(config.HISTORY_PATH) as store:
+                store.record_build(shard_pred.sky_today(), shards=self.data["shards"], quests=quests,
+                                   dailies=dailies, clock=self.data["clock"], sources=dict(self.status))
+        except Exception as e:
+            print(f"[daemon] History record error: {e}")
+
+    def _persist(self):
+        if self.fixture_mode == fixtures.REPLAY:
+            return
+        try:
+            self.crawler.translation_memory.save()
+            self.crawler.snapshots.save()
+        except Exception as e:
+            print(f"[daemon] State save error: {e}")
+
+    # --- scheduling ---
+
+    def schedule_next(self, source, outcome=None, previous=None, now=None):
+        now = now or datetime.now(timezone.utc)
+        reset = next_sky_reset(now)
+        if source == "shards":
+            self.due[source] = reset + timedelta(seconds=config.SKY_RESET_REFRESH_DELAY)
+        elif source == "dailies":
+            # 9-bit 尚未發文 (失敗或內容與上一輪相同) -> 稍後重試，否則等下一次重置後的發文
+            unchanged = outcome is not None and previous is not None and outcome.value[0] == previous[0]
+            if outcome is not None and (not outcome.ok or unchanged) and self.retries < config.DAILY_POST_MAX_RETRIES:
+                self.retries += 1
+                self.due[source] = now + timedelta(seconds=config.DAILY_POST_RETRY_INTERVAL)
+            else:
+                self.retries = 0
+                self.due[source] = reset + timedelta(seconds=config.DAILY_POST_DELAY)
+        else:
+            self.due.pop(source, None)  # clock: computed client-side, never refetched
+
+    async def run(self):
+        os.makedirs(self.out_dir, exist_ok=True)
+        await self.crawler.start()
+        self.retries = 0
+        try:
+            # Serve the last-known-good dailies right away, then revalidate
+            hit = self.crawler.snapshots.get("dailies")
+            if hit:
+                value, _, fresh = hit
+                self.data["dailies"] = tuple(value)
+                self.render("dailies", None if fresh else self.crawler.snapshots.stored_at("dailies"))
+                self.status["dailies"] = "ok" if fresh else "stale"
+
+            for source in ("shards", "clock", "dailies"):
+                self.schedule_next(source, await self.refresh(source))
+
+            while not self.stop_event.is_set():
+                source = min(self.due, key=self.due.get)
+                wait = (self.due[source] - datetime.now(timezone.utc)).total_seconds()
+                print(f"[daemon] next: {source} at {self.due[source].astimezone(shard_pred.DISPLAY_TZ):%m-%d %H:%M:%S}")
+                if wait > 0:
+                    try:
+                        await asyncio.wait_for(self.stop_event.wait(), timeout=wait)
+                        break
+                    except asyncio.TimeoutError:
+                        pass
+                previous = self.data[source]
+                outcome = await self.refresh(source)
+                self.schedule_next(source, outcome, previous)
+                if source == "shards":
+                    # Clock card "next" times are static text; re-render at reset with the new day
+                    await self.refresh("clock")
+        finally:
+            self._persist()
+            await self.crawler.stop()
+
+    def stop(self):
+        self.stop_event.set()
+
+
+@web.middleware
+async def cache_headers(request, handler):
+    response = await handler(request)
+    if request.path.startswith(f"/{config.STATIC_DIR}/"):
+        # 檔名含內容雜湊，內容變更時網址也會改變
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    else:
+        response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
+def pick_encoding(path, accept_encoding):
+    """
+    用戶端接受且存在預先壓縮檔時回傳 (encoding, 壓縮檔路徑)，否則 (None, 原檔路徑)。br 優先於 gzip。
+    """
+    accepted = {token.split(";")[0].strip().lower() for token in accept_encoding.split(",")}
+    for encoding in ("br", "gzip"):
+        compressed = path + artifacts.ENCODINGS[encoding]
+        if encoding in accepted and os.path.exists(compressed):
+            return encoding, compressed
+    return None, path
+
+
+def etag_matches(if_none_match, etag):
+    """
+    If-None-Match 比對 (弱比較：忽略 W/ 前綴)。
+    """
+    def opaque(tag):
+        return tag[2:] if tag.startswith("W/") else tag
+
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or opaque(tag) == opaque(etag):
+            return True
+    return False
+
+
+# 伺服器只送出發布的檔案：預設 --out . 是專案根目錄，不能把 .git/、state/、fixtures/ 也公開出去
+PUBLISHED_FILES = {"index.html", config.DATA_PATH, config.SCHEDULE_PATH, config.MANIFEST_PATH}
+PUBLISHED_DIRS = {config.STATIC_DIR, "images"}
+
+
+def is_published(rel):
+    rel = rel.replace(os.sep, "/")
+    return rel in PUBLISHED_FILES or ("/" in rel and rel.split("/", 1)[0] in PUBLISHED_DIRS)
+
+
+def make_static_app(out_dir):
+    """
+    本機預覽用的靜態檔案伺服器 (只送出 index.html、data.json、schedule.json、manifest.json、static/、images/)。
+    有 .br / .gz 預先壓縮檔時直接送出，不在每次請求時壓縮；支援 ETag / If-None-Match (304)。
+    """
+    root = os.path.realpath(out_dir)
+
+    async def handle(request):
+        rel = request.match_info["path"] or "index.html"
+        path = os.path.realpath(os.path.join(root, rel))
+        if (not path.startswith(root + os.sep) or not is_published(os.path.relpath(path, root))
+                or not os.path.isfile(path)):
+            raise web.HTTPNotFound()
+
+        encoding, body_path = pick_encoding(path, request.headers.get("Accept-Encoding", ""))
+        with open(body_path, "rb") as f:
+            body = f.read()
+        # 弱 ETag 取自未壓縮的原檔：與頁面事先算出的 data.json ETag 一致
+        etag = artifacts.etag(artifacts.file_digest(path))
+        headers = {"ETag": etag, "Vary": "Accept-Encoding"}
+        if etag_matches(request.headers.get("If-None-Match", ""), etag):
+            return web.Response(status=304, headers=headers)
+
+        content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        response = web.Response(body=body, content_type=content_type, headers=headers,
+                                charset="utf-8" if content_type.startswith("text/") or content_type.endswith(("json", "javascript")) else None)
+        if encoding:
+            response.headers["Content-Encoding"] = encoding
+        return response
+
+    app = web.Application(middlewares=[cache_headers])
+    app.router.add_get("/{path:.*}", handle)
+    return app
+
+
+async def serve(out_dir=".", port=None, host=None, fixture_mode=None, fixture_dir=None):
+    """
+    daemon 進入點：背景排程更新，port 有指定時同時提供本機 HTTP 伺服器。
+    """
+    daemon = Daemon(out_dir, fixture_mode=fixture_mode, fixture_dir=fixture_dir)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, daemon.stop)
+        except NotImplementedError:  # Windows
+            pass
+
+    runner = None
+    if port:
+        runner = web.AppRunner(make_static_app(os.path.abspath(out_dir)))
+        await runner.setup()
+        await web.TCPSite(runner, host or config.SERVE_HOST, port).start()
+        print(f"[daemon] Serving {os.path.abspath(out_dir)} on http://{host or config.SERVE_HOST}:{port}/")
+
+    try:
+        await daemon.run()
+    finally:
+        if runner:
+            await runner.cleanup()
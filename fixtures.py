@@ -0,0 +1,183 @@
+import hashlib
+import json
+import os
+import re
+from datetime import datetime, timezone
+
+import aiohttp
+from yarl import URL
+
+RECORD = "record"
+REPLAY = "replay"
+MODES = (RECORD, REPLAY)
+
+# 錄製時保留的回應標頭 (其餘與重播無關)
+KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+# 錄製時移除條件式請求標頭，確保存下完整內容而不是 304
+CONDITIONAL_HEADERS = ("If-None-Match", "If-Modified-Since")
+
+
+def har_path(fixture_dir, source):
+    return os.path.join(fixture_dir, "har", f"{source}.har")
+
+
+def source_url_pattern(source):
+    """
+    比對來源網域 (含子網域) 下所有 URL 的正規表示式，供 route_from_har 篩選。
+    """
+    return re.compile(rf"^https?://([^/?#]*\.)?{re.escape(source)}(:\d+)?([/?#]|$)")
+
+
+async def install_har_routes(context, fixture_dir, sources, mode):
+    """
+    每個來源一個 HAR：錄製時寫入 (context 關閉時存檔)，重播時由 HAR 回應。
+    重播模式下其餘請求一律中止，整個建置不會碰到網路。
+    須在 ResourcePolicy.install 之前呼叫 (後註冊的路由先執行，ResourcePolicy 放行時 fallback 到這裡)。
+    """
+    if mode == REPLAY:
+        await context.route("**/*", lambda route: route.abort())
+    for source in sources:
+        path = har_path(fixture_dir, source)
+        if mode == RECORD:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        elif not os.path.exists(path):
+            print(f"Fixture missing, requests to {source} will fail: {path}")
+            continue
+        await context.route_from_har(
+            path,
+            url=source_url_pattern(source),
+            not_found="abort",
+            update=(mode == RECORD),
+            update_content="embed",
+        )
+
+
+class FixtureStore:
+    """
+    aiohttp 請求的錄製檔：index.json 記錄 URL -> {status, headers, file}，內容另存為檔案。
+    """
+
+    def __init__(self, fixture_dir):
+        self.dir = os.path.join(fixture_dir, "http")
+        self.index_path = os.path.join(self.dir, "index.json")
+        self.entries = {}
+        self.meta = {}
+        if os.path.exists(self.index_path):
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self.entries = data.get("entries", {})
+            self.meta = data.get("meta", {})
+
+    def lookup(self, url):
+        entry = self.entries.get(url)
+        if entry is None:
+            return None
+        with open(os.path.join(self.dir, entry["file"]), "rb") as f:
+            body = f.read()
+        return entry["status"], entry["headers"], body
+
+    def store(self, url, status, headers, body):
+        os.makedirs(self.dir, exist_ok=True)
+        name = hashlib.sha1(url.encode("utf-8")).hexdigest()[:16] + ".bin"
+        with open(os.path.join(self.dir, name), "wb") as f:
+            f.write(body)
+        self.entries[url] = {
+            "status": status,
+            "headers": {k: headers[k] for k in KEPT_HEADERS if k in headers},
+            "file": name,
+        }
+
+    def save(self):
+        os.makedirs(self.dir, exist_ok=True)
+        self.meta["recorded_at"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        with open(self.index_path, "w", encoding="utf-8") as f:
+            json.dump({"meta": self.meta, "entries": self.entries}, f, ensure_ascii=False, indent=1, sort_keys=True)
+
+
+class _Content:
+    def __init__(self, body):
+        self._body = body
+
+    async def iter_chunked(self, n):
+        for i in range(0, len(self._body), n):
+            yield self._body[i:i + n]
+
+    async def read(self):
+        return self._body
+
+
+class FixtureResponse:
+    """
+    已完整讀入記憶體的回應，提供爬蟲用到的 aiohttp.ClientResponse 介面。
+    """
+
+    def __init__(self, url, status, headers, body):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.content = _Content(body)
+        self._body = body
+
+    def get_encoding(self):
+        match = re.search(r"charset=([\w-]+)", self.headers.get("Content-Type", ""))
+        return match.group(1) if match else "utf-8"
+
+    async def read(self):
+        return self._body
+
+    async def text(self, encoding=None):
+        return self._body.decode(encoding or self.get_encoding(), errors="replace")
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            request_info = aiohttp.RequestInfo(URL(self.url), "GET", {}, URL(self.url))
+            raise aiohttp.ClientResponseError(request_info, (), status=self.status, message="fixture")
+
+
+class _Request:
+    def __init__(self, coro):
+        self._coro = coro
+
+    async def __aenter__(self):
+        return await self._coro
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FixtureSession:
+    """
+    取代共用 aiohttp.ClientSession 的 get()：
+    record 模式轉發到真實 session 並存下回應；replay 模式只從 FixtureStore 回應 (缺少時為 404)。
+    """
+
+    def __init__(self, store, mode, session=None):
+        self.store = store
+        self.mode = mode
+        self.session = session
+
+    def get(self, url, headers=None, **kwargs):
+        return _Request(self._get(url, headers, kwargs))
+
+    async def _get(self, url, headers, kwargs):
+        if self.mode == REPLAY:
+            hit = self.store.lookup(url)
+            if hit is None:
+                print(f"Fixture missing: {url}")
+                return FixtureResponse(url, 404, {}, b"")
+            status, resp_headers, body = hit
+            return FixtureResponse(url, status, resp_headers, body)
+
+        headers = {k: v for k, v in (headers or {}).items() if k not in CONDITIONAL_HEADERS}
+        async with self.session.get(url, headers=headers, **kwargs) as resp:
+            body = await resp.read()
+            resp_headers = {k: resp.headers[k] for k in KEPT_HEADERS if k in resp.headers}
+            if resp.status == 200:
+                self.store.store(url, resp.status, resp_headers, body)
+            return FixtureResponse(url, resp.status, resp_headers, body)
+
+    async def close(self):
+        if self.mode == RECORD:
+            self.store.save()
+        if self.session is not None:
+            await self.session.close()
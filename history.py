@@ -0,0 +1,212 @@
+import hashlib
+import json
+import os
+import sqlite3
+from datetime import datetime, timezone
+
+# 任務類型：依序比對翻譯後的任務文字，第一個命中的關鍵字決定類型
+QUEST_TYPES = [
+    ("回憶", ["重溫", "記憶", "回憶"]),
+    ("冥想", ["冥想"]),
+    ("收集光芒", ["之光", "捕捉", "光芒收集", "四散的光"]),
+    ("蠟燭 / 燭火", ["蠟燭", "燭火"]),
+    ("好友互動", ["好友", "玩家", "隊伍", "聊天"]),
+    ("黑暗生物", ["螃蟹", "暗蟹", "冥龍", "黑暗植物"]),
+    ("觀賞 / 交流", ["欣賞", "觀賞", "交流", "拜訪", "見面"]),
+]
+OTHER_QUEST_TYPE = "其他"
+
+REALM_ZH = {
+    "Daylight Prairie": "雲野",
+    "Hidden Forest": "雨林",
+    "Valley of Triumph": "霞谷",
+    "Golden Wasteland": "暮土",
+    "Vault of Knowledge": "禁閣",
+    "Isle of Dawn": "晨島",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS builds (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    built_at TEXT NOT NULL,
+    sky_date TEXT NOT NULL,
+    sources TEXT NOT NULL,
+    clock TEXT,
+    digest TEXT
+);
+CREATE TABLE IF NOT EXISTS shards (
+    build_id INTEGER NOT NULL REFERENCES builds(id),
+    date TEXT NOT NULL,
+    realm TEXT,
+    map TEXT,
+    shard_type TEXT,
+    is_red INTEGER,
+    have_shard INTEGER NOT NULL,
+    rewards TEXT,
+    eruptions TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_shards_date ON shards(date);
+CREATE INDEX IF NOT EXISTS idx_shards_realm ON shards(realm, is_red);
+CREATE TABLE IF NOT EXISTS quests (
+    build_id INTEGER NOT NULL REFERENCES builds(id),
+    date TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    quest_type TEXT NOT NULL,
+    realm TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_quests_date ON quests(date);
+CREATE INDEX IF NOT EXISTS idx_quests_realm ON quests(realm);
+CREATE INDEX IF NOT EXISTS idx_quests_type ON quests(quest_type);
+CREATE TABLE IF NOT EXISTS candles (
+    build_id INTEGER NOT NULL REFERENCES builds(id),
+    date TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    realm TEXT,
+    rotation TEXT,
+    images TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_candles_date ON candles(date);
+CREATE INDEX IF NOT EXISTS idx_candles_realm ON candles(realm);
+"""
+
+
+def classify_quest(text):
+    for quest_type, keywords in QUEST_TYPES:
+        if any(k in text for k in keywords):
+            return quest_type
+    return OTHER_QUEST_TYPE
+
+
+def quest_realm(text):
+    for en, zh in REALM_ZH.items():
+        if zh in text:
+            return en
+    return None
+
+
+class History:
+    """
+    每次建置結果的歷史紀錄 (SQLite，只新增不修改)：碎石、任務、蠟燭與時鐘，
+    以日期與地區建立索引，供預測驗證與統計查詢。
+    """
+
+    def __init__(self, path):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+        # 舊版資料庫沒有 digest 欄位
+        if "digest" not in {r["name"] for r in self.conn.execute("PRAGMA table_info(builds)")}:
+            self.conn.execute("ALTER TABLE builds ADD COLUMN digest TEXT")
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def record_build(self, sky_date, shards=None, quests=None, dailies=None, clock=None, sources=None, built_at=None):
+        """
+        寫入一次建置的正規化結果，回傳 build id (結果與上一次建置相同時不寫入，回傳上一次的 id)。
+        sky_date 為建置當下的 Sky 日期 (date 或 ISO 字串)；sources 為各來源狀態 (例如 {"dailies": "stale"})。
+        dailies 狀態不是 ok 時 (舊快照 / 失敗) 不寫入任務與蠟燭：那是其他日期的內容，
+        記在 sky_date 底下會讓「每天最後一次建置」的查詢取到錯誤的資料。
+        """
+        if (sources or {}).get("dailies", "ok") != "ok":
+            quests, dailies = None, None
+        sky_date = sky_date.isoformat() if hasattr(sky_date, "isoformat") else str(sky_date)
+        built_at = built_at or datetime.now(timezone.utc).isoformat(timespec="seconds")
+        sources_json = json.dumps(sources or {}, ensure_ascii=False, sort_keys=True)
+
+        shard_rows = []
+        if shards:
+            shard_type = shards.get("type") or ""
+            have_shard = not shards.get("is_no_shard", False)
+            shard_rows.append((shards.get("date") or sky_date, shards.get("realm"), shards.get("map"), shard_type,
+                               int("Red" in shard_type) if have_shard else None, int(have_shard), shards.get("rewards"),
+                               json.dumps(shards.get("eruptions", []), ensure_ascii=False)))
+        quest_rows = [(sky_date, i, text, classify_quest(text), quest_realm(text)) for i, text in enumerate(quests or [])]
+        candle_rows = [(sky_date, kind, data.get("realm"), data.get("rotation"),
+                        json.dumps(data.get("images", []), ensure_ascii=False))
+                       for kind, data in (dailies or {}).items() if data]
+
+        # 與上一次建置的結果相同 (重跑 / 內容未更新) 時不新增資料列，回傳上一次的 build id。
+        # 時鐘是由建置時間推算的，不列入比較。
+        digest = hashlib.sha256(json.dumps([sky_date, sources_json, shard_rows, quest_rows, candle_rows],
+                                           ensure_ascii=False).encode("utf-8")).hexdigest()
+        last = self.conn.execute("SELECT id, digest FROM builds ORDER BY id DESC LIMIT 1").fetchone()
+        if last and last["digest"] == digest:
+            return last["id"]
+
+        with self.conn:
+            cur = self.conn.execute(
+                "INSERT INTO builds (built_at, sky_date, sources, clock, digest) VALUES (?, ?, ?, ?, ?)",
+                (built_at, sky_date, sources_json, json.dumps(clock, ensure_ascii=False) if clock else None, digest),
+            )
+            build_id = cur.lastrowid
+            self.conn.executemany(
+                "INSERT INTO shards (build_id, date, realm, map, shard_type, is_red, have_shard, rewards, eruptions) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", [(build_id, *row) for row in shard_rows])
+            self.conn.executemany(
+                "INSERT INTO quests (build_id, date, position, text, quest_type, realm) VALUES (?, ?, ?, ?, ?, ?)",
+                [(build_id, *row) for row in quest_rows])
+            self.conn.executemany(
+                "INSERT INTO candles (build_id, date, kind, realm, rotation, images) VALUES (?, ?, ?, ?, ?, ?)",
+                [(build_id, *row) for row in candle_rows])
+        return build_id
+
+    # --- 查詢 API ---
+    # 同一天可能建置多次：查詢以每天最後一次建置為準
+
+    def shard_days(self, realm=None, is_red=None, since=None, until=None):
+        """
+        有碎石的日期，例如 shard_days("Golden Wasteland", is_red=True) = 所有紅石落在暮土的日子。
+        """
+        sql = ("SELECT date, realm, map, shard_type, rewards FROM shards "
+               "WHERE have_shard = 1 AND build_id IN (SELECT MAX(build_id) FROM shards GROUP BY date)")
+        args = []
+        if realm:
+            sql += " AND realm = ?"
+            args.append(realm)
+        if is_red is not None:
+            sql += " AND is_red = ?"
+            args.append(int(is_red))
+        if since:
+            sql += " AND date >= ?"
+            args.append(str(since))
+        if until:
+            sql += " AND date <= ?"
+            args.append(str(until))
+        return [dict(r) for r in self.conn.execute(sql + " ORDER BY date", args)]
+
+    def quest_type_frequency(self, since=None, realm=None):
+        """
+        任務類型出現次數 (多到少)，回傳 [(quest_type, count), ...]。
+        """
+        sql = ("SELECT quest_type, COUNT(*) AS n FROM quests "
+               "WHERE build_id IN (SELECT MAX(build_id) FROM quests GROUP BY date)")
+        args = []
+        if since:
+            sql += " AND date >= ?"
+            args.append(str(since))
+        if realm:
+            sql += " AND realm = ?"
+            args.append(realm)
+        sql += " GROUP BY quest_type ORDER BY n DESC, quest_type"
+        return [(r["quest_type"], r["n"]) for r in self.conn.execute(sql, args)]
+
+    def quests_on(self, date):
+        sql = ("SELECT text FROM quests WHERE date = ? AND build_id = "
+               "(SELECT MAX(build_id) FROM quests WHERE date = ?) ORDER BY position")
+        return [r["text"] for r in self.conn.execute(sql, (str(date), str(date)))]
+
+    def candle_days(self, realm, kind="treasure"):
+        sql = ("SELECT date, rotation FROM candles WHERE kind = ? AND realm = ? "
+               "AND build_id IN (SELECT MAX(build_id) FROM candles GROUP BY date, kind) ORDER BY date")
+        return [dict(r) for r in self.conn.execute(sql, (kind, realm))]
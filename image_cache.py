@@ -0,0 +1,58 @@
+import json
+import os
+
+
+class ImageCache:
+    """
+    以 URL 為 key 的持久化圖片快取索引 (ETag / Last-Modified / 內容雜湊)。
+    圖片本身以內容雜湊命名，相同內容只會存在一份，且不會被重寫。
+    """
+
+    def __init__(self, index_path):
+        self.index_path = index_path
+        self.entries = {}
+        self.dirty = False
+        self.stats = {"not_modified": 0, "downloaded": 0, "unchanged": 0}
+        if os.path.exists(index_path):
+            try:
+                with open(index_path, encoding="utf-8") as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Image cache index unreadable, starting fresh: {e}")
+                self.entries = {}
+
+    def lookup(self, url):
+        """
+        回傳仍存在於磁碟上的快取項目，否則 None。
+        """
+        entry = self.entries.get(url)
+        if entry and os.path.exists(entry["file"]):
+            return entry
+        return None
+
+    def conditional_headers(self, url):
+        entry = self.lookup(url)
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, url, file, sha256, etag=None, last_modified=None):
+        entry = {"file": file, "sha256": sha256, "etag": etag, "last_modified": last_modified}
+        if self.entries.get(url) != entry:
+            self.entries[url] = entry
+            self.dirty = True
+        return entry
+
+    def save(self):
+        if not self.dirty:
+            return
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, ensure_ascii=False, indent=2, sort_keys=True)
+            f.write("\n")
+        os.replace(tmp_path, self.index_path)
+        self.dirty = False
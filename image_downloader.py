@@ -0,0 +1,112 @@
+import asyncio
+import hashlib
+import os
+
+import aiohttp
+
+import tracing
+from image_cache import ImageCache
+
+CHUNK_SIZE = 64 * 1024
+RETRY_STATUSES = {408, 429, 500, 502, 503, 504}
+HASH_NAME_LENGTH = 16
+
+
+class DownloadError(Exception):
+    pass
+
+
+def image_ext(url):
+    return "png" if ".png" in url else "jpg"
+
+
+async def _fetch_to_cache(session, cache, url, dest_dir, timeout):
+    """
+    條件式 GET：304 直接使用快取檔案；200 則串流寫入暫存檔並計算雜湊，
+    以內容雜湊命名，若同內容的檔案已存在就不再寫入。
+    回傳 (status, 本地路徑或 None)。
+    """
+    headers = cache.conditional_headers(url)
+    async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
+        if resp.status == 304:
+            cache.stats["not_modified"] += 1
+            return resp.status, cache.lookup(url)["file"]
+        if resp.status in RETRY_STATUSES:
+            raise DownloadError(f"HTTP {resp.status}")
+        if resp.status != 200:
+            # Not retryable (404 etc.)
+            return resp.status, None
+
+        digest = hashlib.sha256()
+        tmp_path = os.path.join(dest_dir, f".{hashlib.sha1(url.encode()).hexdigest()}.part")
+        try:
+            with open(tmp_path, "wb") as f:
+                async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+                    digest.update(chunk)
+                    f.write(chunk)
+                    tracing.count("images.bytes", len(chunk))
+
+            sha256 = digest.hexdigest()
+            path = f"{dest_dir}/{sha256[:HASH_NAME_LENGTH]}.{image_ext(url)}"
+            if os.path.exists(path):
+                cache.stats["unchanged"] += 1
+            else:
+                os.replace(tmp_path, path)
+                cache.stats["downloaded"] += 1
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        cache.store(url, path, sha256, etag=resp.headers.get("ETag"), last_modified=resp.headers.get("Last-Modified"))
+        return resp.status, path
+
+
+async def download_image(session, cache, url, dest_dir, retries=3, backoff=0.5, timeout=10):
+    """
+    下載單張圖片；連線錯誤、逾時與 429/5xx 會以指數退避重試。
+    成功回傳本地路徑，失敗回傳 None。
+    """
+    for attempt in range(retries + 1):
+        try:
+            with tracing.span("image_download", url=url, source=tracing.source_of(url), attempt=attempt):
+                status, path = await _fetch_to_cache(session, cache, url, dest_dir, timeout)
+            if path:
+                return path
+            print(f"Failed to download image: {url} (Status: {status})")
+            return None
+        except (aiohttp.ClientError, asyncio.TimeoutError, DownloadError) as e:
+            if attempt == retries:
+                print(f"Image Download Error: {url} ({e})")
+                return None
+            delay = backoff * (2 ** attempt)
+            print(f"Image download retry {attempt + 1}/{retries} in {delay:.1f}s: {url} ({e})")
+            tracing.count("images.retries")
+            await asyncio.sleep(delay)
+    return None
+
+
+async def download_images(session, urls, dest_dir="images", cache=None, concurrency=8, retries=3, backoff=0.5, timeout=10):
+    """
+    平行下載圖片到 dest_dir (以內容雜湊命名)，同時下載數由 concurrency 限制。
+    cache 預設為 dest_dir/cache.json 的 ImageCache，完成後寫回索引。
+    回傳成功取得的本地路徑 (依原始順序)。
+    """
+    os.makedirs(dest_dir, exist_ok=True)
+    if cache is None:
+        cache = ImageCache(os.path.join(dest_dir, "cache.json"))
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def fetch(url):
+        async with semaphore:
+            path = await download_image(session, cache, url, dest_dir, retries=retries, backoff=backoff, timeout=timeout)
+        if path:
+            print(f"Image ready: {path}")
+        return path
+
+    try:
+        results = await asyncio.gather(*[fetch(url) for url in urls])
+    finally:
+        cache.save()
+    print(f"Image cache: {cache.stats}")
+    tracing.TRACER.merge("images.cache", cache.stats)
+    return [r for r in results if r]
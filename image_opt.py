@@ -0,0 +1,75 @@
+import os
+
+from PIL import Image
+
+# 響應式圖片寬度 (px)；JPEG 後備只輸出一個中等寬度
+WIDTHS = (320, 640, 1280)
+FALLBACK_WIDTH = 640
+WEBP_QUALITY = 80
+JPEG_QUALITY = 82
+
+
+def _resized(img, width):
+    if img.width <= width:
+        return img
+    height = round(img.height * width / img.width)
+    return img.resize((width, height), Image.LANCZOS)
+
+
+def optimize_image(path, out_dir="images/opt", widths=WIDTHS, fallback_width=FALLBACK_WIDTH, root="."):
+    """
+    為單張圖片產生多種寬度的 WebP 與一張 JPEG 後備圖。
+    輸入檔以內容雜湊命名，因此輸出檔已存在時直接沿用，不重新編碼。
+    path 與 out_dir 為網站路徑 (相對於輸出目錄 root)，檔案在 root 底下讀寫。
+    回傳 { full, width, height, webp: [(path, w), ...], jpeg: (path, w) }，路徑同樣相對於 root。
+    """
+    os.makedirs(os.path.join(root, out_dir), exist_ok=True)
+    stem = os.path.splitext(os.path.basename(path))[0]
+
+    with Image.open(os.path.join(root, path)) as src:
+        src.load()
+        orig_w, orig_h = src.size
+        img = src.convert("RGBA") if src.mode in ("P", "LA") else src
+        if img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGB")
+
+        # 不放大：超過原圖寬度的尺寸只保留一張原寬度版本
+        targets = sorted({min(w, orig_w) for w in widths})
+        webp = []
+        for w in targets:
+            out = f"{out_dir}/{stem}-{w}w.webp"
+            if not os.path.exists(os.path.join(root, out)):
+                _resized(img, w).save(os.path.join(root, out), "WEBP", quality=WEBP_QUALITY, method=6)
+            webp.append((out, w))
+
+        jpeg_w = min(fallback_width, orig_w)
+        jpeg_out = f"{out_dir}/{stem}-{jpeg_w}w.jpg"
+        if not os.path.exists(os.path.join(root, jpeg_out)):
+            rgb = _resized(img, jpeg_w)
+            if rgb.mode == "RGBA":
+                # JPEG 不支援透明：以深色背景合成 (與頁面背景一致)
+                bg = Image.new("RGB", rgb.size, (30, 34, 41))
+                bg.paste(rgb, mask=rgb.split()[-1])
+                rgb = bg
+            rgb.save(os.path.join(root, jpeg_out), "JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+
+    return {
+        "full": path,
+        "width": orig_w,
+        "height": orig_h,
+        "webp": webp,
+        "jpeg": (jpeg_out, jpeg_w),
+    }
+
+
+def optimize_images(paths, out_dir="images/opt", root="."):
+    """
+    批次處理；失敗的圖片略過 (頁面會改用原圖)。回傳 { 原始路徑: variants }。
+    """
+    variants = {}
+    for path in paths:
+        try:
+            variants[path] = optimize_image(path, out_dir, root=root)
+        except Exception as e:
+            print(f"Image optimize error ({path}): {e}")
+    return variants
@@ -0,0 +1,197 @@
+import re
+from urllib.parse import urljoin
+
+import aiohttp
+from lxml import html as lxml_html
+
+import tracing
+
+NINE_BIT_HOME = "https://9-bit.jp/skygold/"
+DAILY_LINK_TEXT = "今日のデイリークエスト"
+
+# innerText 近似：區塊元素前後換行，<p> 視為兩個換行 (與瀏覽器的段落間距一致)
+BLOCK_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'dd', 'div', 'dl', 'dt', 'figcaption',
+    'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr',
+    'li', 'main', 'nav', 'ol', 'pre', 'section', 'table', 'tr', 'ul'
+}
+CELL_TAGS = {'td', 'th'}
+SKIP_TAGS = {'script', 'style', 'noscript', 'template', 'head'}
+
+
+def inner_text(el):
+    """
+    以 lxml 元素近似瀏覽器的 innerText (換行規則足以支援逐行解析)。
+    """
+    parts = []
+
+    def walk(node):
+        tag = node.tag if isinstance(node.tag, str) else None
+        if tag is None:
+            # Comment / ProcessingInstruction：只保留 tail
+            if node.tail: parts.append(node.tail)
+            return
+        tag = tag.lower()
+        if tag in SKIP_TAGS:
+            if node.tail: parts.append(node.tail)
+            return
+
+        if tag == 'br':
+            parts.append('\n')
+        elif tag == 'p':
+            parts.append('\n\n')
+        elif tag in BLOCK_TAGS:
+            parts.append('\n')
+
+        if node.text: parts.append(node.text)
+        for child in node:
+            walk(child)
+
+        if tag == 'p':
+            parts.append('\n\n')
+        elif tag in BLOCK_TAGS:
+            parts.append('\n')
+        elif tag in CELL_TAGS:
+            parts.append('\t')
+
+        if node.tail: parts.append(node.tail)
+
+    walk(el)
+    text = "".join(parts).replace('\xa0', ' ')
+    lines = [re.sub(r'[ \t]+', ' ', line).strip() for line in text.split('\n')]
+    # 合併多餘空行 (最多保留一行空白，對應段落間距)
+    text = re.sub(r'\n{3,}', '\n\n', "\n".join(lines))
+    return text.strip('\n')
+
+
+def _next_element(el):
+    # getnext() 也會回傳註解節點，這裡只走真正的元素 (nextElementSibling)
+    nxt = el.getnext()
+    while nxt is not None and not isinstance(nxt.tag, str):
+        nxt = nxt.getnext()
+    return nxt
+
+
+def find_daily_post_url(page_html, base_url=NINE_BIT_HOME):
+    """
+    在 9-bit 首頁找到「今日のデイリークエスト」文章連結。
+    """
+    doc = lxml_html.fromstring(page_html)
+    for a in doc.iter('a'):
+        if DAILY_LINK_TEXT in inner_text(a):
+            href = a.get('href')
+            if href:
+                return urljoin(base_url, href)
+    return None
+
+
+def _is_valid_quest(txt):
+    t = txt.strip()
+    if len(t) < 5: return False
+    if any(k in t for k in ['方法', '報酬', '確認', '精錬', 'デイリークエスト', '一覧']): return False
+    if '開始時間' in t or '終了時間' in t or '対象エリア' in t: return False
+    if '時' in t and '分' in t: return False  # 時間列 (日文時間字元)
+    if re.search(r'\d{1,2}月\d{1,2}日', t): return False
+    return True
+
+
+def parse_daily_post(page_html):
+    """
+    解析 9-bit 每日文章 (伺服器端渲染的 WordPress)，邏輯與瀏覽器版 page.evaluate 相同。
+    回傳 { quests, date_str, treasure_jp }；找不到任務標題時回傳 None。
+    """
+    doc = lxml_html.fromstring(page_html)
+    headers = doc.xpath('//h2 | //h3 | //h4')
+    header_texts = [inner_text(h) for h in headers]
+
+    # 1. 優先尋找「デイリークエスト一覧」(H3)，避開日期標題下的資訊表格
+    q_idx = next((i for i, t in enumerate(header_texts) if 'デイリークエスト一覧' in t), None)
+    if q_idx is None:
+        q_idx = next((i for i, t in enumerate(header_texts)
+                      if '今日' in t and 'デイリークエスト' in t and '目次' not in t), None)
+    if q_idx is None:
+        return None
+
+    q_header = headers[q_idx]
+    results = []
+
+    curr = _next_element(q_header)
+    while curr is not None and len(results) < 4:
+        tag = curr.tag.upper()
+        # Stop conditions
+        if tag == 'H2' and '一覧' not in inner_text(curr): break
+
+        # 1. TABLE (略過開始/結束時間的資訊表格)
+        if tag == 'TABLE':
+            table_text = inner_text(curr)
+            if '開始時間' in table_text or '終了時間' in table_text or '対象エリア' in table_text:
+                curr = _next_element(curr)
+                continue
+
+            for cell in curr.xpath('.//td | .//th'):
+                for line in inner_text(cell).split('\n'):
+                    if _is_valid_quest(line) and line not in results:
+                        results.append(line)
+                        if len(results) >= 4: break
+                if len(results) >= 4: break
+
+        # 2. LI/STRONG (Legacy/Mobile view)
+        if tag in ('UL', 'OL', 'P', 'DIV', 'STRONG'):
+            candidates = [curr] if tag == 'STRONG' else []
+            candidates.extend(curr.xpath('.//strong'))
+            candidates.extend(curr.xpath('.//li'))
+
+            for el in candidates:
+                txt = inner_text(el).strip()
+                if '時' in txt and '分' in txt: continue
+                if _is_valid_quest(txt) and txt not in results:
+                    results.append(txt)
+                    if len(results) >= 4: break
+
+        curr = _next_element(curr)
+
+    # 使用一覧標題時，日期需從主標題取得
+    date_str = header_texts[q_idx]
+    if '月' not in date_str:
+        date_str = next((t for t in header_texts if '今日' in t and 'デイリークエスト' in t), date_str)
+
+    # 大蠟燭資訊：「大キャンドル」所在行與其後 5 行
+    treasure_jp = ""
+    body = doc.find('body')
+    lines = inner_text(body if body is not None else doc).split('\n')
+    for i, line in enumerate(lines):
+        if "大キャンドル" in line:
+            treasure_jp = " ".join(lines[i:i+6]).strip()
+            break
+
+    return {'quests': results, 'date_str': date_str, 'treasure_jp': treasure_jp}
+
+
+async def _get_text(session, url, timeout):
+    with tracing.span("http_get", url=url, source=tracing.source_of(url)):
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
+            resp.raise_for_status()
+            body = await resp.read()
+            tracing.count("http.bytes", len(body))
+            return body.decode(resp.get_encoding())
+
+
+async def fetch_daily_post(session, timeout=15):
+    """
+    不啟動瀏覽器，直接以 HTTP 取得並解析今日的 9-bit 文章。
+    解析失敗 (找不到連結或任務) 時回傳 None，由呼叫端改用 Playwright。
+    """
+    home_html = await _get_text(session, NINE_BIT_HOME, timeout)
+    post_url = find_daily_post_url(home_html)
+    if not post_url:
+        print("DEBUG: [static] 未找到每日任務連結")
+        return None
+
+    print(f"DEBUG: [static] Found Daily Post URL: {post_url}")
+    post = parse_daily_post(await _get_text(session, post_url, timeout))
+    if not post or not post['quests']:
+        print("DEBUG: [static] 每日文章解析失敗")
+        return None
+
+    post['url'] = post_url
+    return post
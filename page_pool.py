@@ -0,0 +1,123 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+from tracing import TracedPage
+
+
+class PagePool:
+    """
+    共用 BrowserContext 上的可重複使用頁面池 (checkout / return)。
+    閒置頁面會保留以便下次使用，總數不超過 max_size；歸還時重設頁面狀態。
+    指定 tracer 時，新頁面以 TracedPage 包裝 (記錄 goto / evaluate 耗時)。
+    """
+
+    def __init__(self, context, max_size=4, tracer=None):
+        self.context = context
+        self.max_size = max(1, max_size)
+        self.tracer = tracer
+        self._idle = []
+        self._all = set()
+        self._cond = asyncio.Condition()
+        self._tasks = set()  # 背景的關閉 / 喚醒工作 (保留參照避免被回收)
+        self.created = 0
+        self.reused = 0
+
+    async def acquire(self):
+        async with self._cond:
+            while True:
+                while self._idle:
+                    page = self._idle.pop()
+                    if not page.is_closed():
+                        self.reused += 1
+                        return page
+                    self._all.discard(page)
+
+                if len(self._all) < self.max_size:
+                    # Reserve the slot before awaiting new_page() so concurrent callers respect max_size
+                    placeholder = object()
+                    self._all.add(placeholder)
+                    break
+
+                await self._cond.wait()
+
+        try:
+            page = await self.context.new_page()
+            if self.tracer is not None:
+                page = TracedPage(page, self.tracer)
+        except BaseException:
+            async with self._cond:
+                self._all.discard(placeholder)
+                self._cond.notify()
+            raise
+
+        async with self._cond:
+            self._all.discard(placeholder)
+            self._all.add(page)
+        self.created += 1
+        return page
+
+    async def release(self, page):
+        """
+        歸還頁面：移除路由並導向 about:blank；重設失敗 (例如頁面已崩潰) 則直接丟棄。
+        歸還途中被取消時頁面狀態不明，同樣丟棄 (背景關閉)；不論如何槽位都會釋出。
+        """
+        healthy = not page.is_closed()
+        try:
+            if healthy:
+                try:
+                    await self._reset(page)
+                except Exception:
+                    healthy = False
+                    await self._close_quietly(page)
+        except BaseException:
+            healthy = False
+            self._background(self._close_quietly(page))
+            raise
+        finally:
+            # Bookkeeping without awaiting, so a cancellation cannot skip it
+            if healthy:
+                self._idle.append(page)
+            else:
+                self._all.discard(page)
+            self._background(self._notify())
+
+    async def _notify(self):
+        async with self._cond:
+            self._cond.notify()
+
+    async def _close_quietly(self, page):
+        try:
+            await page.close()
+        except Exception:
+            pass
+
+    def _background(self, coro):
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _reset(self, page):
+        if hasattr(page, "unroute_all"):
+            await page.unroute_all(behavior="ignoreErrors")
+        else:
+            await page.unroute("**/*")
+        await page.goto("about:blank")
+
+    @asynccontextmanager
+    async def page(self):
+        page = await self.acquire()
+        try:
+            yield page
+        finally:
+            await self.release(page)
+
+    async def close(self):
+        async with self._cond:
+            pages = [p for p in self._all if hasattr(p, "close")]  # skip slot placeholders
+            self._idle.clear()
+            self._all.clear()
+        for page in pages:
+            try:
+                await page.close()
+            except Exception:
+                pass
@@ -0,0 +1,90 @@
+from urllib.parse import urlsplit
+
+
+def _host(url):
+    try:
+        return urlsplit(url).hostname or ""
+    except ValueError:
+        return ""
+
+
+def _host_matches(host, domain):
+    return host == domain or host.endswith("." + domain)
+
+
+class ResourcePolicy:
+    """
+    BrowserContext 層級的請求攔截：依來源 (頁面網域) 套用允許清單，並統計放行/封鎖的請求與位元組。
+    放行的請求以 route.fallback() 交給先前註冊的路由 (例如 fixture 重播的 HAR)，沒有其他路由時直接連網。
+    """
+
+    def __init__(self, policies, default_blocked_types=()):
+        self.policies = policies
+        self.default_blocked_types = set(default_blocked_types)
+        self.stats = {}
+
+    async def install(self, context):
+        await context.route("**/*", self.handle)
+        context.on("requestfinished", self._on_finished)
+
+    def source_for(self, request):
+        # Navigation requests belong to the URL being loaded; sub-resources to the frame's document
+        url = request.url
+        if not request.is_navigation_request():
+            try:
+                url = request.frame.url or url
+            except Exception:
+                pass
+        host = _host(url)
+        for source in self.policies:
+            if _host_matches(host, source):
+                return source
+        return None
+
+    def is_allowed(self, source, request):
+        if source is None:
+            return request.resource_type not in self.default_blocked_types
+        policy = self.policies[source]
+        if request.resource_type not in policy["types"]:
+            return False
+        host = _host(request.url)
+        return any(_host_matches(host, h) for h in policy["hosts"])
+
+    def _bucket(self, source):
+        return self.stats.setdefault(source or "other", {
+            "allowed_requests": 0,
+            "allowed_bytes": 0,
+            "blocked_requests": 0,
+            "blocked_by_type": {},
+        })
+
+    async def handle(self, route):
+        request = route.request
+        source = self.source_for(request)
+        bucket = self._bucket(source)
+        if self.is_allowed(source, request):
+            bucket["allowed_requests"] += 1
+            await route.fallback()
+        else:
+            bucket["blocked_requests"] += 1
+            by_type = bucket["blocked_by_type"]
+            by_type[request.resource_type] = by_type.get(request.resource_type, 0) + 1
+            await route.abort()
+
+    async def _on_finished(self, request):
+        try:
+            sizes = await request.sizes()
+        except Exception:
+            return
+        self._bucket(self.source_for(request))["allowed_bytes"] += (
+            sizes.get("responseHeadersSize", 0) + sizes.get("responseBodySize", 0)
+        )
+
+    def summary(self):
+        lines = []
+        for source, b in sorted(self.stats.items()):
+            lines.append(
+                f"{source}: allowed {b['allowed_requests']} req / {b['allowed_bytes'] / 1024:.1f} KB, "
+                f"blocked {b['blocked_requests']} req {b['blocked_by_type']}"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,82 @@
+import json
+import os
+from datetime import datetime, time, timedelta
+
+import numpy as np
+
+import artifacts
+import candle_data
+import clock_pred
+import shard_pred
+
+SCHEDULE_VERSION = 1
+
+
+def _epoch_seconds(values):
+    return values.astype('datetime64[s]').astype(np.int64).tolist()
+
+
+def build_schedule(start_day=None, days=7):
+    """
+    預先計算從 start_day (Sky 日期，預設今天) 起 days 天的排程，供頁面 JS 二分搜尋：
+    - events: 噴泉 / 奶奶 / 海龜的開始時間 (epoch 秒，已排序) 與持續秒數
+    - shards: 每日碎石卡片文字 (與 shard_pred.describe 相同) 與降落 ~ 結束區間 (epoch 秒)
+    - candles: 每日大蠟燭地區輪替與說明
+    Sky 重置後、下一次建置前，頁面以當天的項目重畫碎石與大蠟燭卡片。
+    範圍固定以 Sky 午夜為界，同一天內重複產生的內容相同。
+    """
+    if start_day is None:
+        start_day = shard_pred.sky_today()
+    start = datetime.combine(start_day, time(0), tzinfo=clock_pred.SKY_TZ)
+    end = datetime.combine(start_day + timedelta(days=days), time(0), tzinfo=clock_pred.SKY_TZ)
+
+    events = {}
+    for key, times in clock_pred.get_event_schedule(start, end).items():
+        events[key] = {
+            'duration': clock_pred.EVENTS[key]['duration'] * 60,
+            'start': _epoch_seconds(times['start']),
+        }
+
+    shards = []
+    candles = []
+    for i in range(days):
+        day = start_day + timedelta(days=i)
+        info = shard_pred.get_shard_info(day)
+        text = shard_pred.describe(info)
+        shards.append({
+            'date': day.isoformat(),
+            'have_shard': info['have_shard'],
+            'type': text['type'],
+            'dateText': text.get('dateText', ''),
+            'map': text['map'],
+            'rewards': text['rewards'],
+            'eruptions': text['eruptions'],
+            'windows': [[int(o['land'].timestamp()), int(o['end'].timestamp())]
+                        for o in info['occurrences']] if info['have_shard'] else [],
+        })
+        treasure = candle_data.predict_treasure(day)
+        candles.append({'date': day.isoformat(), **treasure,
+                        'descriptions': candle_data.get_treasure_desc(treasure['realm'], treasure['rotation'])})
+
+    return {
+        'version': SCHEDULE_VERSION,
+        'start': start_day.isoformat(),
+        'days': days,
+        'events': events,
+        'shards': shards,
+        'candles': candles,
+    }
+
+
+def write_schedule(path="schedule.json", days=7, start_day=None):
+    """
+    寫出 schedule.json (與 index.html 同目錄，含 .gz / .br)，內容未變時不寫入。回傳 (絕對路徑, 是否有寫入)。
+    """
+    schedule = build_schedule(start_day, days)
+    changed = artifacts.publish(path, json.dumps(schedule, ensure_ascii=False, separators=(",", ":")))
+    return os.path.abspath(path), changed
+
+
+if __name__ == "__main__":
+    s = build_schedule(days=2)
+    print(json.dumps(s, ensure_ascii=False, indent=1)[:1500])
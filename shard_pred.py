@@ -0,0 +1,189 @@
+from datetime import datetime, timedelta, time, timezone
+from zoneinfo import ZoneInfo
+
+from clock_pred import SKY_TZ
+
+# Sky 每日重置為洛杉磯 (SKY_TZ) 午夜；顯示時區與爬蟲瀏覽器設定一致
+DISPLAY_TZ = ZoneInfo("Asia/Taipei")
+
+# 碎石排程 (與 sky-shards.pages.dev 相同的推算規則)
+# no_shard_weekdays 使用 isoweekday：1=週一 ... 7=週日
+SHARDS_INFO = [
+    {'no_shard_weekdays': (6, 7), 'interval': timedelta(hours=8), 'offset': timedelta(hours=1, minutes=50),
+     'maps': ['prairie.butterfly', 'forest.brook', 'valley.rink', 'wasteland.temple', 'vault.starlight']},
+    {'no_shard_weekdays': (7, 1), 'interval': timedelta(hours=8), 'offset': timedelta(hours=2, minutes=10),
+     'maps': ['prairie.village', 'forest.boneyard', 'valley.rink', 'wasteland.battlefield', 'vault.starlight']},
+    {'no_shard_weekdays': (1, 2), 'interval': timedelta(hours=6), 'offset': timedelta(hours=7, minutes=40), 'reward_ac': 2,
+     'maps': ['prairie.cave', 'forest.end', 'valley.dreams', 'wasteland.graveyard', 'vault.jelly']},
+    {'no_shard_weekdays': (2, 3), 'interval': timedelta(hours=6), 'offset': timedelta(hours=2, minutes=20), 'reward_ac': 2.5,
+     'maps': ['prairie.bird', 'forest.tree', 'valley.dreams', 'wasteland.crab', 'vault.jelly']},
+    {'no_shard_weekdays': (3, 4), 'interval': timedelta(hours=6), 'offset': timedelta(hours=3, minutes=30), 'reward_ac': 3.5,
+     'maps': ['prairie.island', 'forest.sunny', 'valley.hermit', 'wasteland.ark', 'vault.jelly']},
+]
+
+# 部分地圖的紅石獎勵與預設值不同
+OVERRIDE_REWARD_AC = {
+    'forest.end': 2.5,
+    'valley.dreams': 2.5,
+    'forest.tree': 3.5,
+    'vault.jelly': 3.5,
+}
+
+REALMS = ['prairie', 'forest', 'valley', 'wasteland', 'vault']
+
+# realm_key: (英文名稱, 中文名稱)
+REALM_NAMES = {
+    'prairie': ('Daylight Prairie', '雲野'),
+    'forest': ('Hidden Forest', '雨林'),
+    'valley': ('Valley of Triumph', '霞谷'),
+    'wasteland': ('Golden Wasteland', '暮土'),
+    'vault': ('Vault of Knowledge', '禁閣'),
+}
+
+MAP_NAMES = {
+    'prairie.butterfly': '蝴蝶平原',
+    'prairie.village': '村莊島嶼',
+    'prairie.cave': '雲野洞穴',
+    'prairie.bird': '鳥巢',
+    'prairie.island': '聖島',
+    'forest.brook': '靜謐庭院',
+    'forest.boneyard': '骨骸之地',
+    'forest.end': '雨林終點',
+    'forest.tree': '樹屋',
+    'forest.sunny': '陽光林地',
+    'valley.rink': '溜冰場',
+    'valley.dreams': '夢想村',
+    'valley.hermit': '隱士山谷',
+    'wasteland.temple': '破敗神殿',
+    'wasteland.battlefield': '戰場',
+    'wasteland.graveyard': '四龍圖',
+    'wasteland.crab': '螃蟹平原',
+    'wasteland.ark': '遠古方舟',
+    'vault.starlight': '星光沙漠',
+    'vault.jelly': '水母港灣',
+}
+
+# 碎石降落 (可開始清理) 與結束時間相對於爆發開始的偏移
+LAND_OFFSET = timedelta(minutes=8, seconds=40)
+END_OFFSET = timedelta(hours=4)
+
+WEEKDAYS_ZH = ["星期一", "星期二", "星期三", "星期四", "星期五", "星期六", "星期日"]
+
+
+def sky_today(now=None):
+    """
+    回傳目前 Sky 日期 (洛杉磯時區的日曆日)。
+    """
+    if now is None:
+        now = datetime.now(SKY_TZ)
+    elif now.tzinfo is None:
+        now = now.astimezone()
+    return now.astimezone(SKY_TZ).date()
+
+
+def get_shard_info(day):
+    """
+    計算指定 Sky 日期 (date) 的碎石資訊，不需要任何網路請求。
+    回傳的時間皆為 aware datetime (UTC)。
+    """
+    day_of_month = day.day
+    weekday = day.isoweekday()
+
+    is_red = day_of_month % 2 == 1
+    realm_idx = (day_of_month - 1) % 5
+    if is_red:
+        info_idx = ((day_of_month - 1) // 2) % 3 + 2
+    else:
+        info_idx = (day_of_month // 2) % 2
+    info = SHARDS_INFO[info_idx]
+
+    realm = REALMS[realm_idx]
+    map_key = info['maps'][realm_idx]
+    reward_ac = OVERRIDE_REWARD_AC.get(map_key, info.get('reward_ac')) if is_red else None
+
+    # 偏移量以當地時鐘計算 (aware datetime + timedelta 為牆上時間運算)，
+    # 夏令時間切換的週日仍落在正確的當地時刻
+    first_start = datetime.combine(day, time(0), tzinfo=SKY_TZ) + info['offset']
+    first_start = first_start.astimezone(timezone.utc)
+
+    occurrences = []
+    for i in range(3):
+        start = first_start + info['interval'] * i
+        occurrences.append({
+            'start': start,
+            'land': start + LAND_OFFSET,
+            'end': start + END_OFFSET,
+        })
+
+    return {
+        'date': day,
+        'is_red': is_red,
+        'have_shard': weekday not in info['no_shard_weekdays'],
+        'realm': realm,
+        'map': map_key,
+        'reward_ac': reward_ac,
+        'occurrences': occurrences,
+    }
+
+
+def find_next_shard(day, max_days=7):
+    """
+    從指定日期 (含) 起尋找下一個有碎石的日期，最多往後 max_days 天。
+    """
+    for i in range(max_days + 1):
+        info = get_shard_info(day + timedelta(days=i))
+        if info['have_shard']:
+            return info
+    return None
+
+
+def format_ch_time(dt, tz=DISPLAY_TZ):
+    """
+    格式化為網站使用的 12 小時制中文時間，例如「下午07:38:40」。
+    """
+    local = dt.astimezone(tz)
+    prefix = "下午" if local.hour >= 12 else "上午"
+    h = local.hour % 12 or 12
+    return f"{prefix}{h:02d}:{local.minute:02d}:{local.second:02d}"
+
+
+def format_date(day):
+    return f"{day.year}年{day.month}月{day.day}日 {WEEKDAYS_ZH[day.weekday()]}"
+
+
+def describe(info, tz=DISPLAY_TZ):
+    """
+    轉換為 UI 使用的文字欄位 (與爬蟲解析網站的欄位相同)。
+    """
+    realm_en, realm_zh = REALM_NAMES[info['realm']]
+    if not info['have_shard']:
+        return {
+            "type": "無碎石 (No Shard)",
+            "map": "無",
+            "rewards": "無",
+            "eruptions": [],
+            "realm": realm_en,
+        }
+
+    if info['is_red']:
+        shard_type = "紅石 (Red)"
+        rewards = f"獎勵可達 {info['reward_ac']:g} 支昇華蠟燭"
+    else:
+        shard_type = "黑石 (Black)"
+        rewards = "獎勵: 燭火 (Wax)"
+
+    return {
+        "type": shard_type,
+        "map": f"{realm_zh} {MAP_NAMES.get(info['map'], info['map'])}",
+        "dateText": format_date(info['date']),
+        "rewards": rewards,
+        "eruptions": [f"{format_ch_time(o['land'], tz)} - {format_ch_time(o['end'], tz)}" for o in info['occurrences']],
+        "realm": realm_en,
+    }
+
+
+if __name__ == "__main__":
+    today = sky_today()
+    for i in range(8):
+        info = get_shard_info(today + timedelta(days=i))
+        print(info['date'], info['have_shard'], describe(info))
@@ -0,0 +1,109 @@
+import json
+import os
+import time
+
+
+class SnapshotStore:
+    """
+    各抓取來源最後一次成功結果 (last-known-good) 的持久化快照，附時間戳與 TTL：
+    - 未超過 ttl 視為新鮮 (fresh)
+    - 超過 ttl、但未超過 max_stale 仍可在來源失敗時當作舊資料 (stale) 使用
+    - 超過 max_stale 則不再使用
+    """
+
+    def __init__(self, path, ttls=None, max_stale=None):
+        self.path = path
+        self.ttls = ttls or {}
+        self.max_stale = max_stale or {}
+        self.entries = {}
+        self.dirty = False
+        self.served_stale = {}  # name -> 快照的 stored_at (epoch 秒)，本次建置以舊資料替代的來源
+        self.stats = {"stored": 0, "stale_served": 0, "expired": 0}
+        if path and os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Snapshot store unreadable, starting fresh: {e}")
+                self.entries = {}
+
+    def _policy(self, name, table, default):
+        # "fandom:Golden Wasteland" 之類的 key 使用 "fandom" 的設定
+        return table.get(name, table.get(name.split(":", 1)[0], default))
+
+    def stored_at(self, name):
+        entry = self.entries.get(name)
+        return entry["stored_at"] if entry else None
+
+    def age(self, name, now=None):
+        stored_at = self.stored_at(name)
+        if stored_at is None:
+            return None
+        return (now or time.time()) - stored_at
+
+    def is_fresh(self, name, now=None):
+        age = self.age(name, now)
+        return age is not None and age <= self._policy(name, self.ttls, 0)
+
+    def get(self, name, now=None):
+        """
+        回傳 (value, age 秒, fresh)；沒有快照或已超過 max_stale 時回傳 None。
+        """
+        age = self.age(name, now)
+        if age is None:
+            return None
+        if age > self._policy(name, self.max_stale, self._policy(name, self.ttls, 0)):
+            self.stats["expired"] += 1
+            return None
+        return self.entries[name]["value"], age, age <= self._policy(name, self.ttls, 0)
+
+    def put(self, name, value, now=None):
+        # JSON 來回一次，確保快照與重新讀取時的型別一致 (tuple -> list)
+        value = json.loads(json.dumps(value, ensure_ascii=False))
+        entry = self.entries.get(name)
+        if entry is not None and entry["value"] == value and self.is_fresh(name, now):
+            return
+        self.entries[name] = {"value": value, "stored_at": now or time.time()}
+        self.stats["stored"] += 1
+        self.dirty = True
+
+    def serve_stale(self, name, default=None, now=None):
+        """
+        來源失敗時的備援：有可用快照就回傳其值並記錄為 stale，否則回傳 default。
+        """
+        hit = self.get(name, now)
+        if hit is None:
+            return default
+        value, age, _ = hit
+        self.served_stale[name] = self.stored_at(name)
+        self.stats["stale_served"] += 1
+        print(f"Serving stale snapshot for {name} ({age / 3600:.1f}h old)")
+        return value
+
+    def fallback(self, name, default=None):
+        """
+        給 task_runner.SourceTask 使用的備援函式 (需要時才讀取快照)。
+        default 可為無參數函式。
+        """
+        def resolve():
+            value = self.serve_stale(name)
+            if value is not None:
+                return value
+            return default() if callable(default) else default
+        return resolve
+
+    def summary(self):
+        s = self.stats
+        return (f"Snapshots: {len(self.entries)} stored, {s['stored']} updated, "
+                f"{s['stale_served']} served stale, {s['expired']} expired")
+
+    def save(self):
+        if not self.dirty or not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, ensure_ascii=False, indent=2, sort_keys=True)
+            f.write("\n")
+        os.replace(tmp_path, self.path)
+        self.dirty = False
@@ -0,0 +1,71 @@
+import glob
+import hashlib
+import json
+import os
+
+import artifacts
+import config
+
+# 原始樣式與腳本 (與程式碼放在一起，不受目前工作目錄影響)
+SOURCE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+ASSET_NAMES = ("app.css", "app.js")
+HASH_LENGTH = 10
+# 目前與上一版雜湊檔名的紀錄 (static/ 底下)
+VERSIONS_FILE = "versions.json"
+
+
+def hashed_name(name, data):
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:HASH_LENGTH]}{ext}"
+
+
+def _load_versions(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def build_assets(out_dir=".", names=ASSET_NAMES, source_dir=SOURCE_DIR):
+    """
+    將 assets/ 的樣式與腳本以內容雜湊命名輸出到 out_dir/static/ (例如 static/app.3f9a1c02be.css)，
+    內容不變時檔名不變、也不重寫，因此可以設定永久快取；同時輸出 .gz / .br。
+    保留目前與上一版 (瀏覽器 / CDN 快取中的舊 index.html 仍會引用)，更早的版本才移除；
+    各版本記錄在 static/versions.json (檔案時間在 git checkout 後不可靠)。
+    回傳 {原始名稱: 頁面使用的相對路徑}。
+    """
+    static_dir = os.path.join(out_dir, config.STATIC_DIR)
+    os.makedirs(static_dir, exist_ok=True)
+    versions_path = os.path.join(static_dir, VERSIONS_FILE)
+    versions = _load_versions(versions_path)
+    manifest = {}
+    for name in names:
+        with open(os.path.join(source_dir, name), "rb") as f:
+            data = f.read()
+        filename = hashed_name(name, data)
+        path = os.path.join(static_dir, filename)
+        artifacts.publish(path, data)
+        manifest[name] = f"{config.STATIC_DIR}/{filename}"
+
+        # [目前, 上一版]；內容改變時目前版本變成上一版
+        stem, ext = os.path.splitext(name)
+        existing = sorted(os.path.basename(p) for p in glob.glob(os.path.join(static_dir, f"{stem}.*{ext}")))
+        generations = versions.get(name)
+        if generations is None:
+            # 還沒有紀錄：不知道哪個是上一版，先全部保留
+            generations = [filename] + [f for f in existing if f != filename]
+        elif generations[0] != filename:
+            generations = [filename] + generations[:1]
+        versions[name] = generations
+
+        keep = set()
+        for kept in generations:
+            kept_path = os.path.join(static_dir, kept)
+            keep.update({kept_path, *artifacts.sibling_paths(kept_path)})
+        for old in glob.glob(os.path.join(static_dir, f"{stem}.*{ext}*")):
+            if old not in keep:
+                os.remove(old)
+
+    artifacts.write_if_changed(versions_path, json.dumps(versions, indent=1, sort_keys=True) + "\n")
+    return manifest
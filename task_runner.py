@@ -0,0 +1,89 @@
+import asyncio
+import time
+
+import tracing
+
+
+class SourceTask:
+    """
+    一個資料來源的抓取任務：factory 為回傳 coroutine 的函式，timeout 為此來源的時間預算 (秒)，
+    fallback 為失敗 / 逾時 / 取消 / 回傳 None 時使用的值 (可為無參數函式，於需要時才計算)。
+    accept 可判斷「有回傳但內容是空的」結果 (例如方法內部吞掉錯誤)，回傳 False 時同樣改用 fallback。
+    """
+
+    def __init__(self, name, factory, timeout=None, fallback=None, accept=None):
+        self.name = name
+        self.factory = factory
+        self.timeout = timeout
+        self.fallback = fallback
+        self.accept = accept
+
+    def fallback_value(self):
+        return self.fallback() if callable(self.fallback) else self.fallback
+
+
+class TaskOutcome:
+    def __init__(self, name, value, status, elapsed, error=None):
+        self.name = name
+        self.value = value
+        self.status = status  # ok / empty / timeout / error / cancelled
+        self.elapsed = elapsed
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.status == "ok"
+
+    def __repr__(self):
+        detail = f" ({self.error})" if self.error else ""
+        return f"{self.name}: {self.status} in {self.elapsed:.1f}s{detail}"
+
+
+async def run_sources(tasks, deadline=None):
+    """
+    平行執行所有來源：各自受 timeout 限制，整體超過 deadline 時取消尚未完成的任務 (並等待其清理)。
+    完成的結果照常使用，其餘改用各自的 fallback。回傳 {name: TaskOutcome}，順序與 tasks 相同。
+    """
+    finished_at = {}
+    started = time.perf_counter()
+
+    async def run_one(spec):
+        try:
+            with tracing.span(spec.name):
+                if spec.timeout:
+                    return await asyncio.wait_for(spec.factory(), spec.timeout)
+                return await spec.factory()
+        finally:
+            finished_at[spec.name] = time.perf_counter()
+
+    running = {asyncio.create_task(run_one(spec)): spec for spec in tasks}
+    done, pending = await asyncio.wait(running, timeout=deadline)
+
+    # Stragglers past the build deadline: cancel and let their finally blocks run
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    outcomes = {}
+    for task, spec in running.items():
+        elapsed = finished_at.get(spec.name, time.perf_counter()) - started
+        if task in pending:
+            status, value, error = "cancelled", None, f"build deadline {deadline}s"
+        elif task.cancelled():
+            status, value, error = "cancelled", None, None
+        elif isinstance(task.exception(), asyncio.TimeoutError):
+            status, value, error = "timeout", None, f"over {spec.timeout}s"
+        elif task.exception() is not None:
+            exc = task.exception()
+            status, value, error = "error", None, f"{type(exc).__name__}: {exc}"
+        elif task.result() is None or (spec.accept and not spec.accept(task.result())):
+            status, value, error = "empty", None, None
+        else:
+            status, value, error = "ok", task.result(), None
+
+        if status != "ok":
+            value = spec.fallback_value()
+            tracing.count(f"tasks.{status}")
+        outcomes[spec.name] = TaskOutcome(spec.name, value, status, elapsed, error)
+    return outcomes
@@ -0,0 +1,166 @@
+import contextvars
+import json
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+# 目前所在的 span (asyncio task 建立時會複製 context，平行的階段各自保有父 span)
+_current = contextvars.ContextVar("tracing_span", default=None)
+
+
+def source_of(url):
+    """
+    以主機名稱作為來源標記，例如 9-bit.jp、sky-shards.pages.dev。
+    """
+    return urlsplit(url or "").hostname or ""
+
+
+class Tracer:
+    """
+    輕量建置追蹤：span() 記錄各階段耗時 (可巢狀、可跨 await)，count() 累計計數器
+    (傳輸位元組、重試次數、快取命中等)，最後輸出 build_report.json 與摘要表。
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """
+        清空已記錄的 span 與計數器 (常駐模式每次更新輸出摘要後呼叫，避免無限增長)。
+        """
+        self.spans = []
+        self.counters = defaultdict(int)
+        self._origin = time.perf_counter()
+        self._next_id = 0
+
+    @contextmanager
+    def span(self, name, **attrs):
+        parent = _current.get()
+        self._next_id += 1
+        record = {
+            "id": self._next_id,
+            "name": name,
+            "path": f"{parent['path']}/{name}" if parent else name,
+            "parent": parent["id"] if parent else None,
+            "start": round(time.perf_counter() - self._origin, 6),
+            "duration": None,
+            "status": "ok",
+        }
+        if attrs:
+            record["attrs"] = attrs
+        token = _current.set(record)
+        started = time.perf_counter()
+        try:
+            yield record
+        except BaseException as e:
+            record["status"] = type(e).__name__
+            raise
+        finally:
+            record["duration"] = round(time.perf_counter() - started, 6)
+            _current.reset(token)
+            self.spans.append(record)
+
+    def count(self, name, n=1):
+        self.counters[name] += n
+
+    def merge(self, prefix, stats):
+        """
+        併入其他元件的統計 (只取數值欄位，巢狀 dict 以 . 連接鍵名)。
+        """
+        for key, value in stats.items():
+            if isinstance(value, dict):
+                self.merge(f"{prefix}.{key}", value)
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                self.counters[f"{prefix}.{key}"] += value
+
+    def stages(self):
+        """
+        依 span 路徑彙總：次數、總耗時、最長耗時、錯誤數。
+        """
+        rows = {}
+        for s in self.spans:
+            row = rows.setdefault(s["path"], {"path": s["path"], "count": 0, "total": 0.0, "max": 0.0, "errors": 0})
+            row["count"] += 1
+            row["total"] += s["duration"]
+            row["max"] = max(row["max"], s["duration"])
+            if s["status"] != "ok":
+                row["errors"] += 1
+        return sorted(rows.values(), key=lambda r: r["path"])
+
+    def sources(self):
+        """
+        依來源 (主機) 彙總導覽 / evaluate / HTTP 的耗時。
+        """
+        totals = defaultdict(lambda: {"count": 0, "total": 0.0})
+        for s in self.spans:
+            source = s.get("attrs", {}).get("source")
+            if source:
+                totals[source]["count"] += 1
+                totals[source]["total"] += s["duration"]
+        return {k: {"count": v["count"], "total": round(v["total"], 6)} for k, v in sorted(totals.items())}
+
+    def report(self):
+        return {
+            "total_seconds": round(time.perf_counter() - self._origin, 6),
+            "stages": [{**r, "total": round(r["total"], 6), "max": round(r["max"], 6)} for r in self.stages()],
+            "sources": self.sources(),
+            "counters": dict(sorted(self.counters.items())),
+            "spans": sorted(self.spans, key=lambda s: s["start"]),
+        }
+
+    def write_report(self, path="build_report.json"):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=2)
+        return path
+
+    def summary(self):
+        lines = [f"{'stage':<44} {'n':>4} {'total s':>9} {'max s':>8} {'err':>4}"]
+        for r in self.stages():
+            lines.append(f"{r['path'][:44]:<44} {r['count']:>4} {r['total']:>9.3f} {r['max']:>8.3f} {r['errors']:>4}")
+        sources = self.sources()
+        if sources:
+            lines.append("")
+            lines.append(f"{'source':<44} {'n':>4} {'total s':>9}")
+            for name, v in sources.items():
+                lines.append(f"{name[:44]:<44} {v['count']:>4} {v['total']:>9.3f}")
+        if self.counters:
+            lines.append("")
+            for name, value in sorted(self.counters.items()):
+                lines.append(f"{name:<44} {value:>14,}")
+        return "\n".join(lines)
+
+
+class TracedPage:
+    """
+    Playwright Page 代理：goto / evaluate 記錄為 span (標記來源主機)，其餘屬性直接轉交。
+    """
+
+    def __init__(self, page, tracer):
+        self._page = page
+        self._tracer = tracer
+
+    def __getattr__(self, name):
+        return getattr(self._page, name)
+
+    async def goto(self, url, **kwargs):
+        if url.startswith("about:"):
+            return await self._page.goto(url, **kwargs)
+        with self._tracer.span("navigate", url=url, source=source_of(url)):
+            return await self._page.goto(url, **kwargs)
+
+    async def evaluate(self, expression, *args, **kwargs):
+        with self._tracer.span("evaluate", source=source_of(self._page.url)):
+            return await self._page.evaluate(expression, *args, **kwargs)
+
+
+# 整個建置共用的預設 tracer
+TRACER = Tracer()
+
+
+def span(name, **attrs):
+    return TRACER.span(name, **attrs)
+
+
+def count(name, n=1):
+    TRACER.count(name, n)
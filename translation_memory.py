@@ -0,0 +1,113 @@
+import json
+import os
+import re
+import unicodedata
+from collections import OrderedDict
+from datetime import date
+
+import translator
+
+
+def normalize(text):
+    """
+    翻譯記憶的 key：NFC 正規化並合併空白 (不做全形/半形轉換，以免改變對照結果)。
+    """
+    return re.sub(r'\s+', ' ', unicodedata.normalize("NFC", text)).strip()
+
+
+class TranslationMemory:
+    """
+    任務翻譯記憶：已知句子直接回傳，只有沒看過的句子才進入規則翻譯 (translator)。
+    - 行程內 LRU 快取 + 持久化 JSON 檔
+    - reviewed=True 的項目為人工確認過的翻譯，規則更新後仍保留
+    - 未審核項目若是由舊版規則產生 (rules 不同)，視為未命中並重新翻譯
+    """
+
+    def __init__(self, path, lru_size=512):
+        self.path = path
+        self.lru_size = lru_size
+        self.entries = {}
+        self.lru = OrderedDict()
+        self.dirty = False
+        self.stats = {"lru_hits": 0, "store_hits": 0, "misses": 0}
+        self.new_sources = []
+        if path and os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Translation memory unreadable, starting fresh: {e}")
+                self.entries = {}
+
+    def _remember(self, key, value):
+        self.lru[key] = value
+        self.lru.move_to_end(key)
+        if len(self.lru) > self.lru_size:
+            self.lru.popitem(last=False)
+
+    def lookup(self, text):
+        key = normalize(text)
+        if key in self.lru:
+            self.lru.move_to_end(key)
+            self.stats["lru_hits"] += 1
+            return self.lru[key]
+
+        entry = self.entries.get(key)
+        if entry and (entry.get("reviewed") or entry.get("rules") == translator.RULES_VERSION):
+            self.stats["store_hits"] += 1
+            self._remember(key, entry["target"])
+            return entry["target"]
+        return None
+
+    def translate(self, text):
+        cached = self.lookup(text)
+        if cached is not None:
+            return cached
+
+        key = normalize(text)
+        target = translator.translate_quest(text)
+        self.stats["misses"] += 1
+        if key not in self.entries:
+            self.new_sources.append(key)
+
+        entry = self.entries.get(key, {})
+        self.entries[key] = {
+            "target": target,
+            "reviewed": False,
+            "rules": translator.RULES_VERSION,
+            "first_seen": entry.get("first_seen", date.today().isoformat()),
+        }
+        if entry != self.entries[key]:
+            self.dirty = True
+        self._remember(key, target)
+        return target
+
+    def review(self, text, target):
+        """
+        記錄人工確認的翻譯 (之後不受規則更新影響)。
+        """
+        key = normalize(text)
+        entry = self.entries.get(key, {})
+        entry.update({"target": target, "reviewed": True})
+        entry.setdefault("first_seen", date.today().isoformat())
+        self.entries[key] = entry
+        self.lru.pop(key, None)
+        self.dirty = True
+
+    def summary(self):
+        s = self.stats
+        line = f"Translation memory: {s['lru_hits']} LRU hits, {s['store_hits']} store hits, {s['misses']} misses"
+        if self.new_sources:
+            line += f"\nNew quest wording: {self.new_sources}"
+        return line
+
+    def save(self):
+        if not self.dirty or not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, ensure_ascii=False, indent=2, sort_keys=True)
+            f.write("\n")
+        os.replace(tmp_path, self.path)
+        self.dirty = False
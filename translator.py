@@ -0,0 +1,238 @@
+import hashlib
+
+# 日文任務 -> 繁體中文對照表 (完整句子優先；較長的詞條優先套用)
+QUEST_TERMS = {
+    # Specific Daily Overrides (High Priority - Full Sentence)
+    '捨てられた地の墓所で瞑想する': '在暮土的墓園裡冥想',
+    '捨てられた地の墓所にある焚火を訪れる': '前往暮土的墓園找到篝火',
+
+    # Vault Specific
+    '書庫で虹のキャンドルを見つける': '找到禁閣的彩虹蠟燭',
+    '書庫の4階で３つの光を捕まえる': '在禁閣上層捕捉四散的光', # Exact match for 9-bit text
+    '書庫の4階で光をつかまえる': '在禁閣上層捕捉四散的光', # Custom mapping for broken JP
+    '書庫で祈る侍者の記憶を呼び起こす': '重溫祈禱聖徒在禁閣的記憶',
+    '虹': '彩虹', # Explicitly adding it here since grep failed, but I will strip double later
+
+    # Additional broken terms observed in user screenshots
+    '虹のキャンドル': '彩虹蠟燭', 
+    '見つける': '找到',
+    '4階': '四樓', 
+    '祈る侍者': '祈禱聖徒',
+    '３つの': '3個', # Generic quantity fix
+
+    # Locations
+    '孤島': '晨島', '草原': '雲野', '雨林': '雨林', '峡谷': '霞谷', 
+    '捨てられた地': '暮土', '書庫': '禁閣',
+
+    # Meta
+    'クエスト': '任務', 'デイリー': '每日', 
+
+    # Spirits (Examples - need to be generic or extensive)
+    '採集者': '收集者', '光採取者': '光芒收集者', '採取者': '收集者',
+    '日光浴者': '日光浴者', 
+    '笑う': '偷笑', 'ダブルタッチ': '擊掌', 'くつろぐ': '放鬆',
+
+    # Common Terms
+    '精霊': '先祖', 'フレンド': '好友', 'プレイヤー': '玩家',
+    'キャンドル': '蠟燭', '星のキャンドル': '昇華蠟燭',
+    'シーズンキャンドル': '季節蠟燭',
+    '赤色の光': '紅光', '青色の光': '藍光', '水色の光': '青光', '緑色の光': '綠光', '紫色の光': '紫光', '橙色の光': '橙光',
+    '光の探求者': '光之探求者',
+
+    'ハイタッチ': '擊掌', 'ハグ': '擁抱', 'おんぶ': '背背', 'チャット': '聊天',
+    'ジェスチャー': '動作', '使用する': '使用',
+
+    # Specific Translation Updates
+    '雨林で光をつかまえる': '抓住雨林之光',
+    '光のキノコにエナジーを回復してもらう': '透過光菇重新恢復能量',
+    '雨林の雨が途切れる地で瞑想する': '在樹林高處冥想',
+    '雨が途切れる地': '樹林高處',
+    '大樹の案内人の食卓を整える': '整理大樹嚮導(歸屬季)的長桌',
+    '雨林の高台広場にある想いを編む先祖の食卓を片付ける': '在雨林的樹林高處整理歸屬季的先祖圓桌',
+    '高台広場': '樹林高處', 'にある': '在',
+    '想いを編む': '歸屬季的', '先祖の食卓': '先祖圓桌', 'を片付ける': '整理',
+    '食卓': '長桌/餐桌', '整える': '整理/打掃', 
+    'テーブル': '長桌',
+
+    # Valley Quests (Valley of Triumph) - User Match
+    # Specific Full Sentence Matches (User Standard)
+    # Valley (User Verified)
+    '峡谷を訪れしばしの間若木を愛でる': '欣賞一下霞谷小樹苗',
+    '峡谷で光をつかまえる': '抓住霞谷之光',
+    '峡谷で精霊の記憶を呼び起こす': '重溫一位霞谷先靈的記憶',
+
+    # Wasteland
+    '捨てられた地を訪れしばしの間若木を愛でる': '欣賞一下暮土小樹苗',
+    '捨てられた地で光をつかまえる': '抓住暮土之光',
+    '捨てられた地で精霊の記憶を呼び起こす': '重溫一位暮土先靈的記憶',
+    '墓場で精霊の記憶を呼び起こす': '重溫一位暮土先靈的記憶',
+
+    # Forest
+    '雨林を訪れしばしの間若木を愛でる': '欣賞一下雨林小樹苗',
+    '雨林で光をつかまえる': '抓住雨林之光',
+    '雨林で精霊の記憶を呼び起こす': '重溫一位雨林先靈的記憶',
+
+    # Prairie
+    '草原を訪れしばしの間若木を愛でる': '欣賞一下雲野小樹苗',
+    '草原で光をつかまえる': '抓住雲野之光',
+    '草原で精霊の記憶を呼び起こす': '重溫一位雲野先靈的記憶',
+
+    # Vault
+    '書庫を訪れしばしの間若木を愛でる': '欣賞一下禁閣小樹苗',
+    '書庫で光をつかまえる': '抓住禁閣之光',
+    '書庫で精霊の記憶を呼び起こす': '重溫一位禁閣先靈的記憶',
+
+    '精霊の記憶を呼び起こす': '重溫一位先靈的記憶', # Generic Fallback
+    '20本のキャンドルに火を灯す': '點亮 20 根蠟燭', 
+    'キャンドルに火を灯す': '點亮蠟燭',
+    '20本': '20根', 
+    '本': '根',
+
+    # General patterns
+    'エナジー': '能量', '回復する': '恢復', '回復': '恢復',
+    'してもらう': '', 'をつかまえる': '抓住',
+    '神殿': '神廟', '広場': '廣場', '参道': '參道',
+    '小川': '小溪', 'ツリーハウス': '樹屋', 
+    'する': '', # Remove generic "do" verb suffix
+
+    # Quest Types - Precise Mapping
+    '記憶を呼び起こすクエスト': '重溫先祖美好回憶', 
+    '記憶を呼び起こす': '重溫先祖美好回憶',
+    '追体験': '重溫先祖美好回憶',
+
+    '光をつかまえる': '抓住之光', 
+    '雨林の光': '雨林之光',
+    'の光をつかまえる': '之光',
+
+    '集める': '收集30滴燭火',
+    '灯りを': '點燃', '灯す': '點燃', 
+    '瞑想': '冥想', 
+    'スケーター': '滑冰者', 
+
+
+    # Spirits (Raw Debug Matches)
+    '笑う光採取者': '偷笑光芒收集者', 
+    'ダブルタッチの光採取者': '擊掌光芒收集者', 
+    'くつろぐ日光浴者': '放鬆日浴者',
+    '光採取者': '光芒收集者',
+
+    '若木': '花樹/幼苗', '愛でる': '賞花(在旁待60秒)',
+    '虹': '彩虹', '眺める': '觀賞',
+    'カニ': '螃蟹', '倒す': '掀翻5隻', '気絶': '掀翻',
+    '暗黒竜': '冥龍', '対峙': '面對', 
+    'マンタ': '遙鯤', '蝕む闇': '黑暗植物', '溶かす': '燒掉10株',
+    '光を捕まえる': '捕捉光芒',
+    'メッセージ': '留言', 'キャンドルボート': '紙船/蠟燭',
+    'ギフト': '禮物', '送る': '送出心火',
+    '鳥': '鳥',
+    '手をつなぐ': '牽手', 'グループ': '隊伍',
+    '精霊にかえる': '回歸天際 (向嚮導/先祖回報)',
+    '会う': '拜訪/見面', '訪れる': '找到', # Updated from visit to find for bonfire match
+    '座る': '坐下', 'ベンチ': '長椅', '交流': '交流',
+    'の': '的', 'で': '在', 'と': '和',
+
+    # New Mappings for 2026-01-06
+    '闇の蟹を持ち上げる': '抱起一隻暗蟹',
+    '墓所': '墓園',
+    '焚火': '篝火',
+    '闇の蟹': '暗蟹',
+    '持ち上げる': '抱起',
+
+    # Grammar Fixes
+    'を訪れる': '找到',
+    'にある': '位於',
+    'を': '' # Remove particle
+}
+
+# 套用優先順序與舊版逐詞 str.replace 相同：長的詞條優先 (同長度依 dict 順序)，
+# 即使它在字串中出現得比較晚。重複的 key 以最後一個值為準 (與 dict 行為相同)。
+_PRIORITY = {jp: rank for rank, jp in enumerate(sorted(QUEST_TERMS, key=len, reverse=True))}
+
+# 前綴樹：一次掃描即可找出所有 (可重疊的) 詞條出現位置
+_END = object()
+
+
+def _build_trie(terms):
+    root = {}
+    for jp in terms:
+        node = root
+        for ch in jp:
+            node = node.setdefault(ch, {})
+        node[_END] = jp
+    return root
+
+
+_TRIE = _build_trie(QUEST_TERMS)
+
+# 替換後的清理 (依序套用)
+_CLEANUPS = (
+    ('在在', '在'), ('的在', '在'), ('任務任務', '任務'),
+    ('重溫美好回憶先祖', '重溫先祖美好回憶'), ('重溫先祖美好回憶任務', '重溫先祖美好回憶'),
+    # Post-Processing Cleanup for Overlaps
+    ('彩彩虹', '彩虹'),
+)
+
+
+def _find_matches(text):
+    """
+    回傳所有詞條出現位置 [(priority, start, end, jp), ...]。
+    """
+    matches = []
+    append = matches.append
+    root = _TRIE
+    n = len(text)
+    for i, ch in enumerate(text):
+        node = root.get(ch)
+        j = i + 1
+        while node is not None:
+            jp = node.get(_END)
+            if jp is not None:
+                append((_PRIORITY[jp], i, j, jp))
+            if j >= n:
+                break
+            node = node.get(text[j])
+            j += 1
+    return matches
+
+
+def translate_quest(text):
+    """
+    Translates Japanese Sky quests to Traditional Chinese.
+    """
+    # Specific overrides first
+    if "30個" in text and "集める" in text:
+        return "收集 30 滴燭火"
+
+    # 依優先順序選出互不重疊的詞條 (等同舊版依序整串替換的結果)，再一次組合輸出
+    matches = _find_matches(text)
+    if matches:
+        matches.sort()
+        taken = bytearray(len(text))
+        selected = []
+        for _, start, end, jp in matches:
+            if not any(taken[start:end]):
+                taken[start:end] = b"\x01" * (end - start)
+                selected.append((start, end, jp))
+        selected.sort()
+
+        parts = []
+        pos = 0
+        for start, end, jp in selected:
+            parts.append(text[pos:start])
+            parts.append(QUEST_TERMS[jp])
+            pos = end
+        parts.append(text[pos:])
+        text = "".join(parts)
+
+    for old, new in _CLEANUPS:
+        text = text.replace(old, new)
+    return text
+
+
+def _rules_version():
+    # 對照表或清理規則變動時改變，用來判斷翻譯記憶中未審核的項目是否過期
+    payload = repr((sorted(QUEST_TERMS.items()), _CLEANUPS)).encode("utf-8")
+    return hashlib.sha1(payload).hexdigest()[:12]
+
+
+RULES_VERSION = _rules_version()
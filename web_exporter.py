@@ -1,6 +1,12 @@
+import json
 import os
 import re
-from datetime import datetime
+
+import artifacts
+import clock_pred
+import config
+import shard_pred
+import static_assets
 
 def parse_countdown_to_seconds(countdown_str):
     """
@@ -25,18 +31,59 @@ def parse_countdown_to_seconds(countdown_str):
     except:
         return 0
 
-def generate_dashboard(shards, dailies, clock, quests=None):
+# 卡片圖片的顯示寬度：手機全寬，桌面版約為卡片欄寬
+IMG_SIZES = "(max-width: 760px) 100vw, 420px"
+
+def build_img_tag(src, variants=None, sizes=IMG_SIZES, extra_class=""):
     """
-    生成高美感 HTML 儀表板。
+    產生延遲載入的圖片標籤。
+    有 image_opt 產生的版本時輸出 <picture> (WebP srcset + JPEG 後備)，點擊才開啟原圖。
+    """
+    cls = f' class="{extra_class}"' if extra_class else ""
+    if not variants:
+        return f'<img src="{src}"{cls} loading="lazy" decoding="async" data-full="{src}" onclick="openModal(this.dataset.full)">'
+
+    webp_srcset = ", ".join(f"{path} {w}w" for path, w in variants['webp'])
+    jpeg_path, jpeg_w = variants['jpeg']
+    height = round(variants['height'] * jpeg_w / variants['width']) if variants.get('width') else ""
+    return (
+        f'<picture>'
+        f'<source type="image/webp" srcset="{webp_srcset}" sizes="{sizes}">'
+        f'<img src="{jpeg_path}" srcset="{jpeg_path} {jpeg_w}w" sizes="{sizes}"{cls} width="{jpeg_w}" height="{height}" '
+        f'loading="lazy" decoding="async" data-full="{variants["full"]}" onclick="openModal(this.dataset.full)">'
+        f'</picture>'
+    )
+
+def stale_badge(stored_at):
+    """
+    以舊快照替代的卡片標示；只輸出快照時間 (stored_at, epoch 秒)，
+    「舊資料 · 5 小時前」由頁面 JS 計算，同一份快照每次建置的輸出都相同。
+    """
+    if stored_at is None:
+        return ""
+    return (f'<span class="badge stale" data-stored-at="{int(stored_at)}" '
+            f'title="來源暫時無法取得，顯示上次成功的資料">舊資料</span>')
+
+def shard_time_range(shards):
+    """
+    整天的爆發區間 (首場開始 ~ 末場結束)；「目前 / 下一場」會隨建置時間改變，交給 JS 顯示。
+    """
+    eruptions = shards.get('eruptions', [])
+    if not eruptions:
+        return shards.get('time_range')
+    return f"{eruptions[0].split('-')[0].strip()} - {eruptions[-1].split('-')[-1].strip()}"
+
+def render_shard_card(shards):
+    """
+    碎石卡片 (Shards)。
     """
-    
-    # 1. 準備資料
-    
     # Shards (碎石)
     shard_html = ""
     if shards:
-        img_html = f'<img src="{shards["image_url"]}" onclick="openModal(this.src)" class="shard-img">' if shards.get('image_url') else ""
-        eruptions_html = "".join([f'<span class="tag">{t}</span>' for t in shards.get('eruptions', [])])
+        img_html = build_img_tag(shards["image_url"], extra_class="shard-img") if shards.get('image_url') else ""
+        eruptions = shards.get('eruptions', [])
+        eruptions_html = "".join([f'<span class="tag">{t}</span>' for t in eruptions])
+        time_range = shard_time_range(shards)
         shard_html = f'''
         <div class="card">
             <div class="card-header">
@@ -49,8 +96,8 @@ def generate_dashboard(shards, dailies, clock, quests=None):
                 <div class="info-row highlight-row"><strong>日期：</strong> {shards.get('dateText', '')}</div>
                 <div class="info-row"><strong>地圖：</strong> {shards.get('map')}</div>
                 <div class="info-row"><strong>獎勵：</strong> <span class="rewards-text">{shards.get('rewards') if shards.get('rewards') else '未知 / Unknown'}</span></div>
-                <div class="info-row"><strong>時間：</strong> {shards.get('time_range')}</div>
-                <div class="info-row"><strong>狀態：</strong> {shards.get('remaining', '')}</div>
+                <div class="info-row"><strong>時間：</strong> {time_range}</div>
+                <div class="info-row" id="shard-status"><strong>狀態：</strong> <span class="shard-status-dynamic">計算中...</span></div>
                 <div class="eruptions-list">
                     <strong>爆發時間 (24H)：</strong>
                     <div class="tags">{eruptions_html}</div>
@@ -62,6 +109,12 @@ def generate_dashboard(shards, dailies, clock, quests=None):
     else:
         shard_html = '<div class="card error">無法獲取碎石資訊</div>'
 
+    return shard_html
+
+def render_quest_card(quests, stale_since=None):
+    """
+    每日任務卡片 (Quests)；stale_since 為以舊快照替代時的快照時間 (epoch 秒)。
+    """
     # Quests (每日任務)
     quest_html = ""
     if quests:
@@ -70,6 +123,7 @@ def generate_dashboard(shards, dailies, clock, quests=None):
         <div class="card">
             <div class="card-header">
                 <h2>每日任務 (Quests)</h2>
+                {stale_badge(stale_since)}
             </div>
             <div class="card-body">
                 <div class="quest-list">{items_html}</div>
@@ -79,80 +133,90 @@ def generate_dashboard(shards, dailies, clock, quests=None):
     else:
         quest_html = '<div class="card error">無法獲取每日任務</div>'
 
-    # Candles Helper (蠟燭助手)
-    def build_candle_card(title, data, is_seasonal=False):
-        if not data: return f'<div class="card error">無法獲取{title}資訊</div>'
-        
-        realm = data.get('realm', '未知')
-        rot = data.get('rotation', '')
-        header_sub = f"{realm} | {rot}" if rot else realm
-        
-        descs = data.get('descriptions', [])
-        imgs = data.get('images', [])
-        
-        # HTML 自適應佈局邏輯
-        is_paired = len(descs) > 0 and len(imgs) == len(descs)
-        
-        content_html = ""
-        
-        if is_paired:
-            content_html += '<div class="pair-grid">'
-            for i in range(len(descs)):
-                img_src = imgs[i] if i < len(imgs) else ""
-                img_tag = f'<img src="{img_src}" onclick="openModal(this.src)">' if img_src else ""
-                content_html += f'''
-                <div class="pair-item">
-                    <div class="desc"><span class="num">{i+1}</span> {descs[i]}</div>
-                    {img_tag}
-                </div>
-                '''
-            content_html += '</div>'
-        else:
-            # 列表描述
-            content_html += '<div class="desc-list">'
-            for i, txt in enumerate(descs):
-                content_html += f'<div class="desc"><span class="num">{i+1}</span> {txt}</div>'
-            content_html += '</div>'
-            
-            # 列表圖片
-            content_html += '<div class="img-grid">'
-            for url in imgs:
-                 content_html += f'<img src="{url}" onclick="openModal(this.src)">'
-            content_html += '</div>'
+    return quest_html
 
-        return f'''
-        <div class="card">
-            <div class="card-header">
-                <h2>{title}</h2>
-                <span class="subtitle">{header_sub}</span>
-            </div>
-            <div class="card-body scrollable">
-                {content_html}
+def render_candle_card(title, data, stale_since=None, is_seasonal=False):
+    """
+    蠟燭卡片 (大蠟燭 / 季節蠟燭)：說明與圖片成對時以格狀排列，否則分開列出。
+    """
+    if not data: return f'<div class="card error">無法獲取{title}資訊</div>'
+
+    realm = data.get('realm', '未知')
+    rot = data.get('rotation', '')
+    header_sub = f"{realm} | {rot}" if rot else realm
+    badge = stale_badge(stale_since if stale_since is not None else data.get('stale'))
+
+    descs = data.get('descriptions', [])
+    imgs = data.get('images', [])
+    variants = data.get('variants', {})
+
+    # HTML 自適應佈局邏輯
+    is_paired = len(descs) > 0 and len(imgs) == len(descs)
+
+    content_html = ""
+
+    if is_paired:
+        content_html += '<div class="pair-grid">'
+        for i in range(len(descs)):
+            img_src = imgs[i] if i < len(imgs) else ""
+            img_tag = build_img_tag(img_src, variants.get(img_src)) if img_src else ""
+            content_html += f'''
+            <div class="pair-item">
+                <div class="desc"><span class="num">{i+1}</span> {descs[i]}</div>
+                {img_tag}
             </div>
+            '''
+        content_html += '</div>'
+    else:
+        # 列表描述
+        content_html += '<div class="desc-list">'
+        for i, txt in enumerate(descs):
+            content_html += f'<div class="desc"><span class="num">{i+1}</span> {txt}</div>'
+        content_html += '</div>'
+
+        # 列表圖片
+        content_html += '<div class="img-grid">'
+        for url in imgs:
+             content_html += build_img_tag(url, variants.get(url))
+        content_html += '</div>'
+
+    return f'''
+    <div class="card">
+        <div class="card-header">
+            <h2>{title}</h2>
+            <span class="subtitle">{header_sub}</span>
+            {badge}
         </div>
-        '''
+        <div class="card-body scrollable">
+            {content_html}
+        </div>
+    </div>
+    '''
 
-    treasure_html = build_candle_card("大蠟燭 (Treasure)", dailies.get('treasure', {}))
-    seasonal_html = build_candle_card("季節蠟燭 (Seasonal)", dailies.get('seasonal', {}), is_seasonal=True)
+# 時鐘卡片的事件 (key, 顯示名稱)；順序即卡片中的順序
+CLOCK_EVENTS = [
+    ("geyser", "噴泉 (Geyser)"),
+    ("grandma", "奶奶 (Grandma)"),
+    ("turtle", "海龜 (Turtle)"),
+]
 
+def render_clock_card(clock):
+    """
+    事件時鐘卡片 (Events)；倒數由頁面 JS 更新。
+    """
     # Clock (時鐘)
     clock_html = ""
     if clock:
         def build_event_row(key, name):
             if key not in clock: return ""
-            info = clock[key]
-            secs = parse_countdown_to_seconds(info.get('countdown', ''))
-            
-            # 活躍判定邏輯 (參考 gui.py / JS)
-            # 若倒數大於 1小時50分 (6600秒)，視為上一輪剛開始 -> 活躍中
-            
+
             status_class = "waiting"
-            # 這裡的文字會被 JS 覆蓋，但給個初始值
-            
+            # 這裡的文字會被 JS 覆蓋；不輸出建置當下的時間與倒數，頁面內容才會只隨資料改變
+
             return f'''
-            <div class="event-row" id="event-{key}" data-seconds="{secs}">
+            <div class="event-row" id="event-{key}">
                 <div class="event-name">{name}</div>
-                <div class="event-time">下次: {info.get('next')}</div>
+                <div class="event-time">下次: --:--</div>
                 <div class="event-countdown">--:--:--</div>
                 <div class="event-status tag {status_class}">計算中...</div>
             </div>
@@ -164,22 +228,24 @@ def generate_dashboard(shards, dailies, clock, quests=None):
                 <h2>每日事件時鐘 (Events)</h2>
             </div>
             <div class="card-body">
-                {build_event_row('geyser', '噴泉 (Geyser)')}
-                {build_event_row('grandma', '奶奶 (Grandma)')}
-                {build_event_row('turtle', '海龜 (Turtle)')}
+                {"".join(build_event_row(key, name) for key, name in CLOCK_EVENTS)}
             </div>
         </div>
         '''
     else:
         clock_html = '<div class="card error">無法獲取時鐘資訊</div>'
 
+    return clock_html
 
+def build_shard_times(shards):
+    """
+    碎石爆發時間轉為 JS 使用的 24 小時制 "HH:MM-HH:MM" 清單 (JSON 字串)。
+    """
     # Inject Shard Data for JS
     shard_times_json = "[]"
     if shards and 'eruptions' in shards:
         # CONVERT CHINESE TIME TO 24H HH:MM FOR JS
         # format: "下午07:38:40 - 下午11:30:00"
-        import json
         clean_times = []
         for t_range in shards.get('eruptions', []):
             try:
@@ -205,6 +271,94 @@ def generate_dashboard(shards, dailies, clock, quests=None):
         
         shard_times_json = json.dumps(clean_times)
 
+    return shard_times_json
+
+# 每個資料來源影響的卡片 (daemon 只重畫有更新的來源)
+CARD_SOURCES = {
+    "shards": ["shards"],
+    "dailies": ["quests", "treasure", "seasonal"],
+    "clock": ["clock"],
+}
+
+def render_source_cards(source, data, stale_since=None):
+    """
+    重新產生單一來源的卡片 HTML，回傳 {卡片名稱: html}。
+    dailies 的 data 為 (quests, dailies)。
+    """
+    if source == "shards":
+        return {"shards": render_shard_card(data)}
+    if source == "dailies":
+        quests, dailies = data
+        dailies = dailies or {}
+        return {
+            "quests": render_quest_card(quests, stale_since),
+            "treasure": render_candle_card("大蠟燭 (Treasure)", dailies.get('treasure', {}), stale_since),
+            "seasonal": render_candle_card("季節蠟燭 (Seasonal)", dailies.get('seasonal', {}), stale_since, is_seasonal=True),
+        }
+    if source == "clock":
+        return {"clock": render_clock_card(data)}
+    raise ValueError(f"Unknown source: {source}")
+
+def render_cards(shards, dailies, clock, quests=None, stale=None):
+    """
+    產生所有卡片 HTML。stale: {來源名稱: 快照時間 (epoch 秒)}。
+    """
+    stale = stale or {}
+    cards = {}
+    cards.update(render_source_cards("shards", shards, stale.get("shards")))
+    cards.update(render_source_cards("dailies", (quests, dailies), stale.get("dailies")))
+    cards.update(render_source_cards("clock", clock, stale.get("clock")))
+    return cards
+
+# data.json 格式版本 (頁面 JS 只接受相同版本)
+DATA_VERSION = 1
+
+def build_data(shards, dailies, clock, quests=None, stale=None, sky_date=None):
+    """
+    data.json 的內容：卡片所需的原始資料 (不含建置時間)，由頁面 JS 輪詢並在瀏覽器端重畫卡片。
+    revision 為內容雜湊，頁面以此判斷是否有新資料。
+    """
+    sky_date = sky_date or shard_pred.sky_today()
+    dailies = dailies or {}
+    data = {
+        "version": DATA_VERSION,
+        "sky_date": sky_date.isoformat(),
+        "shard_times": json.loads(build_shard_times(shards)),
+        "shards": {**{k: shards.get(k) for k in ("type", "dateText", "map", "rewards", "eruptions", "image_url")},
+                   "time_range": shard_time_range(shards)} if shards else None,
+        "quests": quests or [],
+        "treasure": dailies.get('treasure') or None,
+        "seasonal": dailies.get('seasonal') or None,
+        "clock": [key for key, _ in CLOCK_EVENTS if key in (clock or {})],
+        "stale": {name: int(stored_at) for name, stored_at in sorted((stale or {}).items()) if stored_at is not None},
+    }
+    data = json.loads(json.dumps(data, ensure_ascii=False))  # tuple -> list，與讀回的 JSON 一致
+    data["revision"] = artifacts.digest(json.dumps(data, ensure_ascii=False, sort_keys=True))[:16]
+    return data
+
+def render_page(cards, shard_times_json="[]", assets=None, sky_date=None, revision=None, data_etag=None):
+    """
+    將卡片組成完整頁面。樣式與 JS 為內容雜湊命名的靜態檔 (static_assets.build_assets)，
+    頁面本身只包含卡片與每日資料 (page-data JSON)。
+    輸出只取決於輸入資料與 Sky 日期 (不含建置時間)，資料沒變時頁面逐位元組相同。
+    revision 為對應 data.json 的版本；頁面之後輪詢 data.json，有新版本時在瀏覽器端重畫卡片。
+    data_etag 為同一份 data.json 的 ETag，作為第一次輪詢的 If-None-Match。
+    """
+    if assets is None:
+        assets = static_assets.build_assets()
+    sky_date = sky_date or shard_pred.sky_today()
+
+    # Per-build data for app.js: shard eruption times & Sky timezone (America/Los_Angeles) DST transitions
+    page_data = json.dumps({
+        "shard_times": json.loads(shard_times_json),
+        "sky_tz": clock_pred.transition_table(sky_date.year - 1, sky_date.year + 1),
+        "sky_date": sky_date.isoformat(),
+        "revision": revision,
+        "data_etag": data_etag,
+        "data_url": config.DATA_PATH,
+        "poll_seconds": config.DATA_POLL_SECONDS,
+    }, ensure_ascii=False, sort_keys=True).replace("</", "<\\/")
+
     # HTML Template
     html_content = f"""<!DOCTYPE html>
 <html lang="zh-TW">
@@ -212,182 +366,29 @@ def generate_dashboard(shards, dailies, clock, quests=None):
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Sky: Children of the Light Daily Dashboard</title>
-    <style>
-        @import url('https://fonts.googleapis.com/css2?family=Noto+Sans+TC:wght@400;500;700&family=Outfit:wght@400;600&display=swap');
-        
-        :root {{
-            --bg-color: #121418;
-            --card-bg: #1e2229;
-            --primary: #5c9aff;
-            --accent: #ffcc00;
-            --text-main: #e0e0e0;
-            --text-sub: #a0a0a0;
-            --border: #2a2f3a;
-        }}
-
-        body {{
-            font-family: 'Outfit', 'Noto Sans TC', sans-serif;
-            background-color: var(--bg-color);
-            color: var(--text-main);
-            margin: 0;
-            padding: 20px;
-            overflow-x: hidden;
-        }}
-        
-        .quest-list .quest-item {{
-            padding: 8px 0;
-            border-bottom: 1px solid var(--border);
-            font-size: 1.1em;
-        }}
-        .quest-list .quest-item:last-child {{ border-bottom: none; }}
-        .quest-item .num {{ 
-            color: var(--accent); 
-            font-weight: bold; 
-            margin-right: 10px;
-        }}
-        
-        .highlight-row {{ 
-            background: rgba(255, 255, 255, 0.05); 
-            padding: 5px 10px;
-            border-radius: 4px;
-            margin-bottom: 5px;
-        }}
-        .rewards-text {{ color: #ffd700; }}
-
-        h1, h2, h3 {{ margin: 0; }}
-
-        .header {{
-            text-align: center;
-            margin-bottom: 30px;
-            padding: 20px 0;
-            border-bottom: 2px solid var(--border);
-        }}
-        
-        .header h1 {{
-            font-size: 2rem;
-            background: linear-gradient(90deg, #fff, var(--primary));
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            margin-bottom: 10px;
-        }}
-        
-        .timestamp {{ color: var(--text-sub); font-size: 0.9rem; }}
-
-        .grid-container {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(350px, 1fr));
-            gap: 20px;
-            max_width: 1600px;
-            margin: 0 auto;
-            align-items: start;
-        }}
-
-        /* Card Styles */
-        .card {{
-            background: var(--card-bg);
-            border-radius: 16px;
-            box-shadow: 0 8px 24px rgba(0,0,0,0.2);
-            overflow: hidden;
-            display: flex;
-            flex-direction: column;
-            border: 1px solid var(--border);
-            transition: transform 0.2s;
-        }}
-        
-        .card:hover {{ transform: translateY(-5px); border-color: var(--primary); }}
-
-        .card-header {{
-            padding: 15px 20px;
-            background: rgba(0,0,0,0.2);
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            border-bottom: 1px solid var(--border);
-        }}
-        
-        .card-header h2 {{ font-size: 1.2rem; display: flex; align-items: center; gap: 10px; }}
-        .badge {{ font-size: 0.75rem; padding: 2px 8px; border-radius: 12px; background: var(--primary); color: #fff; }}
-        .badge.Red {{ background: #ff4757; }}
-        .badge.Black {{ background: #2f3542; }}
-        .subtitle {{ font-size: 0.9rem; color: var(--accent); }}
-
-        .card-body {{ padding: 20px; flex: 1; }}
-        .scrollable {{ max-height: 800px; overflow-y: auto; }}
-
-        /* Shards */
-        .info-row {{ margin-bottom: 8px; }}
-        .tags {{ display: flex; flex-wrap: wrap; gap: 5px; margin-top: 5px; }}
-        .tag {{ background: #333; padding: 2px 8px; border-radius: 4px; font-size: 0.85rem; color: #ccc; }}
-        .shard-img {{ width: 100%; border-radius: 8px; margin-top: 15px; cursor: pointer; transition: opacity 0.2s; }}
-        .shard-img:hover {{ opacity: 0.9; }}
-        .shard-status-dynamic {{ font-weight: bold; color: var(--accent); }}
-
-        /* Candles */
-        .pair-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px; }}
-        .pair-item {{ padding: 10px; background: rgba(255,255,255,0.03); border-radius: 8px; border: 1px solid rgba(255,255,255,0.05); }}
-        .desc {{ margin-bottom: 10px; line-height: 1.5; font-size: 0.95rem; }}
-        .num {{ color: var(--accent); font-weight: bold; margin-right: 5px; }}
-        .pair-item img {{ width: 100%; border-radius: 8px; cursor: pointer; aspect-ratio: 16/9; object-fit: cover; }}
-        
-        .desc-list {{ margin-bottom: 20px; }}
-        .img-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 10px; }}
-        .img-grid img {{ width: 100%; border-radius: 8px; cursor: pointer; transition: transform 0.2s; }}
-        .img-grid img:hover {{ transform: scale(1.02); }}
-
-        /* Clock */
-        .event-row {{
-            background: rgba(255,255,255,0.05);
-            margin-bottom: 10px;
-            padding: 15px;
-            border-radius: 8px;
-            display: grid;
-            grid-template-columns: 1fr auto;
-            grid-template-rows: auto auto auto;
-            gap: 5px;
-        }}
-        .event-name {{ font-weight: bold; font-size: 1.1rem; grid-column: 1 / -1; }}
-        .event-time {{ color: var(--text-sub); }}
-        .event-countdown {{ color: var(--primary); font-family: monospace; font-size: 1.2rem; font-weight: bold; text-align: right; }}
-        .event-status {{ grid-column: 1 / -1; margin-top: 5px; text-align: center; background: #2a2f3a; }}
-        .event-status.active {{ background: #2ed573; color: #fff; }}
-        .event-status.waiting {{ background: #ffa502; color: #fff; }}
-
-        /* Modal */
-        .modal {{
-            display: none; position: fixed; z-index: 1000; left: 0; top: 0; width: 100%; height: 100%;
-            background-color: rgba(0,0,0,0.9); align-items: center; justify-content: center;
-        }}
-        .modal img {{ max-width: 90%; max-height: 90%; border-radius: 8px; box-shadow: 0 0 20px rgba(255,255,255,0.1); }}
-        .close {{ position: absolute; top: 20px; right: 35px; color: #f1f1f1; font-size: 40px; font-weight: bold; cursor: pointer; }}
-
-        /* Scrollbar */
-        ::-webkit-scrollbar {{ width: 8px; }}
-        ::-webkit-scrollbar-track {{ background: #1a1a1a; }}
-        ::-webkit-scrollbar-thumb {{ background: #444; border-radius: 4px; }}
-        ::-webkit-scrollbar-thumb:hover {{ background: #555; }}
-    </style>
+    <link rel="stylesheet" href="{assets['app.css']}">
 </head>
 <body>
 
     <div class="header">
         <h1>Sky: Children of the Light</h1>
-        <div class="timestamp">更新時間 (Updated)：{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</div>
+        <div class="timestamp">資料日期 (Sky date)：<span id="sky-date">{sky_date.isoformat()}</span></div>
     </div>
 
     <div class="grid-container">
         <!-- Column 1: Quests & Shards (Swapped) -->
         <div class="column-wrapper" style="display:flex; flex-direction:column; gap:20px;">
-            {quest_html}
-            {shard_html}
+            <div class="card-slot" id="slot-quests">{cards['quests']}</div>
+            <div class="card-slot" id="slot-shards">{cards['shards']}</div>
         </div>
         
         <!-- Column 2: Treasures -->
-        {treasure_html}
+        <div class="card-slot" id="slot-treasure">{cards['treasure']}</div>
         
         <!-- Column 3: Seasonal & Clock -->
         <div class="column-wrapper" style="display:flex; flex-direction:column; gap:20px;">
-            {seasonal_html}
-            {clock_html}
+            <div class="card-slot" id="slot-seasonal">{cards['seasonal']}</div>
+            <div class="card-slot" id="slot-clock">{cards['clock']}</div>
         </div>
     </div>
 
@@ -397,208 +398,37 @@ def generate_dashboard(shards, dailies, clock, quests=None):
         <img id="modalImg">
     </div>
 
-    <script>
-        // Data injected from Python
-        const SHARD_TIMES = {shard_times_json};
+    <script id="page-data" type="application/json">{page_data}</script>
+    <script src="{assets['app.js']}" defer></script>
+</body>
+</html>
+    """
 
-        // Modal
-        function openModal(src) {{
-            document.getElementById('imgModal').style.display = "flex";
-            document.getElementById('modalImg').src = src;
-        }}
+    return html_content
 
-        // --- SHARD LOGIC ---
-        function updateShardStatus() {{
-            const rows = document.querySelectorAll('.card-body .info-row');
-            let statusRow = null;
-            rows.forEach(r => {{
-                if (r.textContent.includes("狀態：")) statusRow = r;
-            }});
+def generate_dashboard(shards, dailies, clock, quests=None, stale=None, path="dashboard.html"):
+    """
+    生成高美感 HTML 儀表板。
+    stale: {來源名稱: 快照時間 (epoch 秒)}，這些來源的卡片會標示為舊資料。
+    同目錄另外輸出 data.json (頁面輪詢用)。
+    內容與現有檔案相同時不寫入，有寫入時同時輸出 .gz / .br。回傳 (絕對路徑, 是否有寫入)。
+    """
+    out_dir = os.path.dirname(path) or "."
+    data = build_data(shards, dailies, clock, quests, stale)
+    write_data(os.path.join(out_dir, config.DATA_PATH), data)
 
-            if (!statusRow || SHARD_TIMES.length === 0) return;
+    cards = render_cards(shards, dailies, clock, quests, stale)
+    html_content = render_page(cards, build_shard_times(shards), static_assets.build_assets(out_dir),
+                               revision=data["revision"], data_etag=data_etag(data))
 
-            const now = new Date();
-            let msg = "今日所有爆發已結束";
-            
-            // 1. Parse all times into objects
-            // We'll create simple objects: {{ start: Date, end: Date, str: "HH:MM-HH:MM" }}
-            const events = SHARD_TIMES.map(range => {{
-                const parts = range.split('-');
-                if (parts.length < 2) return null;
-                
-                const [h1, m1] = parts[0].trim().split(':').map(Number);
-                const [h2, m2] = parts[1].trim().split(':').map(Number);
-                
-                const s = new Date(now); s.setHours(h1, m1, 0, 0);
-                const e = new Date(now); e.setHours(h2, m2, 0, 0);
-                
-                // Handle overnight crossing (e.g. 23:00 - 01:00)
-                if (e < s) e.setDate(e.getDate() + 1);
-                
-                return {{ start: s, end: e }};
-            }}).filter(e => e !== null);
-            
-            // 2. Sort by Start Time
-            events.sort((a, b) => a.start - b.start);
-            
-            // 3. Find Active or Next
-            let targetEvent = null;
-            let type = "none"; // active, waiting
-            
-            for (let ev of events) {{
-                if (now >= ev.start && now < ev.end) {{
-                    targetEvent = ev;
-                    type = "active";
-                    break;
-                }}
-                if (now < ev.start) {{
-                    targetEvent = ev;
-                    type = "waiting";
-                    break;
-                }}
-            }}
-            
-            // 4. If nothing found (all passed today), loop to First event of Tomorrow
-            if (!targetEvent && events.length > 0) {{
-                targetEvent = {{ ...events[0] }}; // Clone
-                targetEvent.start.setDate(targetEvent.start.getDate() + 1);
-                targetEvent.end.setDate(targetEvent.end.getDate() + 1);
-                type = "waiting";
-            }}
-
-            // 5. Generate Message
-            if (targetEvent) {{
-                if (type === "active") {{
-                    const diff = (targetEvent.end - now) / 1000;
-                    const dM = Math.floor(diff / 60);
-                    const dS = Math.floor(diff % 60);
-                    msg = `進行中! (距離結束: ${{dM}}分 ${{dS}}秒)`;
-                }} else if (type === "waiting") {{
-                     const diff = (targetEvent.start - now) / 1000;
-                     const dH = Math.floor(diff / 3600);
-                     const dM = Math.floor((diff % 3600) / 60);
-                     const dS = Math.floor(diff % 60);
-                     
-                     // Helper: Check if it's tomorrow
-                     const isTom = targetEvent.start.getDate() !== now.getDate();
-                     const prefix = isTom ? "等待中 (明天):" : "等待中:";
-                     msg = `${{prefix}} ${{dH}}小時 ${{dM}}分 ${{dS}}秒`;
-                }}
-            }}
-
-            statusRow.innerHTML = `<strong>狀態：</strong> <span class="shard-status-dynamic">${{msg}}</span>`;
-        }}
-
-
-        // --- CLOCK LOGIC ---
-        function isDST(date) {{
-            const year = date.getFullYear();
-            let march = new Date(year, 2, 1); // March 1
-            while (march.getDay() !== 0) march.setDate(march.getDate() + 1);
-            const dstStart = new Date(year, 2, march.getDate() + 7); // 2nd Sunday
-
-            // DST Ends 1st Sunday in Nov
-            let nov = new Date(year, 10, 1); // Nov 1
-            while (nov.getDay() !== 0) nov.setDate(nov.getDate() + 1);
-            const dstEnd = nov; // 1st Sunday
-
-            // Reset time to midnight for comparison
-            const today = new Date(date).setHours(0,0,0,0);
-            return today >= dstStart.setHours(0,0,0,0) && today < dstEnd.setHours(0,0,0,0);
-        }}
-
-        const EVENTS = {{
-            'geyser': {{ min: 5, duration: 10 }},
-            'grandma': {{ min: 35, duration: 10 }},
-            'turtle': {{ min: 50, duration: 10 }}
-        }};
-
-        function updateClock() {{
-            const now = new Date();
-            const dst = isDST(now);
-            const startOffset = dst ? 1 : 0; // Summer: Odd (1,3..), Winter: Even (0,2..)
-
-            for (const [key, info] of Object.entries(EVENTS)) {{
-                const row = document.getElementById('event-'+key);
-                if (!row) continue;
-
-                // Find next/current event
-                let foundNext = null;
-                let isActive = false;
-                let remainingActive = 0;
-
-                // Check upcoming 24 hours
-                for (let i = 0; i < 24; i++) {{
-                    let target = new Date(now);
-                    target.setHours(now.getHours() + i);
-                    target.setMinutes(info.min);
-                    target.setSeconds(0);
-                    
-                    // Check if target hour matches cycle
-                    if ((target.getHours() % 2) !== startOffset) continue;
+    changed = artifacts.publish(path, html_content)
+    return os.path.abspath(path), changed
 
-                    // If target is in the past, it might be ACTIVE
-                    // Active range: target <= now < target + 10m
-                    const endTime = new Date(target.getTime() + info.duration * 60000);
-                    
-                    if (now >= target && now < endTime) {{
-                        isActive = true;
-                        remainingActive = (endTime - now) / 1000; // seconds
-                        foundNext = target; // It's this one
-                        break;
-                    }}
-
-                    // If target is in future
-                    if (target > now) {{
-                        foundNext = target;
-                        break;
-                    }}
-                }}
-
-                if (foundNext) {{
-                    const statusDiv = row.querySelector('.event-status');
-                    const cdDiv = row.querySelector('.event-countdown');
-                    const timeDiv = row.querySelector('.event-time');
-
-                    // Format Next Time
-                    const hStr = foundNext.getHours().toString().padStart(2, '0');
-                    const mStr = foundNext.getMinutes().toString().padStart(2, '0');
-                    timeDiv.textContent = `下次: ${{hStr}}:${{mStr}}`;
-
-                    if (isActive) {{
-                        const rMin = Math.floor(remainingActive / 60);
-                        const rSec = Math.floor(remainingActive % 60);
-                        statusDiv.textContent = `進行中 (剩餘 ${{rMin}}分 ${{rSec}}秒)`;
-                        statusDiv.className = "event-status tag active";
-                        cdDiv.textContent = ""; 
-                    }} else {{
-                        // Countdown
-                        const diff = (foundNext - now) / 1000;
-                        const dH = Math.floor(diff / 3600);
-                        const dM = Math.floor((diff % 3600) / 60);
-                        const dS = Math.floor(diff % 60);
-                        
-                        statusDiv.textContent = "等待中";
-                        statusDiv.className = "event-status tag waiting";
-                        cdDiv.textContent = `${{dH}}小時 ${{dM}}分 ${{dS}}秒`;
-                    }}
-                }}
-            }}
-        }}
-
-        function loop() {{
-            updateClock();
-            updateShardStatus();
-        }}
-
-        setInterval(loop, 1000);
-        loop(); // Init
-    </script>
-</body>
-</html>
-    """
-    
-    with open("dashboard.html", "w", encoding="utf-8") as f:
-        f.write(html_content)
+def encode_data(data):
+    return json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+def data_etag(data):
+    return artifacts.etag(artifacts.digest(encode_data(data)))
 
-    return os.path.abspath("dashboard.html")
+def write_data(path, data):
+    return artifacts.publish(path, encode_data(data))